@@ -1,2 +1,3 @@
 from .core import azLLM
-from .configmanager import azLLMConfigs
\ No newline at end of file
+from .configmanager import azLLMConfigs
+from .conversation import Conversation
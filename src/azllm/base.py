@@ -1,15 +1,637 @@
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .breaker import CircuitOpenError, Permit, get_circuit_breaker
+from .cache import cached_call, acached_call, make_cache_key
+from .concurrency import bounded_map, abounded_gather
+from .metrics import CallTracker, metrics_key, registry
+from .ratelimit import get_rate_limiter
+from .retry import RetryPolicy
+from .singleflight import unique_requests
+from .streaming import TextStream, AsyncTextStream
+from .utils import STRUCTURED_OUTPUT_MODES, STRUCTURED_OUTPUT_REPAIRS, StructuredOutput, with_cache_breakpoint
+
+
+structuredoutput = StructuredOutput()
+
+
+class UNIClient(ABC):
+    """
+    Shared request pipeline of the clients for OpenAI-compatible chat completions APIs.
+
+    It resolves the model configuration, builds requests, and sends them through the rate limiter,
+    retry policy, metrics and response cache, synchronously or asynchronously, single or batched,
+    and streamed or not. A provider subclass only declares its identity and capabilities as class
+    attributes and creates its SDK clients:
+
+    Attributes:
+        name (str): Provider name; prefixes rate-limiter, metrics and cache keys (e.g. 'openai').
+        display_name (str): Provider name used in error messages (e.g. 'OpenAI').
+        api_key_env (str): Environment variable holding the API key.
+        default_config (dict): Default model configuration.
+        send_penalties (bool): Whether `frequency_penalty` and `presence_penalty` are sent.
+        cache_breakpoints (bool): Whether `prompt_cache` marks the static prefix with `cache_control`.
+
+    Structured outputs (`parse=True`) use the SDK's `parse` endpoint, unless the model configuration
+    sets `structured_output` ('json', 'tools' or 'prompt'): the client then constrains and validates
+    the output itself, sending invalid output back for up to `structured_output_repairs` repairs.
+
+    Example:
+        >>> class ExampleClient(UNIClient):
+        ...     name, display_name, api_key_env = 'example', 'Example', 'EXAMPLE_API_KEY'
+        ...     default_config = {'model': 'example-1', 'system_message': 'You are helpful.',
+        ...                       'temperature': 1, 'max_tokens': 1024, 'max_concurrency': 1, 'kwargs': {}}
+        ...     def create_client(self):
+        ...         return OpenAI(api_key=self.get_api_key(), base_url='https://api.example.com/v1', max_retries=0)
+        ...     def create_async_client(self):
+        ...         return AsyncOpenAI(api_key=self.get_api_key(), base_url='https://api.example.com/v1', max_retries=0)
+    """
+    name: str = ''
+    display_name: str = ''
+    api_key_env: Optional[str] = None
+    default_config: Dict[str, Any] = {}
+    send_penalties: bool = True
+    cache_breakpoints: bool = False
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize the client from a model configuration.
+
+        Args:
+            config (dict, optional): Model configuration with `model`, `parameters`, `rate_limits`
+                and `retry`; missing settings fall back to `default_config`.
+        """
+        config = config or {}
+        defaults = self.default_config
+        self.api_key: str = None
+        self.client = None
+        self.async_client = None
+        self.cache = None
+        self.single_flight = None
+
+        self.model = config.get('model', defaults['model'])
+        self.parameters = config.get('parameters', {})
+        self.system_message = self.parameters.get('system_message', defaults['system_message'])
+        self.temperature = self.parameters.get('temperature', defaults['temperature'])
+        self.max_tokens = self.parameters.get('max_tokens', defaults['max_tokens'])
+        self.frequency_penalty = self.parameters.get('frequency_penalty', defaults.get('frequency_penalty', 0))
+        self.presence_penalty = self.parameters.get('presence_penalty', defaults.get('presence_penalty', 0))
+        self.max_concurrency = self.parameters.get('max_concurrency', defaults['max_concurrency'])
+        self.prompt_cache = self.parameters.get('prompt_cache', defaults.get('prompt_cache', False))
+        self.structured_output = self.parameters.get('structured_output', defaults.get('structured_output'))
+        self.structured_output_repairs = self.parameters.get('structured_output_repairs',
+                                                             defaults.get('structured_output_repairs', STRUCTURED_OUTPUT_REPAIRS))
+        self.kwargs = self.parameters.get('kwargs', defaults['kwargs'])
+        self.rate_limiter = get_rate_limiter(f"{self.name}:{self.model}", config.get('rate_limits'))
+        self.retry_policy = RetryPolicy.from_config(config.get('retry'))
+        self.circuit_breaker = get_circuit_breaker(self.name, self.model, config.get('circuit_breaker'))
+        self.metrics = registry
+        self.metrics_key = metrics_key(self.name, config, self.model)
+
+        self._lock = threading.Lock()  # Used for thread-safe updates
+
+    @classmethod
+    def get_default_config(cls) -> Dict[str, Any]:
+        """
+        Get the default model configuration.
+
+        Returns:
+            dict: Default configuration dictionary.
+        """
+        return cls.default_config
+
+    def get_api_key(self) -> str:
+        """
+        Load the API key from the `api_key_env` environment variable (.env file).
+
+        Returns:
+            str: API key string.
+
+        Raises:
+            ValueError: If the API key is not found.
+        """
+        if not self.api_key:
+            self.api_key = os.getenv(self.api_key_env)
+            if not self.api_key:
+                raise ValueError(f"A valid API Key for {self.display_name} is missing. Please set it in the .env file")
+        return self.api_key
 
-class UNIClient(ABC): 
     @abstractmethod
-    def generate_text(self, client_model: str, prompt: str) -> str:
-        """Generate text based on a single prompt"""
-        pass
+    def create_client(self):
+        """
+        Create the synchronous SDK client for the provider's endpoint.
+        """
 
     @abstractmethod
-    def batch_generate(self, client_model: str, prompts: List[str]) -> List[str]:
-        """Generate text for a list of mutliptle prompts"""
-        pass
+    def create_async_client(self):
+        """
+        Create the asynchronous SDK client for the provider's endpoint.
+        """
+
+    def get_client(self):
+        """
+        Lazily initialize and return the SDK client.
+
+        Returns:
+            OpenAI: Initialized SDK client instance.
+        """
+        if self.client is None:
+            with self._lock:
+                if self.client is None:
+                    self.client = self.create_client()
+        return self.client
+
+    def get_async_client(self):
+        """
+        Lazily initialize and return the asynchronous SDK client.
+
+        Returns:
+            AsyncOpenAI: Client sharing the endpoint and credentials of `get_client`.
+        """
+        if self.async_client is None:
+            with self._lock:
+                if self.async_client is None:
+                    self.async_client = self.create_async_client()
+        return self.async_client
+
+    def close(self) -> None:
+        """
+        Close the underlying SDK client and release its pooled HTTP connections.
+
+        The client is re-created lazily on the next request.
+        The asynchronous client is only dropped; use `aclose` to close it from a running event loop.
+        """
+        with self._lock:
+            if self.client is not None:
+                self.client.close()
+                self.client = None
+            self.async_client = None
+
+    async def aclose(self) -> None:
+        """
+        Close both the synchronous and asynchronous SDK clients.
+        """
+        with self._lock:
+            async_client, self.async_client = self.async_client, None
+        if async_client is not None:
+            await async_client.close()
+        self.close()
+
+    def _request(self, create, params: Dict[str, Any], tracker: CallTracker = None):
+        """
+        Issue a single SDK call within the configured rate limits, retrying transient errors.
+
+        Each attempt waits for the rate limiter; failed attempts are retried according to
+        the model's `retry` policy with exponential backoff and jitter. Latency, tokens,
+        retries and errors of the call are recorded in `self.metrics`. While the circuit
+        breaker of the backend is open, the call fails immediately. For a stream, its success
+        is recorded by the hooks from `_stream_hooks` once it ends.
+
+        Args:
+            create (Callable): SDK method to call, e.g. `client.chat.completions.create`.
+            params (dict): Keyword arguments for the call.
+            tracker (CallTracker, optional): Tracker of a streamed call; the caller records
+                its completion once the stream is exhausted.
+
+        Returns:
+            Any: The SDK response.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker of the backend is open.
+        """
+        def attempt():
+            if self.rate_limiter is None:
+                return create(**params)
+            reserved = self.rate_limiter.acquire(params)
+            response = create(**params)
+            self.rate_limiter.reconcile(reserved, response)
+            return response
+
+        permit = self._check_circuit()
+        call = tracker or self.metrics.track(self.metrics_key)
+        call.permit = permit
+        try:
+            response = self.retry_policy.call(attempt, on_retry=call.on_retry)
+        except Exception as e:
+            call.failure(e)
+            self._record_outcome(permit, e)
+            raise
+        except BaseException as e:
+            # Cancelled, e.g. as the losing side of a hedged request: no outcome, but a trial is released.
+            self._record_outcome(permit, e)
+            raise
+        if tracker is None:
+            self._record_outcome(permit)
+            call.success(response)
+        else:
+            call.response_started()
+        return response
+
+    async def _arequest(self, create, params: Dict[str, Any], tracker: CallTracker = None):
+        """
+        Asynchronous version of `_request` for `AsyncOpenAI` methods.
+        """
+        async def attempt():
+            if self.rate_limiter is None:
+                return await create(**params)
+            reserved = await self.rate_limiter.aacquire(params)
+            response = await create(**params)
+            self.rate_limiter.reconcile(reserved, response)
+            return response
+
+        permit = self._check_circuit()
+        call = tracker or self.metrics.track(self.metrics_key)
+        call.permit = permit
+        try:
+            response = await self.retry_policy.acall(attempt, on_retry=call.on_retry)
+        except Exception as e:
+            call.failure(e)
+            self._record_outcome(permit, e)
+            raise
+        except BaseException as e:
+            # Cancelled, e.g. as the losing side of a hedged request: no outcome, but a trial is released.
+            self._record_outcome(permit, e)
+            raise
+        if tracker is None:
+            self._record_outcome(permit)
+            call.success(response)
+        else:
+            call.response_started()
+        return response
+
+    def _check_circuit(self) -> Optional[Permit]:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return None
+        permit = breaker.allow()
+        if permit is None:
+            raise CircuitOpenError(breaker.key, breaker.retry_in())
+        return permit
+
+    def _record_outcome(self, permit: Optional[Permit], error: BaseException = None) -> None:
+        if self.circuit_breaker is not None and permit is not None:
+            # Invalid and cancelled requests say nothing about the backend's health.
+            self.circuit_breaker.record(permit, True if error is None else (False if RetryPolicy.is_retryable(error) else None))
+
+    def _stream_hooks(self, tracker: CallTracker):
+        """
+        Returns the `on_complete` and `on_abort` hooks recording a stream's metrics and circuit
+        breaker outcome when it ends: a success once exhausted, its error if iterating failed,
+        and no outcome if the caller closed it early.
+        """
+        def on_complete(summary: Any) -> None:
+            tracker.stream_complete(summary)
+            self._record_outcome(tracker.permit)
+
+        def on_abort(error: Optional[BaseException]) -> None:
+            tracker.stream_aborted(error)
+            if error is not None:
+                self._record_outcome(tracker.permit, error)
+            elif self.circuit_breaker is not None and tracker.permit is not None:
+                self.circuit_breaker.record(tracker.permit, None)
+
+        return on_complete, on_abort
+
+    def _build_params(self, prompt: str, kwargs: dict = None, parse: bool = False) -> Tuple[Dict[str, Any], Any]:
+        """
+        Build the request parameters for a single prompt.
+
+        When `parse` is True and the client validates structured outputs itself (`structured_output`
+        is set), the `response_format` schema is removed from the kwargs and, depending on the mode,
+        sent as a forced tool call ('tools') or embedded in the system message, with the provider's
+        JSON mode enabled ('json') or not ('prompt'). Otherwise it is left for the `parse` endpoint.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            kwargs (dict, optional): Additional parameters to override generation behavior.
+                `history` may hold earlier chat messages to send between the system and user messages.
+                With `prompt_cache`, the schema prompt leads the system message so structured requests
+                share a byte-identical prefix, and providers with `cache_breakpoints` get a
+                `cache_control` breakpoint at the end of the static prefix (system message and history).
+            parse (bool, optional): Whether a structured response is requested.
+
+        Returns:
+            tuple: Keyword arguments for the chat completions endpoint, and the `response_format` model
+            the client validates itself (or None).
+
+        Raises:
+            ValueError: If the client validates structured outputs, `parse` is True and no valid
+                `response_format` or `structured_output` is provided.
+        """
+        kwargs = dict(kwargs or {})
+
+        # Temporary override (default behavior)
+        system_message = kwargs.pop("system_message", self.system_message)
+        history = kwargs.pop("history", None) or []
+        prompt_cache = kwargs.pop("prompt_cache", self.prompt_cache)
+        structured_output = kwargs.pop("structured_output", self.structured_output)
+        system = {"role": "system", "content": system_message}
+        response_format = None
+
+        if parse and structured_output is not None:
+            response_format = kwargs.pop("response_format", None)
+            if response_format is None:
+                raise ValueError("response_format must be provided when parse=True")
+            if structured_output not in STRUCTURED_OUTPUT_MODES:
+                raise ValueError(f"structured_output must be one of {', '.join(STRUCTURED_OUTPUT_MODES)}, got '{structured_output}'")
+
+            if structured_output == 'tools':
+                kwargs = {**structuredoutput.tool_params(response_format), **kwargs}
+            else:
+                if structured_output == 'json':
+                    kwargs.setdefault("response_format", {"type": "json_object"})
+                system = structuredoutput.format_system_message(response_format= response_format,
+                                                                user_system_prompt= system_message,
+                                                                schema_first= prompt_cache)
+
+        messages = [system, *history, {"role": "user", "content": prompt}]
+        if prompt_cache and self.cache_breakpoints:
+            messages = with_cache_breakpoint(messages, len(history))
+
+        base_params = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+        if self.send_penalties:
+            base_params["frequency_penalty"] = self.frequency_penalty
+            base_params["presence_penalty"] = self.presence_penalty
+
+        base_params.update(self.kwargs)
+        base_params.update(kwargs)
+        return base_params, response_format
+
+    def _batch_requests(self, prompts: List[str], kwargs: List[dict], parse: List[bool]):
+        """
+        Returns the indices of the prompts to send, and the position of each prompt's result among
+        theirs (None when every prompt is sent). With single-flight, duplicate requests are sent once.
+        """
+        if self.single_flight is None:
+            return range(len(prompts)), None
+        return unique_requests(prompts, kwargs, parse)
+
+    def _cache_key(self, base_params: Dict[str, Any], response_format: Any, parse: bool) -> tuple:
+        """
+        Key parts of a request in the response cache.
+
+        The `response_format` model is only part of the key when the client validates it itself;
+        otherwise it is already included in `base_params`.
+        """
+        if response_format is None:
+            return self.name, base_params, parse
+        return self.name, base_params, parse, response_format
+
+    def generate_text(self, prompt: str, kwargs: dict = None, parse: bool = False) -> Union[str, Any]:
+        """
+        Generate a single text response using the configured model.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            kwargs (dict, optional): Additional parameters to override generation behavior.
+            parse (bool, optional): Return a structured response for the `response_format` in kwargs.
+
+        Returns:
+            str: The generated message content. With `parse`, the parsed message from the `parse`
+            endpoint, or a SimpleNamespace with `raw`, `parsed` (and `error` if validation failed)
+            for clients that validate structured outputs themselves.
+
+        Raises:
+            RuntimeError: If an API or network error occurs during generation.
+        """
+        base_params, response_format = self._build_params(prompt, kwargs, parse)
+        key_parts = self._cache_key(base_params, response_format, parse)
+        compute = lambda: cached_call(self.cache, lambda: self._complete(base_params, response_format, parse), *key_parts)
+        if self.single_flight is None:
+            return compute()
+        return self.single_flight.do(make_cache_key(*key_parts), compute)
+
+    def _complete(self, base_params: Dict[str, Any], response_format: Any, parse: bool) -> Union[str, Any]:
+        """
+        Send a prepared request and extract the generated content.
+
+        Args:
+            base_params (dict): Request parameters built by `_build_params`.
+            response_format (Any): Pydantic model the client validates itself, or None.
+            parse (bool): Whether a structured response is requested.
+
+        Returns:
+            Union[str, Any]: The generated content.
+
+        Raises:
+            RuntimeError: If an API or network error occurs during generation.
+        """
+        client = self.get_client()
+
+        try:
+            if parse and response_format is not None:
+                params = base_params
+                for repair in range(self.structured_output_repairs + 1):
+                    response = self._request(client.chat.completions.create, params)
+                    message = response.choices[0].message
+                    try:
+                        parsed = structuredoutput.parse_message(message, response_format)
+                        return SimpleNamespace(raw = response, parsed = parsed)
+                    except ValueError as e:
+                        if repair == self.structured_output_repairs:
+                            return SimpleNamespace(raw=response, parsed=None, error=str(e))
+                        # Send the error back so the model repairs its output instead of re-sampling blindly.
+                        params = {**params, "messages": [*params["messages"], *structuredoutput.repair_messages(message, e)]}
+            elif parse:
+                response = self._request(client.beta.chat.completions.parse, base_params)
+                return response.choices[0].message
+            else:
+                response = self._request(client.chat.completions.create, base_params)
+                return response.choices[0].message.content
+        except Exception as e:
+            raise RuntimeError(f"Error generating text: {str(e)}") from e
+
+    async def agenerate_text(self, prompt: str, kwargs: dict = None, parse: bool = False) -> Union[str, Any]:
+        """
+        Asynchronously generate a single text response.
+
+        Accepts the same arguments as `generate_text` but uses the `AsyncOpenAI` client,
+        so many requests can be in flight on a single event loop.
+
+        Returns:
+            Union[str, Any]: The generated message content, or the structured response with `parse`.
+
+        Raises:
+            RuntimeError: If an API or network error occurs during generation.
+        """
+        base_params, response_format = self._build_params(prompt, kwargs, parse)
+        key_parts = self._cache_key(base_params, response_format, parse)
+        compute = lambda: acached_call(self.cache, lambda: self._acomplete(base_params, response_format, parse), *key_parts)
+        if self.single_flight is None:
+            return await compute()
+        return await self.single_flight.ado(make_cache_key(*key_parts), compute)
+
+    async def _acomplete(self, base_params: Dict[str, Any], response_format: Any, parse: bool) -> Union[str, Any]:
+        """
+        Asynchronous version of `_complete`.
+        """
+        client = self.get_async_client()
+
+        try:
+            if parse and response_format is not None:
+                params = base_params
+                for repair in range(self.structured_output_repairs + 1):
+                    response = await self._arequest(client.chat.completions.create, params)
+                    message = response.choices[0].message
+                    try:
+                        parsed = structuredoutput.parse_message(message, response_format)
+                        return SimpleNamespace(raw = response, parsed = parsed)
+                    except ValueError as e:
+                        if repair == self.structured_output_repairs:
+                            return SimpleNamespace(raw=response, parsed=None, error=str(e))
+                        # Send the error back so the model repairs its output instead of re-sampling blindly.
+                        params = {**params, "messages": [*params["messages"], *structuredoutput.repair_messages(message, e)]}
+            elif parse:
+                response = await self._arequest(client.beta.chat.completions.parse, base_params)
+                return response.choices[0].message
+            else:
+                response = await self._arequest(client.chat.completions.create, base_params)
+                return response.choices[0].message.content
+        except Exception as e:
+            raise RuntimeError(f"Error generating text: {str(e)}") from e
+
+    def stream_text(self, prompt: str, kwargs: dict = None) -> TextStream:
+        """
+        Stream a single text response as content deltas.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            kwargs (dict, optional): Additional parameters to override generation behavior.
+
+        Returns:
+            TextStream: Iterator of text deltas; exposes `finish_reason` and `usage` once exhausted.
+
+        Raises:
+            RuntimeError: If an API or network error occurs while opening the stream.
+        """
+        client = self.get_client()
+        base_params, _ = self._build_params(prompt, kwargs)
+        base_params["stream"] = True
+        base_params.setdefault("stream_options", {"include_usage": True})
+
+        tracker = self.metrics.track(self.metrics_key)
+        try:
+            stream = self._request(client.chat.completions.create, base_params, tracker)
+            on_complete, on_abort = self._stream_hooks(tracker)
+            return TextStream(stream, on_complete=on_complete, started_at=tracker.started_at, on_abort=on_abort)
+        except Exception as e:
+            raise RuntimeError(f"Error generating text: {str(e)}") from e
+
+    def astream_text(self, prompt: str, kwargs: dict = None) -> AsyncTextStream:
+        """
+        Asynchronously stream a single text response as content deltas.
+
+        The request is sent when iteration starts: `async for delta in client.astream_text(prompt)`.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            kwargs (dict, optional): Additional parameters to override generation behavior.
+
+        Returns:
+            AsyncTextStream: Async iterator of text deltas; exposes `finish_reason` and `usage` once exhausted.
+        """
+        base_params, _ = self._build_params(prompt, kwargs)
+        base_params["stream"] = True
+        base_params.setdefault("stream_options", {"include_usage": True})
+
+        tracker = self.metrics.track(self.metrics_key)
+        on_complete, on_abort = self._stream_hooks(tracker)
+
+        async def open_stream():
+            client = self.get_async_client()
+            tracker.start()
+            try:
+                response = await self._arequest(client.chat.completions.create, base_params, tracker)
+            except Exception as e:
+                raise RuntimeError(f"Error generating text: {str(e)}") from e
+            # Failures to open are already recorded by `_arequest`.
+            stream.add_abort_callback(on_abort)
+            return response
+
+        stream = AsyncTextStream(open_stream, on_complete=on_complete)
+        return stream
+
+    def batch_generate(self, prompts: List[str], kwargs: List[dict] = None, parse: List[bool] = None, max_concurrency: int = None) -> List[str]:
+        """
+        Generate responses for multiple prompts, optionally running them concurrently.
+
+        With single-flight enabled, duplicate prompts with identical kwargs are sent once.
+
+        Args:
+            prompts (List[str]): List of input prompts.
+            kwargs (List[dict], optional): Optional list of parameter overrides per prompt.
+            parse (List[bool], optional): Optional list indicating whether to parse each response.
+            max_concurrency (int, optional): Maximum number of prompts in flight at once.
+                Defaults to the `max_concurrency` parameter of the model configuration.
+
+        Returns:
+            List[str]: List of generated message contents or error messages, in prompt order.
+
+        Raises:
+            ValueError: If input list lengths are mismatched.
+        """
+        kwargs = kwargs if kwargs is not None else [{}] * len(prompts)
+        parse = parse if parse is not None else [False] * len(prompts)
+
+        if len(kwargs) != len(prompts):
+            raise ValueError("The length of kwargs dictionaries must match the number of prompts.")
+        if len(parse) != len(prompts):
+            raise ValueError("The length of parse list must match the number of prompts.")
+
+        def generate(idx: int):
+            try:
+                return self.generate_text(prompts[idx], kwargs[idx], parse[idx])
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+        indices, positions = self._batch_requests(prompts, kwargs, parse)
+        results = bounded_map(generate, indices, max_concurrency or self.max_concurrency)
+        return results if positions is None else [results[position] for position in positions]
+
+    async def abatch_generate(self, prompts: List[str], kwargs: List[dict] = None, parse: List[bool] = None, max_concurrency: int = None) -> List[str]:
+        """
+        Asynchronously generate responses for multiple prompts concurrently.
+
+        With single-flight enabled, duplicate prompts with identical kwargs are sent once.
+
+        Args:
+            prompts (List[str]): List of input prompts.
+            kwargs (List[dict], optional): Optional list of parameter overrides per prompt.
+            parse (List[bool], optional): Optional list indicating whether to parse each response.
+            max_concurrency (int, optional): Maximum number of prompts in flight at once.
+                Unbounded unless given here or set explicitly in the model configuration.
+
+        Returns:
+            List[str]: Generated message contents or error messages, in prompt order.
+
+        Raises:
+            ValueError: If input list lengths are mismatched.
+        """
+        kwargs = kwargs if kwargs is not None else [{}] * len(prompts)
+        parse = parse if parse is not None else [False] * len(prompts)
+
+        if len(kwargs) != len(prompts):
+            raise ValueError("The length of kwargs dictionaries must match the number of prompts.")
+        if len(parse) != len(prompts):
+            raise ValueError("The length of parse list must match the number of prompts.")
+
+        async def agenerate(idx: int):
+            try:
+                return await self.agenerate_text(prompts[idx], kwargs[idx], parse[idx])
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+        indices, positions = self._batch_requests(prompts, kwargs, parse)
+        results = await abounded_gather(agenerate, indices, max_concurrency or self.parameters.get('max_concurrency'))
+        return results if positions is None else [results[position] for position in positions]
+
 
-__all__ = []
+__all__ = ['UNIClient']
@@ -0,0 +1,217 @@
+import io
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+
+CHAT_COMPLETIONS_ENDPOINT = '/v1/chat/completions'
+TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+
+def _response_format_param(response_format: Any) -> Any:
+    """
+    Converts a Pydantic `response_format` class into the JSON-schema form accepted in batch files.
+    """
+    if isinstance(response_format, type) and hasattr(response_format, 'model_json_schema'):
+        return {'type': 'json_schema',
+                'json_schema': {'name': response_format.__name__, 'schema': response_format.model_json_schema()}}
+    return response_format
+
+
+def build_batch_file(requests: List[Dict[str, Any]], endpoint: str = CHAT_COMPLETIONS_ENDPOINT) -> bytes:
+    """
+    Serializes request parameters into the JSONL batch-file format.
+
+    Each line carries the prompt index as `custom_id`, so results can be put back in prompt order.
+
+    Args:
+        requests (List[dict]): Keyword arguments of each chat completions request, in prompt order.
+        endpoint (str): Provider endpoint the requests target.
+
+    Returns:
+        bytes: The JSONL file content.
+    """
+    lines = []
+    for idx, params in enumerate(requests):
+        body = dict(params)
+        if 'response_format' in body:
+            body['response_format'] = _response_format_param(body['response_format'])
+        lines.append(json.dumps({'custom_id': str(idx), 'method': 'POST', 'url': endpoint, 'body': body},
+                                separators=(',', ':')))
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+class BatchJob:
+    """
+    Handle for a provider batch job submitted with `submit_batch`.
+
+    Results are available once the job reaches the `completed` status; `iter_results`
+    yields them in prompt order as the output file is read, and failed requests are
+    reported as `"Error: ..."` strings like in `batch_generate`.
+
+    Attributes:
+        id (str): Provider batch id.
+        count (int): Number of prompts in the job.
+        status (str): Last known status, e.g. 'validating', 'in_progress' or 'completed'.
+        batch (Any): Last batch object returned by the provider.
+    """
+    def __init__(self, client: Any, batch: Any, count: int, response_formats: Optional[List[Any]] = None):
+        """
+        Args:
+            client (OpenAI): SDK client the job was submitted with.
+            batch (Any): Batch object returned by `client.batches.create`.
+            count (int): Number of prompts in the job.
+            response_formats (List, optional): Pydantic classes per prompt for structured results, or None.
+        """
+        self.client = client
+        self.batch = batch
+        self.id = batch.id
+        self.count = count
+        self.response_formats = response_formats or [None] * count
+
+    @property
+    def status(self) -> str:
+        return self.batch.status
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def refresh(self) -> str:
+        """
+        Retrieves the current state of the job from the provider.
+
+        Returns:
+            str: The updated status.
+        """
+        self.batch = self.client.batches.retrieve(self.id)
+        return self.status
+
+    def wait(self, poll_interval: float = 30.0, timeout: Optional[float] = None) -> 'BatchJob':
+        """
+        Polls the provider until the job reaches a terminal status.
+
+        Args:
+            poll_interval (float): Seconds between status checks.
+            timeout (float, optional): Maximum number of seconds to wait.
+
+        Returns:
+            BatchJob: The job itself.
+
+        Raises:
+            TimeoutError: If the job is not finished within `timeout`.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while not self.done:
+            self.refresh()
+            if self.done:
+                break
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(f"Batch {self.id} did not finish within {timeout} seconds (status: {self.status}).")
+            time.sleep(poll_interval)
+        return self
+
+    def cancel(self) -> str:
+        """
+        Cancels the job.
+
+        Returns:
+            str: The updated status.
+        """
+        self.batch = self.client.batches.cancel(self.id)
+        return self.status
+
+    def _read_lines(self, file_id: Optional[str]) -> Iterator[Dict[str, Any]]:
+        if not file_id:
+            return
+        content = self.client.files.content(file_id)
+        for line in content.iter_lines():
+            if line.strip():
+                yield json.loads(line)
+
+    def _decode(self, idx: int, record: Dict[str, Any]) -> Any:
+        response = record.get('response') or {}
+        error = record.get('error') or (response.get('body') or {}).get('error')
+        if error or response.get('status_code', 200) >= 400:
+            message = error.get('message') if isinstance(error, dict) else error
+            return f"Error: {message or 'request failed with status ' + str(response.get('status_code'))}"
+        message = response['body']['choices'][0]['message']
+        response_format = self.response_formats[idx]
+        if response_format is None:
+            return message.get('content')
+        try:
+            parsed = response_format.model_validate_json(message.get('content') or '')
+        except Exception:
+            parsed = None
+        return SimpleNamespace(content=message.get('content'), parsed=parsed)
+
+    def iter_results(self) -> Iterator[Any]:
+        """
+        Yields the results in prompt order, streaming through the provider's output files.
+
+        Provider output files are unordered; each result is yielded as soon as all results
+        before it have been seen, so only out-of-order results are buffered.
+
+        Yields:
+            Any: Generated content, a namespace with `content` and `parsed` for structured
+            prompts, or an `"Error: ..."` string for failed requests.
+
+        Raises:
+            RuntimeError: If the job has not completed.
+        """
+        if self.status != 'completed':
+            raise RuntimeError(f"Batch {self.id} has not completed (status: {self.status}).")
+        pending: Dict[int, Any] = {}
+        next_idx = 0
+        for file_id in (self.batch.output_file_id, self.batch.error_file_id):
+            for record in self._read_lines(file_id):
+                idx = int(record['custom_id'])
+                pending[idx] = self._decode(idx, record)
+                while next_idx in pending:
+                    yield pending.pop(next_idx)
+                    next_idx += 1
+        while next_idx < self.count:
+            yield pending.pop(next_idx, "Error: no result returned for this prompt")
+            next_idx += 1
+
+    def results(self) -> List[Any]:
+        """
+        Returns all results in prompt order; see `iter_results`.
+        """
+        return list(self.iter_results())
+
+
+def submit_batch(client: Any, requests: List[Dict[str, Any]], completion_window: str = '24h',
+                 metadata: Optional[Dict[str, str]] = None, endpoint: str = CHAT_COMPLETIONS_ENDPOINT) -> BatchJob:
+    """
+    Uploads a JSONL batch file and creates a provider batch job.
+
+    Args:
+        client (OpenAI): SDK client of a provider implementing the batch endpoints.
+        requests (List[dict]): Keyword arguments of each chat completions request, in prompt order.
+        completion_window (str): Time frame within which the provider processes the batch.
+        metadata (dict, optional): Metadata attached to the batch.
+        endpoint (str): Provider endpoint the requests target.
+
+    Returns:
+        BatchJob: Handle to poll and read the job.
+
+    Raises:
+        ValueError: If `requests` is empty.
+    """
+    if not requests:
+        raise ValueError("A batch job needs at least one prompt.")
+    response_formats = [
+        params.get('response_format') if isinstance(params.get('response_format'), type) else None
+        for params in requests
+    ]
+    batch_file = client.files.create(file=('batch.jsonl', io.BytesIO(build_batch_file(requests, endpoint))),
+                                     purpose='batch')
+    options = {'metadata': metadata} if metadata else {}
+    batch = client.batches.create(input_file_id=batch_file.id, endpoint=endpoint,
+                                  completion_window=completion_window, **options)
+    return BatchJob(client, batch, len(requests), response_formats)
+
+
+__all__ = ['BatchJob', 'build_batch_file', 'submit_batch']
@@ -0,0 +1,227 @@
+"""
+Benchmarks azllm's request paths against a local mock OpenAI-compatible server.
+
+Run from the command line:
+
+    python -m azllm.benchmark --concurrency 1,4,16 --requests 64 --latency 0.05 --jitter 0.01
+
+Each method is driven at every concurrency level, and the report lists throughput,
+latency percentiles and the client-side overhead per request (the measured latency
+minus the time the server spent on the request).
+
+`--import-time` instead reports the cost of `import azllm`, as measured by
+`python -X importtime -c "import azllm"`.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence
+
+from .core import azLLM
+from .metrics import MetricsRegistry
+from .mockserver import MockOpenAIServer
+
+
+BENCHMARK_METHODS = ('generate_text', 'batch_generate', 'generate_parallel')
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Returns the `q`-quantile (0 to 1) of `values` using linear interpolation.
+    """
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@contextmanager
+def _mock_environment(server: MockOpenAIServer) -> Iterator[None]:
+    saved = {name: os.environ.get(name) for name in ('OPENAI_API_KEY', 'OPENAI_BASE_URL')}
+    os.environ['OPENAI_API_KEY'] = 'benchmark'
+    os.environ['OPENAI_BASE_URL'] = server.base_url
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _drive(llm: azLLM, method: str, prompts: List[str], concurrency: int) -> List[Any]:
+    if method == 'generate_text':
+        def generate(prompt: str) -> Any:
+            try:
+                return llm.generate_text('openai', prompt)
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(generate, prompts))
+    if method == 'batch_generate':
+        return llm.batch_generate('openai', prompts, max_concurrency=concurrency)
+    if method == 'generate_parallel':
+        # generate_parallel sends one prompt to several models at once; listing the same
+        # model `concurrency` times keeps that many requests in flight per round.
+        results = []
+        for start in range(0, len(prompts), concurrency):
+            width = min(concurrency, len(prompts) - start)
+            results.extend(llm.generate_parallel(prompts[start], ['openai'] * width).values())
+        return results
+    raise ValueError(f"Unknown benchmark method '{method}'. Expected one of {BENCHMARK_METHODS}.")
+
+
+def run_benchmark(methods: Sequence[str] = BENCHMARK_METHODS, concurrency_levels: Sequence[int] = (1, 4, 16),
+                  requests: int = 64, latency: float = 0.05, jitter: float = 0.01, error_rate: float = 0.0,
+                  rate_limit_rate: float = 0.0, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Drives azllm against a local mock server and measures each method at each concurrency level.
+
+    Args:
+        methods (Sequence[str]): Methods to benchmark, from `BENCHMARK_METHODS`.
+        concurrency_levels (Sequence[int]): Numbers of requests in flight to test.
+        requests (int): Number of requests per method and concurrency level.
+        latency (float): Simulated provider latency in seconds.
+        jitter (float): Maximum deviation from `latency` in seconds.
+        error_rate (float): Fraction of requests answered with a 500 error.
+        rate_limit_rate (float): Fraction of requests answered with a 429 error.
+        seed (int): Seed for the simulated latency and errors.
+
+    Returns:
+        List[dict]: One row per method and level with `requests`, `errors`, `elapsed`,
+        `throughput` (requests per second), `latency_p50`/`p90`/`p99` and `overhead_ms`
+        (mean client-side time per request beyond the server's processing time).
+    """
+    rows = []
+    with MockOpenAIServer(latency=latency, jitter=jitter, error_rate=error_rate,
+                          rate_limit_rate=rate_limit_rate, seed=seed) as server, _mock_environment(server):
+        for method in methods:
+            for concurrency in concurrency_levels:
+                latencies: List[float] = []
+                metrics = MetricsRegistry()
+                metrics.add_callback(lambda record: latencies.append(record.latency))
+                prompts = [f"Benchmark prompt {idx}" for idx in range(requests)]
+
+                with azLLM(metrics=metrics) as llm:
+                    llm.generate_text('openai', 'warm-up')
+                    latencies.clear()
+                    server.reset_stats()
+
+                    started_at = time.perf_counter()
+                    results = _drive(llm, method, prompts, concurrency)
+                    elapsed = time.perf_counter() - started_at
+
+                server_time = sum(server.processing_times)
+                rows.append({
+                    'method': method,
+                    'concurrency': concurrency,
+                    'requests': len(results),
+                    'errors': sum(1 for result in results if isinstance(result, str) and result.startswith('Error:')),
+                    'elapsed': elapsed,
+                    'throughput': len(results) / elapsed if elapsed else float('inf'),
+                    'latency_p50': percentile(latencies, 0.5),
+                    'latency_p90': percentile(latencies, 0.9),
+                    'latency_p99': percentile(latencies, 0.99),
+                    'overhead_ms': (sum(latencies) - server_time) / len(latencies) * 1000 if latencies else float('nan'),
+                })
+    return rows
+
+
+def format_results(rows: List[Dict[str, Any]]) -> str:
+    """
+    Formats benchmark rows as a fixed-width text table.
+    """
+    header = f"{'method':<18} {'conc':>5} {'reqs':>6} {'errors':>6} {'req/s':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'overhead ms':>12}"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['method']:<18} {row['concurrency']:>5} {row['requests']:>6} {row['errors']:>6} "
+            f"{row['throughput']:>9.1f} {row['latency_p50'] * 1000:>9.1f} {row['latency_p90'] * 1000:>9.1f} "
+            f"{row['latency_p99'] * 1000:>9.1f} {row['overhead_ms']:>12.2f}"
+        )
+    return '\n'.join(lines)
+
+
+def measure_import_time(module: str = 'azllm', runs: int = 5, top: int = 10) -> Dict[str, Any]:
+    """
+    Measures the import time of `module` in fresh interpreters with `-X importtime`.
+
+    Args:
+        module (str): Module to import.
+        runs (int): Number of interpreter runs; the median total is reported.
+        top (int): Number of most expensive imports (by self time) to list from the last run.
+
+    Returns:
+        dict: `total_ms` (median cumulative import time of `module`), `runs_ms` (all runs),
+        `modules` (sorted names of imported top-level packages) and `slowest`
+        (`(module, self_ms)` pairs).
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    totals, entries, imported = [], [], set()
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                   capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed: {completed.stderr.strip()[-500:]}")
+        entries, imported = [], set()
+        for line in completed.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            name = name.strip()
+            entries.append((name, int(self_us) / 1000, int(cumulative_us) / 1000))
+            imported.add(name.split('.')[0])
+        totals.append(next(cumulative for name, _, cumulative in entries if name == module))
+    return {
+        'total_ms': percentile(totals, 0.5),
+        'runs_ms': totals,
+        'modules': sorted(imported),
+        'slowest': [(name, self_ms) for name, self_ms, _ in sorted(entries, key=lambda e: e[1], reverse=True)[:top]],
+    }
+
+
+def main(argv: Sequence[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark azllm against a local mock OpenAI-compatible server.")
+    parser.add_argument('--methods', default=','.join(BENCHMARK_METHODS), help="Comma-separated methods to benchmark.")
+    parser.add_argument('--concurrency', default='1,4,16', help="Comma-separated concurrency levels.")
+    parser.add_argument('--requests', type=int, default=64, help="Requests per method and concurrency level.")
+    parser.add_argument('--latency', type=float, default=0.05, help="Simulated provider latency in seconds.")
+    parser.add_argument('--jitter', type=float, default=0.01, help="Maximum latency deviation in seconds.")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests failing with 500.")
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="Fraction of requests failing with 429.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for simulated latency and errors.")
+    parser.add_argument('--import-time', action='store_true', help="Measure the import time of azllm instead.")
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        result = measure_import_time()
+        print(f"import azllm: {result['total_ms']:.1f} ms (median of {len(result['runs_ms'])} runs)")
+        for name, self_ms in result['slowest']:
+            print(f"  {self_ms:8.2f} ms  {name}")
+        return
+
+    rows = run_benchmark(
+        methods=[method.strip() for method in args.methods.split(',') if method.strip()],
+        concurrency_levels=[int(level) for level in args.concurrency.split(',') if level.strip()],
+        requests=args.requests, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, seed=args.seed,
+    )
+    print(format_results(rows))
+
+
+if __name__ == '__main__':
+    main()
+
+
+__all__ = ['run_benchmark', 'format_results', 'measure_import_time', 'percentile', 'BENCHMARK_METHODS']
@@ -0,0 +1,271 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised instead of sending a request while the circuit of its backend is open.
+
+    It is a `ConnectionError`, so failover routes move on to their next target.
+
+    Attributes:
+        key (str): Key of the circuit breaker, e.g. 'openai' or 'openai:gpt-4o-mini'.
+        retry_in (float): Seconds until the circuit lets a trial request through.
+    """
+    def __init__(self, key: str, retry_in: float):
+        self.key = key
+        self.retry_in = retry_in
+        super().__init__(f"Circuit for '{key}' is open; failing fast for another {retry_in:.1f}s.")
+
+
+class Permit(NamedTuple):
+    """
+    A request let through by `CircuitBreaker.allow`, to be passed back to `CircuitBreaker.record`.
+
+    Attributes:
+        generation (int): State of the breaker the request was let through in; outcomes of requests
+            from an earlier state are ignored.
+        trial (bool): Whether the request is one of the trial requests of the half-open state.
+    """
+    generation: int
+    trial: bool
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker failing requests to an unhealthy backend fast instead of waiting for timeouts.
+
+    The breaker is closed while the backend is healthy. It opens when at least `failure_rate` of the
+    last `window` calls failed (after at least `min_calls`); while open, requests fail immediately
+    with `CircuitOpenError`. After `reset_timeout` seconds it becomes half-open and lets
+    `half_open_calls` trial requests through: if they all succeed, the breaker closes, and any
+    failure opens it again.
+
+    Only transient errors count as failures (timeouts, connection errors, rate limits and server
+    errors); invalid requests do not.
+
+    Attributes:
+        failure_rate (float): Share of failed calls in the window that opens the circuit.
+        window (int): Number of most recent calls considered.
+        min_calls (int): Minimum number of calls in the window before the circuit can open.
+        reset_timeout (float): Seconds the circuit stays open before trial requests are allowed.
+        half_open_calls (int): Number of successful trial requests needed to close the circuit.
+        scope (str): 'client' to share the breaker between all models of a client, or 'model'.
+        key (str): Key of the breaker in the process-wide registry, e.g. 'openai'.
+    """
+    def __init__(self, failure_rate: float = 0.5, window: int = 20, min_calls: int = 5, reset_timeout: float = 30.0,
+                 half_open_calls: int = 1, scope: str = 'client', clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes the circuit breaker.
+
+        Args:
+            failure_rate (float): Share of failed calls in the window that opens the circuit.
+            window (int): Number of most recent calls considered.
+            min_calls (int): Minimum number of calls in the window before the circuit can open.
+            reset_timeout (float): Seconds the circuit stays open before trial requests are allowed.
+            half_open_calls (int): Number of successful trial requests needed to close the circuit.
+            scope (str): 'client' or 'model'.
+            clock (Callable): Monotonic clock in seconds.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be between 0 and 1.")
+        if window < 1 or min_calls < 1 or half_open_calls < 1:
+            raise ValueError("window, min_calls and half_open_calls must be at least 1.")
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout must not be negative.")
+        if scope not in ('client', 'model'):
+            raise ValueError("scope must be 'client' or 'model'.")
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.scope = scope
+        self.key: Optional[str] = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        # Incremented on every state change, so outcomes of earlier permits can be told apart.
+        self._generation = 0
+        self.opened = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'CircuitBreaker':
+        """
+        Creates a circuit breaker from the `circuit_breaker` block of a model configuration.
+
+        Args:
+            config (dict, optional): Breaker settings; defaults are used for missing keys.
+
+        Returns:
+            CircuitBreaker: The circuit breaker.
+
+        Raises:
+            ValueError: If the block contains unknown keys.
+        """
+        config = config or {}
+        unknown = set(config) - {'failure_rate', 'window', 'min_calls', 'reset_timeout', 'half_open_calls', 'scope'}
+        if unknown:
+            raise ValueError(f"Unknown circuit breaker settings: {sorted(unknown)}")
+        return cls(**config)
+
+    def settings(self) -> tuple:
+        return (self.failure_rate, self.window, self.min_calls, self.reset_timeout, self.half_open_calls, self.scope)
+
+    def _advance(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._generation += 1
+            self._trials = self._trial_successes = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._generation += 1
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self.opened += 1
+
+    @property
+    def state(self) -> str:
+        """
+        The current state: 'closed', 'open' or 'half_open'.
+        """
+        with self._lock:
+            self._advance()
+            return self._state
+
+    def available(self) -> bool:
+        """
+        Whether a request would currently be let through, without reserving a trial request.
+        """
+        with self._lock:
+            self._advance()
+            return self._state == CLOSED or (self._state == HALF_OPEN and self._trials < self.half_open_calls)
+
+    def retry_in(self) -> float:
+        """
+        Seconds until an open circuit lets a trial request through.
+        """
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def allow(self) -> Optional[Permit]:
+        """
+        Reserves a request; in the half-open state, at most `half_open_calls` trial requests are let through.
+
+        Returns:
+            Permit: The permit of the request, or None if it may not be sent. The permit and the
+                request's outcome must then be passed to `record`.
+        """
+        with self._lock:
+            self._advance()
+            if self._state == CLOSED:
+                return Permit(self._generation, False)
+            if self._state == HALF_OPEN and self._trials < self.half_open_calls:
+                self._trials += 1
+                return Permit(self._generation, True)
+            self.rejected += 1
+            return None
+
+    def record(self, permit: Permit, success: Optional[bool]) -> None:
+        """
+        Records the outcome of a request let through by `allow`.
+
+        Outcomes of requests let through before the breaker last changed state are ignored, so a
+        slow request sent before the circuit opened neither closes it nor releases a trial.
+
+        Args:
+            permit (Permit): The permit returned by `allow` for the request.
+            success (bool, optional): True or False; None for outcomes that say nothing about the
+                backend's health, such as invalid or cancelled requests.
+        """
+        with self._lock:
+            if permit.generation != self._generation:
+                return
+            if permit.trial:
+                if success is None:
+                    self._trials -= 1
+                elif not success:
+                    self._open()
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_calls:
+                        self._state = CLOSED
+                        self._generation += 1
+                return
+            if success is None:
+                return
+            self._outcomes.append(not success)
+            if len(self._outcomes) >= self.min_calls and sum(self._outcomes) >= self.failure_rate * len(self._outcomes):
+                self._open()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the `state`, the `failures` and `calls` in the window, the number of times the circuit
+        `opened`, the requests `rejected` while open and the seconds until it allows a trial (`retry_in`).
+        """
+        state = self.state
+        with self._lock:
+            failures, calls = sum(self._outcomes), len(self._outcomes)
+        return {'state': state, 'failures': failures, 'calls': calls, 'opened': self.opened,
+                'rejected': self.rejected, 'retry_in': self.retry_in()}
+
+
+_registry: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(client_name: str, model: str, config: Optional[Dict[str, Any]]) -> Optional[CircuitBreaker]:
+    """
+    Returns the process-wide circuit breaker of a client or model, creating it if needed.
+
+    Breakers are shared by all clients of the same `client` (or `client:model` with `scope: model`),
+    across pooled clients and `azLLM` instances. A breaker is replaced if its settings change.
+
+    Args:
+        client_name (str): Name of the client.
+        model (str): Name of the model.
+        config (dict, optional): The `circuit_breaker` block of the model configuration.
+
+    Returns:
+        CircuitBreaker: The shared breaker, or None if no breaker is configured.
+    """
+    if not config:
+        return None
+    breaker = CircuitBreaker.from_config(config)
+    key = client_name if breaker.scope == 'client' else f"{client_name}:{model}"
+    with _registry_lock:
+        existing = _registry.get(key)
+        if existing is not None and existing.settings() == breaker.settings():
+            return existing
+        breaker.key = key
+        _registry[key] = breaker
+        return breaker
+
+
+def circuit_breakers() -> Dict[str, CircuitBreaker]:
+    """
+    Returns all circuit breakers created in this process by key.
+    """
+    with _registry_lock:
+        return dict(_registry)
+
+
+__all__ = ['CircuitBreaker', 'CircuitOpenError', 'Permit', 'get_circuit_breaker', 'circuit_breakers', 'CLOSED', 'OPEN', 'HALF_OPEN']
@@ -0,0 +1,324 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Union
+
+
+MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def schema_digest(model_class: type) -> str:
+    """
+    Returns the SHA-256 hex digest of a Pydantic model's JSON schema; memoized per model class.
+
+    Call `schema_digest.cache_clear()` after changing a model class at runtime.
+    """
+    schema = json.dumps(model_class.model_json_schema(), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(schema.encode('utf-8')).hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, type) and hasattr(value, 'model_json_schema'):
+        return {'__model__': f"{value.__module__}.{value.__qualname__}", 'schema': schema_digest(value)}
+    return repr(value)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Builds a stable cache key from request parts such as the merged request parameters.
+
+    Parts are serialized as canonical JSON (sorted keys); Pydantic model classes used as
+    `response_format` are represented by their name and a digest of their JSON schema.
+
+    Args:
+        *parts: Values identifying the request, e.g. the client name, `base_params` and the parse flag.
+
+    Returns:
+        str: A SHA-256 hex digest.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=_canonical, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def is_cacheable(value: Any) -> bool:
+    """
+    Returns False for structured outputs whose parsing failed, so they are retried next time.
+    """
+    return not (isinstance(value, SimpleNamespace) and getattr(value, 'parsed', MISSING) is None)
+
+
+class _StoredModel(NamedTuple):
+    """
+    A Pydantic model stored as its class and `model_dump()`. Used for parametrized generic models,
+    such as the parse endpoint's `ParsedChatCompletionMessage[Schema]`, which pickle cannot store
+    by reference.
+    """
+    origin: type
+    args: tuple
+    data: Dict[str, Any]
+
+
+def _dumps(value: Any) -> bytes:
+    try:
+        return pickle.dumps(value)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        metadata = getattr(type(value), '__pydantic_generic_metadata__', None)
+        if not metadata or metadata.get('origin') is None:
+            raise
+        return pickle.dumps(_StoredModel(metadata['origin'], metadata['args'], value.model_dump()))
+
+
+def _loads(blob: bytes) -> Any:
+    value = pickle.loads(blob)
+    if isinstance(value, _StoredModel):
+        cls = value.origin[value.args] if value.args else value.origin
+        return cls.model_validate(value.data)
+    return value
+
+
+class ResponseCache:
+    """
+    Base class for response caches with hit/miss counters.
+
+    Subclasses implement `_get`, `_set`, `clear` and `__len__`.
+
+    Attributes:
+        ttl (float): Time-to-live of entries in seconds, or None for no expiry.
+        max_entries (int): Maximum number of entries before the least recently used is evicted.
+        hits (int): Number of lookups that returned a cached value.
+        misses (int): Number of lookups that found nothing.
+    """
+    def __init__(self, max_entries: Optional[int] = 1024, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def _expires_at(self) -> Optional[float]:
+        return time.time() + self.ttl if self.ttl else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Looks up a cached value and updates the hit/miss counters.
+
+        Args:
+            key (str): Cache key, usually built with `make_cache_key`.
+            default (Any): Value returned on a miss.
+
+        Returns:
+            Any: The cached value, or `default`.
+        """
+        value = self._get(key)
+        with self._stats_lock:
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return default if value is MISSING else value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entries when the cache is full.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to store.
+        """
+        self._set(key, value)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit/miss counters and the current number of entries.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    def _get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process LRU response cache with optional TTL.
+    """
+    def __init__(self, max_entries: Optional[int] = 1024, ttl: Optional[float] = None):
+        """
+        Initializes an empty in-memory cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries; unbounded if None.
+            ttl (float, optional): Time-to-live of entries in seconds.
+        """
+        super().__init__(max_entries, ttl)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._expires_at())
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-disk response cache backed by SQLite, shared across processes and restarts.
+
+    Values are stored pickled. Parsed structured outputs of the parse endpoint are stored as their
+    `model_dump()` and rebuilt on lookup, so their schema class must be importable. Entries that
+    cannot be loaded any more, e.g. after a schema class was moved, count as misses.
+    """
+    def __init__(self, path: Union[str, Path] = 'azllm_cache.sqlite', max_entries: Optional[int] = 100_000, ttl: Optional[float] = None):
+        """
+        Opens (or creates) the cache database.
+
+        Args:
+            path (str or Path): Path of the SQLite database file.
+            max_entries (int, optional): Maximum number of entries; unbounded if None.
+            ttl (float, optional): Time-to-live of entries in seconds.
+        """
+        super().__init__(max_entries, ttl)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def _get(self, key: str) -> Any:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return MISSING
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return MISSING
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            return _loads(value)
+        except Exception:
+            return MISSING
+
+    def _set(self, key: str, value: Any) -> None:
+        blob = _dumps(value)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, blob, self._expires_at(), time.time()),
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def cached_call(cache: Optional[ResponseCache], compute: Callable[[], Any], *key_parts: Any) -> Any:
+    """
+    Returns the cached result for `key_parts`, or computes and caches it.
+
+    Args:
+        cache (ResponseCache, optional): Cache to use; `compute` is called directly if None.
+        compute (Callable): Zero-argument callable producing the result on a miss.
+        *key_parts: Values identifying the request, passed to `make_cache_key`.
+
+    Returns:
+        Any: The cached or freshly computed result. It is returned even if it cannot be stored,
+        e.g. because it is not picklable.
+    """
+    if cache is None:
+        return compute()
+    key = make_cache_key(*key_parts)
+    value = cache.get(key, MISSING)
+    if value is not MISSING:
+        return value
+    value = compute()
+    _store(cache, key, value)
+    return value
+
+
+def _store(cache: ResponseCache, key: str, value: Any) -> None:
+    if not is_cacheable(value):
+        return
+    try:
+        cache.set(key, value)
+    except Exception:
+        # The response has been paid for: failing to cache it must not lose it.
+        pass
+
+
+async def acached_call(cache: Optional[ResponseCache], compute: Callable[[], Awaitable[Any]], *key_parts: Any) -> Any:
+    """
+    Asynchronous version of `cached_call`; `compute` returns an awaitable.
+    """
+    if cache is None:
+        return await compute()
+    key = make_cache_key(*key_parts)
+    value = cache.get(key, MISSING)
+    if value is not MISSING:
+        return value
+    value = await compute()
+    _store(cache, key, value)
+    return value
+
+
+__all__ = ['ResponseCache', 'MemoryCache', 'SQLiteCache', 'make_cache_key', 'schema_digest', 'cached_call', 'acached_call']
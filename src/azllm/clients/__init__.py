@@ -0,0 +1,90 @@
+import importlib
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Tuple
+
+
+CLIENT_MODULES: Dict[str, Tuple[str, str]] = {
+    'openai': ('azllm.clients.openai', 'OpenAIClient'),
+    'deepseek': ('azllm.clients.deepseek', 'DeepSeekClient'),
+    'grok': ('azllm.clients.grok', 'GrokClient'),
+    'anthropic': ('azllm.clients.anthropic', 'AnthropicClient'),
+    'gemini': ('azllm.clients.gemini', 'GeminiClient'),
+    'ollama': ('azllm.clients.ollama', 'OllamaClient'),
+    'fireworks': ('azllm.clients.fireworks', 'FireworksClient'),
+}
+
+
+class ClientRegistry(MutableMapping):
+    """
+    Mapping of client names to client classes that imports provider modules on first use.
+
+    Membership tests and iteration only use the client names, so `import azllm` does not
+    import the `openai` SDK; a provider module is imported when its class is first looked up.
+    Additional clients can be registered by assigning a class or a `(module, class_name)` tuple.
+
+    Example:
+        >>> registry = ClientRegistry()
+        >>> 'ollama' in registry      # no provider module imported
+        True
+        >>> registry['ollama']        # imports azllm.clients.ollama
+        <class 'azllm.clients.ollama.OllamaClient'>
+    """
+    def __init__(self, modules: Dict[str, Tuple[str, str]] = None):
+        self._entries: Dict[str, Any] = dict(CLIENT_MODULES if modules is None else modules)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> type:
+        entry = self._entries[name]
+        if isinstance(entry, tuple):
+            module_name, class_name = entry
+            client_class = getattr(importlib.import_module(module_name), class_name)
+            with self._lock:
+                self._entries[name] = client_class
+            return client_class
+        return entry
+
+    def __setitem__(self, name: str, client: Any) -> None:
+        with self._lock:
+            self._entries[name] = client
+
+    def __delitem__(self, name: str) -> None:
+        with self._lock:
+            del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Returns True if the module of client `name` has been imported.
+        """
+        return not isinstance(self._entries.get(name), tuple)
+
+
+def get_client_class(name: str) -> type:
+    """
+    Returns the class of a built-in client, importing its module on first use.
+
+    Args:
+        name (str): Client name, e.g. 'openai'.
+
+    Returns:
+        type: The client class.
+
+    Raises:
+        ValueError: If the client is not supported.
+    """
+    if name not in CLIENT_MODULES:
+        raise ValueError(f"Client {name} not found.")
+    module_name, class_name = CLIENT_MODULES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+__all__ = ['ClientRegistry', 'CLIENT_MODULES', 'get_client_class']
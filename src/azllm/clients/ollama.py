@@ -1,9 +1,7 @@
-from openai import OpenAI
-import os
-from typing import List, Dict, Any
+from openai import OpenAI, AsyncOpenAI
 from azllm.base import UNIClient
-from dotenv import load_dotenv
-load_dotenv()
+from azllm.env import load_environment
+load_environment()
 
 
 DEFAULT_CONFIG = {'model': 'tinyllama:1.1b',
@@ -12,9 +10,10 @@ DEFAULT_CONFIG = {'model': 'tinyllama:1.1b',
                   'max_tokens': 4096,
                   'frequency_penalty': 0,
                   'presence_penalty': 0,
+                  'max_concurrency': 1,
                   'kwargs': {}}
 
-class OllamaClient:
+class OllamaClient(UNIClient):
     """
     A client for using Ollama models via an OpenAI-compatible API wrapper.
 
@@ -31,129 +30,30 @@ class OllamaClient:
         presence_penalty (float): Encourages discussion of new topics.
         kwargs (dict): Additional parameters passed to the API.
     """
+    name = 'ollama'
+    display_name = 'Ollama'
+    api_key_env = None
+    default_config = DEFAULT_CONFIG
 
-    def __init__(self, config: Dict[str, Any]= None):
+    def get_api_key(self) -> str:
         """
-        Initializes the OllamaClient with the given or default configuration.
-
-        Args:
-            config (dict, optional): Custom configuration dictionary. If not provided,
-                                     DEFAULT_CONFIG is used.
-        """
-        
-        config = config or {}
-        self.api_key: str = None
-        self.client = None
-
-        self.model = config.get('model', DEFAULT_CONFIG['model']) 
-        self.parameters = config.get('parameters', {}) 
-        self.system_message = self.parameters.get('system_message', DEFAULT_CONFIG['system_message']) 
-        self.temperature = self.parameters.get('temperature', DEFAULT_CONFIG['temperature']) 
-        self.max_tokens = self.parameters.get('max_tokens', DEFAULT_CONFIG['max_tokens']) 
-        self.frequency_penalty = self.parameters.get('frequency_penalty', DEFAULT_CONFIG['frequency_penalty']) 
-        self.presence_penalty = self.parameters.get('presence_penalty', DEFAULT_CONFIG['presence_penalty']) 
-        self.kwargs = self.parameters.get('kwargs', DEFAULT_CONFIG['kwargs'])
-    
-    @classmethod
-    def get_default_config(cls) -> Dict[str, Any]:
-        """
-        Get the default configuration for Ollama models.
+        Returns the placeholder API key; a local Ollama server does not check it.
 
         Returns:
-            dict: A dictionary containing default model settings.
-        """
-        return DEFAULT_CONFIG
-    
-    def get_client(self):  
+            str: The string 'ollama'.
         """
-        Lazily initializes and returns the OpenAI-compatible client configured for local Ollama.
+        return "ollama"
 
-        Returns:
-            OpenAI: An instance of the OpenAI client pointing to local Ollama API.
+    def create_client(self) -> OpenAI:
         """
-        if self.client is None:
-            self.client = OpenAI(api_key="ollama", base_url="http://localhost:11434/v1",)
-        return self.client
-    
-    def generate_text(self, prompt: str, kwargs:dict = None, parse: bool = False) -> str:
+        Create the OpenAI-compatible client for the Ollama API.
         """
-        Generates a single completion response from the Ollama model.
-
-        Args:
-            prompt (str): The prompt to send to the model.
-            kwargs (dict, optional): Overrides for generation parameters.
-            parse (bool, optional): If True, use the beta `.parse()` method (experimental).
+        return OpenAI(api_key=self.get_api_key(), base_url="http://localhost:11434/v1", max_retries=0)
 
-        Returns:
-            str: The model's generated text.
-
-        Raises:
-            RuntimeError: If the API request fails or is malformed.
+    def create_async_client(self) -> AsyncOpenAI:
         """
-        client = self.get_client()
-
-        kwargs = kwargs or {}
-
-        # Temporary override (default behavior)
-        system_message = kwargs.pop("system_message", self.system_message)
-
-        base_params = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "frequency_penalty": self.frequency_penalty,
-            "presence_penalty": self.presence_penalty
-        }
-    
-        base_params.update(self.kwargs)
-        base_params.update(kwargs)
-
-        try:
-            if parse:
-                response = client.beta.chat.completions.parse(**base_params)
-                return response.choices[0].message
-            else:
-                response = client.chat.completions.create(**base_params)
-                return response.choices[0].message.content
-        except Exception as e:
-            raise RuntimeError(f"Error generating text: {str(e)}")
-    
-    
-    def batch_generate(self, prompts: List[str], kwargs: List[dict] = None, parse: List[bool] = None) -> List[str]:
+        Create the asynchronous OpenAI-compatible client for the Ollama API.
         """
-        Generate responses for multiple prompts in sequence.
-
-        Args:
-            prompts (List[str]): List of input prompts.
-            kwargs (List[dict], optional): Optional list of parameter overrides per prompt.
-            parse (List[bool], optional): Optional list indicating whether to use `parse` per prompt.
-
-        Returns:
-            List[str]: List of generated message contents or error messages.
-        
-        Raises:
-            ValueError: If input list lengths are mismatched.
-        """
-        responses = []
-
-        kwargs = kwargs if kwargs is not None else [{}] * len(prompts)
-        parse = parse if parse is not None else [False] * len(prompts)
-
-        if len(kwargs) != len(prompts):
-            raise ValueError("The length of kwargs dictionaries must match the number of prompts.")
-        if len(parse) != len(prompts):
-            raise ValueError("The length of parse list must match the number of prompts.")
-        
-        for idx, prompt in enumerate(prompts):
-            try:
-                response = self.generate_text(prompt, kwargs[idx], parse[idx]) 
-                responses.append(response)
-            except Exception as e:
-                responses.append(f"Error: {str(e)}")
-        return responses
+        return AsyncOpenAI(api_key=self.get_api_key(), base_url="http://localhost:11434/v1", max_retries=0)
 
 __all__ = []
\ No newline at end of file
@@ -1,10 +1,9 @@
-from openai import OpenAI
-import os
-import threading
-from typing import List, Dict, Any
+from openai import OpenAI, AsyncOpenAI
+from typing import List, Dict
 from azllm.base import UNIClient
-from dotenv import load_dotenv
-load_dotenv()
+from azllm.batch import BatchJob, submit_batch
+from azllm.env import load_environment
+load_environment()
 
 
 DEFAULT_CONFIG = {'model': 'gpt-4o-mini',
@@ -13,9 +12,10 @@ DEFAULT_CONFIG = {'model': 'gpt-4o-mini',
                   'max_tokens': 4096,
                   'frequency_penalty': 0,
                   'presence_penalty': 0,
+                  'max_concurrency': 1,
                   'kwargs': {}}
 
-class OpenAIClient:
+class OpenAIClient(UNIClient):
     """
     A wrapper for the OpenAI client that supports configuration-based initialization and unified text generation.
 
@@ -29,146 +29,49 @@ class OpenAIClient:
         presence_penalty (float): Penalty to encourage new topic generation.
         kwargs (dict): Additional keyword arguments passed to the OpenAI API.
     """
-    def __init__(self, config: Dict[str, Any]= None):
-        """
-        Initialize the OpenAI client with optional custom configuration.
-
-        Args:
-            config (dict, optional): Custom configuration dictionary.
-        """
-        
-        config = config or {}
-        self.api_key: str = None
-        self.client = None
-
-        self.model = config.get('model', DEFAULT_CONFIG['model']) 
-        self.parameters = config.get('parameters', {}) 
-        self.system_message = self.parameters.get('system_message', DEFAULT_CONFIG['system_message']) 
-        self.temperature = self.parameters.get('temperature', DEFAULT_CONFIG['temperature']) 
-        self.max_tokens = self.parameters.get('max_tokens', DEFAULT_CONFIG['max_tokens']) 
-        self.frequency_penalty = self.parameters.get('frequency_penalty', DEFAULT_CONFIG['frequency_penalty']) 
-        self.presence_penalty = self.parameters.get('presence_penalty', DEFAULT_CONFIG['presence_penalty']) 
-        self.kwargs = self.parameters.get('kwargs', DEFAULT_CONFIG['kwargs'])
-
-        self._lock = threading.Lock()  # Used for thread-safe updates
-    
-    @classmethod
-    def get_default_config(cls) -> Dict[str, Any]:
-        """
-        Get the default model configuration.
+    name = 'openai'
+    display_name = 'OpenAI'
+    api_key_env = 'OPENAI_API_KEY'
+    default_config = DEFAULT_CONFIG
 
-        Returns:
-            dict: Default configuration dictionary.
-        """
-        return DEFAULT_CONFIG
-        
-    def get_api_key(self) -> str:
-        """
-        Load the OpenAI API key from environment variables (.env file).
-
-        Returns:
-            str: API key string.
-
-        Raises:
-            ValueError: If the API key is not found.
+    def create_client(self) -> OpenAI:
         """
-        if not self.api_key:
-            self.api_key = os.getenv("OPENAI_API_KEY")
-            if not self.api_key:
-                raise ValueError("A valid API Key for OpenAI is missing. Please set it in the .env file")
-        return self.api_key
-    
-    def get_client(self):  
+        Create the OpenAI-compatible client for the OpenAI API.
         """
-        Lazily initialize and return the OpenAI client.
+        return OpenAI(api_key=self.get_api_key(), max_retries=0)
 
-        Returns:
-            OpenAI: Initialized OpenAI client instance.
+    def create_async_client(self) -> AsyncOpenAI:
         """
-        if self.client is None:
-            self.client = OpenAI(api_key=self.get_api_key())
-        return self.client
-    
-    def generate_text(self, prompt: str, kwargs:dict = None, parse: bool = False) -> str:
+        Create the asynchronous OpenAI-compatible client for the OpenAI API.
         """
-        Generate a single text response using the configured OpenAI model.
-
-        Args:
-            prompt (str): The input prompt for the model.
-            kwargs (dict, optional): Additional parameters to override generation behavior.
-            parse (bool, optional): Use the beta `parse` endpoint if True.
+        return AsyncOpenAI(api_key=self.get_api_key(), max_retries=0)
 
-        Returns:
-            str: The generated message content.
-
-        Raises:
-            RuntimeError: If an API or network error occurs during generation.
+    def submit_batch(self, prompts: List[str], kwargs: List[dict] = None, completion_window: str = '24h',
+                     metadata: Dict[str, str] = None) -> BatchJob:
         """
-        client = self.get_client()
-
-        kwargs = kwargs or {}
+        Submit prompts as an offline job through the OpenAI Batch API.
 
-        # Temporary override (default behavior)
-        system_message = kwargs.pop("system_message", self.system_message)
-        
-        base_params = {
-            "model": self.model,
-            "messages": [
-                # {"role": "system", "content": self.system_message}, 
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "frequency_penalty": self.frequency_penalty,
-            "presence_penalty": self.presence_penalty
-        }
-    
-        base_params.update(self.kwargs)
-        base_params.update(kwargs)
-
-        try:
-            if parse:
-                response = client.beta.chat.completions.parse(**base_params)
-                return response.choices[0].message
-            else:
-                response = client.chat.completions.create(**base_params)
-                return response.choices[0].message.content
-        except Exception as e:
-            raise RuntimeError(f"Error generating text: {str(e)}")
-
-    
-    def batch_generate(self, prompts: List[str], kwargs: List[dict] = None, parse: List[bool] = None) -> List[str]:
-        """
-        Generate responses for multiple prompts in sequence.
+        Requests are built exactly like in `generate_text`, serialized into a JSONL batch file and
+        processed by the provider within `completion_window`, typically at a reduced price.
+        A Pydantic `response_format` in kwargs is sent as a JSON schema and parsed in the results.
 
         Args:
             prompts (List[str]): List of input prompts.
             kwargs (List[dict], optional): Optional list of parameter overrides per prompt.
-            parse (List[bool], optional): Optional list indicating whether to use `parse` per prompt.
+            completion_window (str): Time frame within which the batch is processed.
+            metadata (dict, optional): Metadata attached to the batch.
 
         Returns:
-            List[str]: List of generated message contents or error messages.
-        
+            BatchJob: Handle to poll the job and read its results in prompt order.
+
         Raises:
-            ValueError: If input list lengths are mismatched.
+            ValueError: If input list lengths are mismatched or no prompts are given.
         """
-        responses = []
-
         kwargs = kwargs if kwargs is not None else [{}] * len(prompts)
-        parse = parse if parse is not None else [False] * len(prompts)
-
         if len(kwargs) != len(prompts):
             raise ValueError("The length of kwargs dictionaries must match the number of prompts.")
-        if len(parse) != len(prompts):
-            raise ValueError("The length of parse list must match the number of prompts.")
-        
-        for idx, prompt in enumerate(prompts):
-            try:
-                response = self.generate_text(prompt, kwargs[idx], parse[idx]) 
-                responses.append(response)
-            except Exception as e:
-                responses.append(f"Error: {str(e)}")
-        return responses
+
+        requests = [self._build_params(prompt, kw)[0] for prompt, kw in zip(prompts, kwargs)]
+        return submit_batch(self.get_client(), requests, completion_window, metadata)
 
 __all__ = []
\ No newline at end of file
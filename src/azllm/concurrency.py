@@ -0,0 +1,54 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+
+def bounded_map(func: Callable[[Any], Any], items: Iterable[Any], max_concurrency: Optional[int] = 1) -> List[Any]:
+    """
+    Apply `func` to every item using at most `max_concurrency` worker threads.
+
+    Results are returned in input order. With a concurrency of 1 (or a single item),
+    items are processed sequentially in the calling thread.
+
+    Args:
+        func (Callable): Function applied to each item.
+        items (Iterable): Items to process.
+        max_concurrency (int, optional): Maximum number of concurrent calls.
+
+    Returns:
+        list: The results of `func`, in the same order as `items`.
+    """
+    items = list(items)
+    if not max_concurrency or max_concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+async def abounded_gather(func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], max_concurrency: Optional[int] = None) -> List[Any]:
+    """
+    Await `func(item)` for every item with at most `max_concurrency` coroutines in flight.
+
+    Args:
+        func (Callable): Coroutine function applied to each item.
+        items (Iterable): Items to process.
+        max_concurrency (int, optional): Maximum number of concurrent calls; unbounded if None.
+
+    Returns:
+        list: The awaited results, in the same order as `items`.
+    """
+    items = list(items)
+    if not max_concurrency:
+        return await asyncio.gather(*(func(item) for item in items))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+__all__ = ['bounded_map', 'abounded_gather']
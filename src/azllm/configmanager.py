@@ -1,14 +1,9 @@
 
 from .utils import create_custom_file, load_custom_config, save_custom_configs, template_content
+from pathlib import Path
 from typing import Dict, Any 
 
-from .clients.openai import OpenAIClient
-from .clients.deepseek import DeepSeekClient
-from .clients.grok import GrokClient
-from .clients.anthropic import AnthropicClient
-from .clients.gemini import GeminiClient
-from .clients.fireworks import FireworksClient
-from .clients.ollama import OllamaClient
+from .clients import CLIENT_MODULES, get_client_class
 
 
 
@@ -61,7 +56,7 @@ class azLLMConfigs:
     Raises:
         ValueError: If a client is unsupported or input format is incorrect.
     """
-    def __init__(self, config_file='config.yaml', custom: bool = False):
+    def __init__(self, config_file='config.yaml', custom: bool = False, config_dir: str = 'custom_configs'):
         """
         Initializes the azLLMConfigs instance.
 
@@ -71,16 +66,19 @@ class azLLMConfigs:
         Args:
             config_file (str): The YAML file to store/load custom configurations.
             custom (bool): If True, loads and manages custom configurations.
+            config_dir (str): Directory of the configuration file. Relative paths are resolved
+                against the current directory once, when the instance is created.
         """
 
 
 
         self.config_file = config_file
         self.custom = custom
+        self.config_dir = str(Path(config_dir).resolve())
         
         if self.custom:
-            create_custom_file('custom_configs', self.config_file, template_content)
-            self.custom_configs = load_custom_config('custom_configs', self.config_file)
+            create_custom_file(self.config_dir, self.config_file, template_content)
+            self.custom_configs = load_custom_config(self.config_dir, self.config_file)
         # else:
         #     raise ValueError("Custom configuration is not enabled or available.")
     
@@ -98,13 +96,8 @@ class azLLMConfigs:
             ValueError: If the specified client is unsupported.
         """
         self.clients = {
-            'openai': OpenAIClient.get_default_config,
-            'deepseek': DeepSeekClient.get_default_config,
-            'grok': GrokClient.get_default_config,
-            'anthropic': AnthropicClient.get_default_config,
-            'gemini': GeminiClient.get_default_config,
-            'ollama': OllamaClient.get_default_config,
-            'fireworks': FireworksClient.get_default_config,
+            name: (lambda name=name: get_client_class(name).get_default_config())
+            for name in CLIENT_MODULES
         }
         if client == 'all':
             return {key: self.clients[key]() for key in self.clients}  
@@ -114,7 +107,7 @@ class azLLMConfigs:
             raise ValueError(f"Default configuration for client type '{client}' is not found. Please confirm you are using one of the supporting clients.")
 
     
-    def update_custom_configs(self, client_type: str, models_to_update_or_add: Dict[str, Dict[str, Any]]) -> None:
+    def update_custom_configs(self, client_type: str, models_to_update_or_add: Dict[str, Dict[str, Any]], save: bool = True) -> bool:
         """
         Updates or adds custom configurations for models under a specific client.
         
@@ -125,6 +118,11 @@ class azLLMConfigs:
             client_type (str): The LLM client identifier (e.g., 'openai').
             models_to_update_or_add (dict): A dictionary where keys are model names and 
                                             values are dictionaries with 'version' and 'parameters'.
+            save (bool): Whether to write the configuration file. Pass False to batch several
+                updates and write once with `save_custom_configs`; see also `bulk_update_custom_configs`.
+
+        Returns:
+            bool: True if the configuration changed. The file is only written when it did.
 
         Raises:
             ValueError: If the client type is not supported.
@@ -133,32 +131,85 @@ class azLLMConfigs:
         if client_type not in ACCEPTABLE_CLIENTS:
             raise ValueError(f"Client type {client_type} is not working, please contact us to add.")
         
+        changed = False
         if client_type not in self.custom_configs:
             self.custom_configs[client_type] = {
                 'models': []  
             }
+            changed = True
             print(f"Client {client_type} added to custom_configs.")
 
         client_config = self.custom_configs[client_type]
         models_list = client_config['models']
+        models_index = {}
+        for m in models_list:
+            models_index.setdefault((m['model'], m['version']), m)
 
         for model_name, model_info in models_to_update_or_add.items():
             version = model_info.get('version', 'default') 
             new_parameters = model_info['parameters']
             
-            existing_model = next((m for m in models_list if m['model'] == model_name and m['version'] == version), None)
+            existing_model = models_index.get((model_name, version))
             
             if existing_model:
+                if existing_model.get('parameters') == new_parameters:
+                    continue
                 existing_model['parameters'] = new_parameters
                 print(f"Updated model {model_name} with version {version} for client {client_type}.")
             else:
-                models_list.append({
+                new_model = {
                     'model': model_name,
                     'version': version,
                     'parameters': new_parameters
-                })
+                }
+                models_list.append(new_model)
+                models_index[(model_name, version)] = new_model
                 print(f"Added new model {model_name} with version {version} for client {client_type}.")
-        save_custom_configs(self.config_file, self.custom_configs)
+            changed = True
+        if changed and save:
+            self.save_custom_configs()
+        return changed
+
+    def bulk_update_custom_configs(self, updates: Dict[str, Dict[str, Dict[str, Any]]]) -> bool:
+        """
+        Updates or adds many models across clients and writes the configuration file once.
+
+        All client types are validated before anything is changed.
+
+        Args:
+            updates (dict): Mapping of client type to the `models_to_update_or_add` dictionary
+                accepted by `update_custom_configs`.
+
+        Returns:
+            bool: True if the configuration changed. The file is only written when it did.
+
+        Raises:
+            ValueError: If any client type is not supported.
+
+        Example:
+            >>> cfg = azLLMConfigs(custom=True)
+            >>> cfg.bulk_update_custom_configs({
+            ...     'openai': {'gpt-4o': {'version': 'v2', 'parameters': {'temperature': 0.3}}},
+            ...     'grok': {'grok-3': {'version': 'v1', 'parameters': {'max_tokens': 512}}},
+            ... })
+            True
+        """
+        unsupported = [client_type for client_type in updates if client_type not in ACCEPTABLE_CLIENTS]
+        if unsupported:
+            raise ValueError(f"Client type {unsupported[0]} is not working, please contact us to add.")
+
+        changed = False
+        for client_type, models_to_update_or_add in updates.items():
+            changed = self.update_custom_configs(client_type, models_to_update_or_add, save=False) or changed
+        if changed:
+            self.save_custom_configs()
+        return changed
+
+    def save_custom_configs(self) -> None:
+        """
+        Writes the custom configurations to the configuration file atomically.
+        """
+        save_custom_configs(self.config_file, self.custom_configs, self.config_dir)
 
 
 __all__ = ['azLLMConfigs']
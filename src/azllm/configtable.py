@@ -0,0 +1,170 @@
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, NamedTuple, Optional, Tuple
+
+from .pool import ClientPool
+from .router import POOLS_KEY, ModelPool, parse_pools
+from .routing import ROUTES_KEY, Route, parse_routes
+
+
+CLIENT_DEFAULT_SECTIONS = ('parameters', 'rate_limits', 'retry', 'circuit_breaker')
+# Top-level keys of the custom configuration that are not clients.
+RESERVED_KEYS = (ROUTES_KEY, POOLS_KEY)
+
+
+def merge_client_defaults(client_configs: Mapping[str, Any], model_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Applies client-level `parameters`, `rate_limits`, `retry` and `circuit_breaker` blocks as defaults for a model.
+
+    Args:
+        client_configs (Mapping): Configuration of the client, including its `models` list.
+        model_config (dict): Configuration of one model of the client.
+
+    Returns:
+        dict: The model configuration with client-level settings merged in; keys set on the
+        model take precedence.
+    """
+    merged = model_config
+    for section in CLIENT_DEFAULT_SECTIONS:
+        defaults = client_configs.get(section) or {}
+        if defaults:
+            merged = {**merged, section: {**defaults, **(model_config.get(section) or {})}}
+    return merged
+
+
+def split_client_model_version(cmv: str) -> Tuple[str, str, str]:
+    """
+    Splits a 'client:model::version' string; see `azLLM.split_client_model_version`.
+    """
+    if not cmv:
+        raise ValueError("Empty model identifier.")
+    try:
+        if "::" in cmv:
+            client, rest = cmv.split(":", 1)
+            model, version = rest.rsplit("::", 1)
+        elif ":" in cmv:
+            client, model = cmv.split(":", 1)
+            version = "default"
+        else:
+            client, model, version = cmv, "default", "default"
+        return client, model, version
+    except Exception:
+        raise ValueError(f"Invalid format: '{cmv}'. Expected 'client:model::version' or similar.")
+
+
+def freeze(value: Any) -> Any:
+    """
+    Returns a read-only copy of nested dicts and lists (as mapping proxies and tuples).
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Returns a plain, mutable deep copy of a value frozen by `freeze` (as dicts and lists).
+
+    Configurations leave the table thawed: clients pass `parameters.kwargs` to the provider SDKs,
+    which cannot serialize mapping proxies.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ResolvedConfig(NamedTuple):
+    """
+    A model configuration as stored in the custom configuration, and resolved for its client.
+
+    Attributes:
+        model_config (Mapping): The model entry as written in the configuration file.
+        config (Mapping): The read-only configuration with client-level defaults merged in.
+        pool_key (Hashable): Key of the client instance in the `ClientPool`.
+    """
+    model_config: Mapping[str, Any]
+    config: Mapping[str, Any]
+    pool_key: Hashable
+
+
+class ConfigTable:
+    """
+    An immutable index of resolved model configurations keyed by `(client, model, version)`.
+
+    The custom configuration is compiled once: every model entry is merged with its client-level
+    defaults, frozen, and given a precomputed client-pool key, so resolving a
+    `client:model::version` string is a dictionary lookup instead of a scan of the `models` list.
+    Like the scan it replaces, the first entry wins for duplicate keys, and `(client, 'default',
+    'default')` resolves to the client's first model with version 'default'. The `routes` and
+    `pools` blocks are compiled into `routes` and `pools`.
+
+    Example:
+        >>> table = ConfigTable(config)
+        >>> table.lookup('openai', 'gpt-4o-mini', 'v1').config['parameters']['temperature']
+        0.7
+    """
+    def __init__(self, config: Optional[Mapping[str, Any]]):
+        """
+        Args:
+            config (Mapping, optional): The loaded custom configuration.
+        """
+        entries: Dict[Tuple[str, str, str], ResolvedConfig] = {}
+        defaults: Dict[str, ResolvedConfig] = {}
+        for client_name, client_configs in (config or {}).items():
+            if client_name in RESERVED_KEYS or not isinstance(client_configs, Mapping):
+                continue
+            for model_config in client_configs.get('models') or []:
+                version = model_config.get('version', 'default')
+                key = (client_name, model_config['model'], version)
+                if key in entries:
+                    continue
+                resolved = merge_client_defaults(client_configs, model_config)
+                entry = ResolvedConfig(freeze(model_config), freeze(resolved), ClientPool.make_key(client_name, resolved))
+                entries[key] = entry
+                if version == 'default':
+                    defaults.setdefault(client_name, entry)
+        self._entries = MappingProxyType(entries)
+        self._defaults = MappingProxyType(defaults)
+        self._clients = frozenset(name for name, value in (config or {}).items() if value and name not in RESERVED_KEYS)
+        self.routes: Mapping[str, Route] = parse_routes(config)
+        self.pools: Mapping[str, ModelPool] = parse_pools(config)
+
+    def lookup(self, client_name: str, model_name: str, version: str = 'default') -> ResolvedConfig:
+        """
+        Returns the resolved configuration of a model.
+
+        Args:
+            client_name (str): Name of the client.
+            model_name (str): Name of the model, or 'default'.
+            version (str): Model version.
+
+        Returns:
+            ResolvedConfig: The resolved configuration.
+
+        Raises:
+            ValueError: If the client or model configuration is not found.
+        """
+        if model_name == 'default' and version == 'default':
+            entry = self._defaults.get(client_name)
+        else:
+            entry = self._entries.get((client_name, model_name, version))
+        if entry is None:
+            if client_name not in self._clients:
+                raise ValueError(f"Client configs for '{client_name}' not found.")
+            raise ValueError(f"Model configuration for '{client_name}', '{model_name}', '{version}' not found.")
+        return entry
+
+    def items(self):
+        return self._entries.items()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+
+__all__ = ['ConfigTable', 'ResolvedConfig', 'CLIENT_DEFAULT_SECTIONS', 'merge_client_defaults', 'split_client_model_version', 'freeze', 'thaw', 'RESERVED_KEYS']
@@ -0,0 +1,211 @@
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, NamedTuple, Optional
+
+from .ratelimit import CHARS_PER_TOKEN
+
+if TYPE_CHECKING:
+    from .core import azLLM
+    from .streaming import AsyncTextStream, TextStream
+
+
+# Chat formats add a few tokens per message for the role and separators.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_message_tokens(content: str) -> int:
+    """
+    Roughly estimates the prompt tokens of one chat message.
+
+    Args:
+        content (str): Content of the message.
+
+    Returns:
+        int: Estimated number of tokens, including the per-message overhead.
+    """
+    return len(content) // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS
+
+
+class Turn(NamedTuple):
+    """
+    One exchange of a conversation.
+
+    Attributes:
+        user (str): The user's prompt.
+        assistant (str): The model's reply.
+        tokens (int): Estimated prompt tokens of both messages, computed once when the turn is added.
+    """
+    user: str
+    assistant: str
+    tokens: int
+
+
+def reply_text(reply: Any) -> str:
+    """
+    Returns the text of a reply from `generate_text`, including structured (`parse=True`) replies.
+    """
+    if isinstance(reply, str):
+        return reply
+    content = getattr(reply, 'content', None)
+    if isinstance(content, str):
+        return content
+    raw = getattr(reply, 'raw', None)
+    if raw is not None:
+        try:
+            return raw.choices[0].message.content or ''
+        except (AttributeError, IndexError):
+            pass
+    return str(reply)
+
+
+class Conversation:
+    """
+    A multi-turn chat with one `client:model::version`, keeping its message history.
+
+    Each call sends the system message, the retained history and the new prompt, then records
+    the exchange. History is stored as compact `Turn` tuples and only expanded into message
+    dictionaries when a request is built. Two limits keep requests bounded:
+
+    - `max_turns` keeps a sliding window of the most recent exchanges; older turns are discarded.
+    - `max_history_tokens` sends only the most recent turns whose estimated tokens, together with
+      the new prompt, fit the budget. Older turns are kept but not sent.
+
+    Turns are never split, so the model always sees complete user/assistant pairs.
+
+    Example:
+        >>> chat = azLLM().conversation("openai:gpt-4o-mini::v1", max_turns=20, max_history_tokens=4000)
+        >>> chat.send("My name is Ada.")
+        >>> chat.send("What is my name?")
+        'Your name is Ada.'
+    """
+    def __init__(self, llm: 'azLLM', client_model_version: str, system_message: Optional[str] = None,
+                 max_turns: Optional[int] = None, max_history_tokens: Optional[int] = None,
+                 token_counter: Optional[Callable[[str], int]] = None, kwargs: Optional[dict] = None):
+        """
+        Args:
+            llm (azLLM): The manager used to send requests.
+            client_model_version (str): Format 'client:model::version'.
+            system_message (str, optional): Overrides the model's configured system message.
+            max_turns (int, optional): Number of most recent exchanges to keep. Unlimited by default.
+            max_history_tokens (int, optional): Token budget for the history and the new prompt.
+                Unlimited by default.
+            token_counter (Callable, optional): Returns the tokens of one message's content.
+                Defaults to a character-based estimate.
+            kwargs (dict, optional): Generation parameters applied to every request.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_turns is not None and max_turns < 1:
+            raise ValueError("max_turns must be at least 1.")
+        if max_history_tokens is not None and max_history_tokens < 1:
+            raise ValueError("max_history_tokens must be at least 1.")
+        self.llm = llm
+        self.client_model_version = client_model_version
+        self.system_message = system_message
+        self.max_turns = max_turns
+        self.max_history_tokens = max_history_tokens
+        self.count_tokens = token_counter or estimate_message_tokens
+        self.kwargs = dict(kwargs or {})
+        self.turns: Deque[Turn] = deque(maxlen=max_turns)
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def add_turn(self, user: str, assistant: str) -> None:
+        """
+        Appends an exchange to the history, e.g. to seed a conversation.
+        """
+        self.turns.append(Turn(user, assistant, self.count_tokens(user) + self.count_tokens(assistant)))
+
+    def clear(self) -> None:
+        """
+        Removes the whole history.
+        """
+        self.turns.clear()
+
+    def history(self, prompt: str = '') -> List[Dict[str, str]]:
+        """
+        Returns the history messages sent along with `prompt`.
+
+        Args:
+            prompt (str): The next prompt; its tokens count against `max_history_tokens`.
+
+        Returns:
+            list: User and assistant messages, oldest first.
+        """
+        selected = self.turns
+        if self.max_history_tokens is not None:
+            budget = self.max_history_tokens - self.count_tokens(prompt)
+            if self.system_message is not None:
+                budget -= self.count_tokens(self.system_message)
+            count = 0
+            for turn in reversed(self.turns):
+                budget -= turn.tokens
+                if budget < 0:
+                    break
+                count += 1
+            selected = islice(self.turns, len(self.turns) - count, None)
+        messages = []
+        for turn in selected:
+            messages.append({"role": "user", "content": turn.user})
+            messages.append({"role": "assistant", "content": turn.assistant})
+        return messages
+
+    def _request_kwargs(self, prompt: str, kwargs: Optional[dict]) -> dict:
+        request_kwargs = {**self.kwargs, **(kwargs or {}), 'history': self.history(prompt)}
+        if self.system_message is not None:
+            request_kwargs.setdefault('system_message', self.system_message)
+        return request_kwargs
+
+    def send(self, prompt: str, kwargs: Optional[dict] = None, parse: bool = False) -> Any:
+        """
+        Sends a prompt with the conversation history and records the exchange.
+
+        Args:
+            prompt (str): Text prompt.
+            kwargs (dict, optional): Additional generation parameters for this request.
+            parse (bool): Whether to parse the output.
+
+        Returns:
+            The reply, as returned by `azLLM.generate_text`.
+
+        Raises:
+            ValueError, RuntimeError: As raised by `azLLM.generate_text`. Failed requests are not recorded.
+        """
+        reply = self.llm.generate_text(self.client_model_version, prompt, self._request_kwargs(prompt, kwargs), parse)
+        self.add_turn(prompt, reply_text(reply))
+        return reply
+
+    async def asend(self, prompt: str, kwargs: Optional[dict] = None, parse: bool = False) -> Any:
+        """
+        Asynchronous version of `send`.
+        """
+        reply = await self.llm.agenerate_text(self.client_model_version, prompt, self._request_kwargs(prompt, kwargs), parse)
+        self.add_turn(prompt, reply_text(reply))
+        return reply
+
+    def stream(self, prompt: str, kwargs: Optional[dict] = None) -> 'TextStream':
+        """
+        Streams the reply to a prompt. The exchange is recorded once the stream is exhausted.
+
+        Returns:
+            TextStream: Iterator of text deltas.
+        """
+        stream = self.llm.stream_text(self.client_model_version, prompt, self._request_kwargs(prompt, kwargs))
+        stream.add_done_callback(lambda summary: self.add_turn(prompt, summary.text))
+        return stream
+
+    def astream(self, prompt: str, kwargs: Optional[dict] = None) -> 'AsyncTextStream':
+        """
+        Asynchronous version of `stream`.
+
+        Returns:
+            AsyncTextStream: Asynchronous iterator of text deltas.
+        """
+        stream = self.llm.astream_text(self.client_model_version, prompt, self._request_kwargs(prompt, kwargs))
+        stream.add_done_callback(lambda summary: self.add_turn(prompt, summary.text))
+        return stream
+
+
+__all__ = ['Conversation', 'Turn', 'estimate_message_tokens', 'MESSAGE_OVERHEAD_TOKENS']
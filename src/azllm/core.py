@@ -1,18 +1,28 @@
-from typing import List, Dict, Any
+import asyncio
+import threading
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Optional, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .utils import load_custom_config
 from .base import UNIClient
+from .pool import ClientPool, DEFAULT_POOL_SIZE
+from .batch import BatchJob
+from .breaker import CircuitBreaker, circuit_breakers
+from .cache import ResponseCache, MemoryCache
+from .metrics import MetricsRegistry, registry
+from .retry import fail_fast
+from .streaming import TextStream, AsyncTextStream
+from .conversation import Conversation
+from .concurrency import bounded_map, abounded_gather
+from .hedging import HedgePolicy, hedged_call, ahedged_call
+from .singleflight import SingleFlight, unique_requests
 
 
-from .clients.openai import OpenAIClient
-from .clients.deepseek import DeepSeekClient
-from .clients.grok import GrokClient
-from .clients.anthropic import AnthropicClient
-from .clients.gemini import GeminiClient
-from .clients.ollama import OllamaClient
-from .clients.fireworks import FireworksClient
-
+from .clients import ClientRegistry
+from .configtable import ConfigTable, merge_client_defaults, split_client_model_version, thaw
+from .router import LatencyRouter, ModelPool, POOL_PREFIX
+from .routing import Route, RoutingError, annotate, should_failover
 
 
 class azLLM:
@@ -23,39 +33,172 @@ class azLLM:
         config_file (str): Path to the configuration file.
         custom (bool): Whether to use custom configuration.
         config (dict): Loaded configuration from file if custom is True.
-        clients (dict): Mapping of client names to their respective classes.
+        config_table (ConfigTable): Index of resolved model configurations compiled from `config`.
+        watcher (ConfigWatcher): Watcher reloading the configuration file, if started with `watch_config`.
+        clients (ClientRegistry): Mapping of client names to their classes, imported lazily.
+        pool (ClientPool): LRU pool of client instances reused across calls.
+        cache (ResponseCache): Optional response cache shared by all clients.
+        single_flight (SingleFlight): Optional deduplication of identical concurrent requests.
+        metrics (MetricsRegistry): Registry recording latency, token and error metrics of every call.
+        hedge_policy (HedgePolicy): Policy used by calls made with `hedge=True`.
+        router (LatencyRouter): Health statistics used to pick a target of a `pool:<name>`.
+
+    Example:
+        >>> with azLLM() as azllm:
+        ...     azllm.generate_text("openai", "Hello!")
     """
-    def __init__(self, config_file ='config.yaml', custom: str = False):
+    def __init__(self, config_file ='config.yaml', custom: str = False, pool_size: int = DEFAULT_POOL_SIZE,
+                 cache: Union[bool, ResponseCache] = None, metrics: MetricsRegistry = None,
+                 single_flight: Union[bool, SingleFlight] = None):
         """
         Initializes the azLLM instance and loads configurations.
 
         Args:
             config_file (str): Path to the configuration file.
             custom (bool): Whether to use custom configuration.
+            pool_size (int): Maximum number of client instances kept alive for reuse.
+            cache (bool or ResponseCache, optional): Response cache for repeated requests.
+                Pass True for an in-memory LRU cache, or a `MemoryCache`/`SQLiteCache` instance.
+            metrics (MetricsRegistry, optional): Registry for call metrics. Defaults to the
+                process-wide `azllm.metrics.registry`.
+            single_flight (bool or SingleFlight, optional): Share one call between identical requests
+                (same model, prompt and parameters) in flight at the same time. Pass True for a new
+                `SingleFlight`, or an instance to share it between `azLLM` instances.
         """
         self.config_file = config_file
         self.custom = custom
+        self.watcher = None
+        self._config_lock = threading.Lock()
+        self.pool = ClientPool(pool_size)
+        # Not `cache or None`: an empty cache is falsy.
+        self.cache = MemoryCache() if cache is True else (cache if isinstance(cache, ResponseCache) else None)
+        self.single_flight = SingleFlight() if single_flight is True else (single_flight or None)
+        self.metrics = metrics if metrics is not None else registry
+        self.hedge_policy = HedgePolicy()
+        self.router = LatencyRouter()
 
         if self.custom:
             self.config = load_custom_config('custom_configs', self.config_file)
         else:
             self.config = None
 
-        self.clients = {
-            'openai': OpenAIClient,
-            'deepseek': DeepSeekClient,
-            'grok': GrokClient,
-            'anthropic': AnthropicClient,
-            'gemini': GeminiClient,
-            'ollama': OllamaClient,
-            'fireworks': FireworksClient,
-        }
+        # Provider modules (and the SDKs they use) are imported on first use.
+        self.clients = ClientRegistry()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self._config_state[0]
+
+    @config.setter
+    def config(self, config: Dict[str, Any]) -> None:
+        # The configuration and its compiled table are swapped together in a single assignment,
+        # so concurrent requests always see a matching pair.
+        self._config_state = (config, None)
+
+    @property
+    def config_table(self) -> ConfigTable:
+        """
+        The resolved-configuration table compiled from `config`.
+
+        It is built on first use and rebuilt when `config` is replaced. After changing the
+        loaded configuration in place, call `invalidate_config()`.
+        """
+        config, table = self._config_state
+        if table is None:
+            table = ConfigTable(config)
+            with self._config_lock:
+                if self._config_state[0] is config:
+                    self._config_state = (config, table)
+        return table
+
+    def invalidate_config(self) -> None:
+        """
+        Discards the compiled configuration table so it is rebuilt from `config` on next use.
+        """
+        self.config = self.config
+
+    def _apply_config(self, config: Dict[str, Any], table: ConfigTable) -> None:
+        self._config_state = (config, table)
+
+    def watch_config(self, interval: float = 2.0, on_error: Callable[[Exception], None] = None) -> 'ConfigWatcher':
+        """
+        Reloads the custom configuration file automatically when it changes.
+
+        A background thread polls the file, re-parses and validates it, and swaps in the new
+        configuration atomically. Requests already in flight keep the client they resolved;
+        clients of unchanged models stay pooled with their warm connections. Invalid files
+        are ignored and the previous configuration stays in effect.
+
+        Args:
+            interval (float): Seconds between checks of the file.
+            on_error (Callable, optional): Called with the error when a changed file is invalid.
+
+        Returns:
+            ConfigWatcher: The running watcher; it is stopped by `close()`.
+
+        Raises:
+            ValueError: If custom configurations are not enabled.
+
+        Example:
+            >>> azllm = azLLM(custom=True)
+            >>> azllm.watch_config(interval=5)
+        """
+        if not self.custom:
+            raise ValueError("Watching the configuration requires custom=True.")
+        from .watcher import ConfigWatcher
+
+        with self._config_lock:
+            if self.watcher is None:
+                path = Path.cwd() / 'custom_configs' / self.config_file
+                self.watcher = ConfigWatcher(path, self._apply_config, interval, on_error)
+        return self.watcher.start()
+
+    def stop_watching(self) -> None:
+        """
+        Stops the configuration watcher started by `watch_config`.
+        """
+        with self._config_lock:
+            watcher, self.watcher = self.watcher, None
+        if watcher is not None:
+            watcher.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes all pooled clients and their HTTP connections.
+
+        The instance remains usable; clients are re-created on the next call.
+        A configuration watcher started with `watch_config` is stopped.
+        """
+        self.stop_watching()
+        self.pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes all pooled clients, including their asynchronous HTTP connections.
+        """
+        self.stop_watching()
+        await self.pool.aclose()
 
     def get_client(self, client_name: str, model_config: Dict[str, Any] = None) -> UNIClient: 
 
         """
         Returns an instance of the specified client initialized with optional model configuration.
 
+        Instances are pooled by client name and model configuration, so repeated calls
+        with the same arguments return the same client and reuse its connections.
+
         Args:
             client_name (str): Name of the LLM client.
             model_config (dict, optional): Configuration for the specific model.
@@ -76,12 +219,23 @@ class azLLM:
         if client_name not in self.clients:
             raise ValueError(f"Client {client_name} not found.")
 
+        key = self.pool.make_key(client_name, model_config)
         if model_config is not None:
             try:
-                return self.clients[client_name](model_config)
+                return self.pool.get_or_create(key, lambda: self._create_client(client_name, model_config))
             except Exception as e:
                 raise ValueError(f"Invalid model configuration: {e}")
-        return self.clients[client_name]()
+        return self.pool.get_or_create(key, lambda: self._create_client(client_name))
+
+    def _create_client(self, client_name: str, model_config: Dict[str, Any] = None) -> UNIClient:
+        if model_config is not None:
+            client = self.clients[client_name](model_config)
+        else:
+            client = self.clients[client_name]()
+        client.cache = self.cache
+        client.single_flight = self.single_flight
+        client.metrics = self.metrics
+        return client
     
     def split_client_model_version(self, cmv: str):
         """
@@ -118,20 +272,7 @@ class azLLM:
             >>> azllm.split_client_model_version("openai")
             ('openai', 'default', 'default')
         """
-        if not cmv:
-            raise ValueError("Empty model identifier.")
-        try:
-            if "::" in cmv:
-                client, rest = cmv.split(":", 1)
-                model, version = rest.rsplit("::", 1)
-            elif ":" in cmv:
-                client, model = cmv.split(":", 1)
-                version = "default"
-            else:
-                client, model, version = cmv, "default", "default"
-            return client, model, version
-        except Exception:
-            raise ValueError(f"Invalid format: '{cmv}'. Expected 'client:model::version' or similar.")
+        return split_client_model_version(cmv)
 
 
     def get_model_config(self, client_name:str, model_name: str, version:str = 'default') -> Dict[str, Any]:
@@ -144,7 +285,7 @@ class azLLM:
             version (str): Model version.
 
         Returns:
-            dict: Configuration of the model.
+            dict: A copy of the configuration of the model, as written in the configuration file.
 
         Raises:
             ValueError: If client or model config is not found.
@@ -152,38 +293,202 @@ class azLLM:
         Example:
             >>> azllm = azLLM(custom=True)
             >>> model_config = azllm.get_model_config('openai', 'gpt-3', 'v1')
-            >>> isinstance(model_config, dict)
-            True
+            >>> model_config['version']
+            'v1'
         """
-        client_configs = self.config.get(client_name)
-        if not client_configs:
-            raise ValueError(f"Client configs for '{client_name}' not found.")
-        models_configs = client_configs.get('models', {})
-        model_config = None 
-        for configs_model_i in models_configs:
-            if configs_model_i['model'] == model_name and configs_model_i['version'] == version:
-                model_config = configs_model_i
-                break
-            elif model_name == 'default' and version == 'default' and configs_model_i['version'] == 'default':
-                model_config = configs_model_i
-                break
-        if model_config is None:
-            raise ValueError(f"Model configuration for '{client_name}', '{model_name}', '{version}' not found.")
-
-        return model_config
+        return thaw(self.config_table.lookup(client_name, model_name, version).model_config)
     
-    def generate_text(self, client_model_version: str, prompt: str, kwargs: dict = None, parse: bool = False) -> str:
+    def _merge_client_defaults(self, client_name: str, model_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Applies client-level settings from the custom configuration as defaults for a model.
+
+        Client-level `parameters`, `rate_limits` and `retry` blocks apply to every model of
+        the client; keys set on the model itself take precedence, e.g.:
+
+        ::
+
+            openai:
+                parameters:
+                    max_concurrency: 8
+                rate_limits:
+                    requests_per_minute: 500
+                    tokens_per_minute: 200000
+                retry:
+                    max_attempts: 5
+                models:
+                    - model: gpt-4o-mini
+                      version: default
+                      parameters:
+                          temperature: 0.7
+
+        Args:
+            client_name (str): Name of the client.
+            model_config (dict): Configuration of the model.
+
+        Returns:
+            dict: The model configuration with client-level settings merged in.
+        """
+        return merge_client_defaults(self.config.get(client_name, {}), model_config)
+
+    def get_route(self, name: str) -> Optional[Route]:
+        """
+        Returns the failover route configured under `name` in the `routes` block, if any.
+
+        Args:
+            name (str): Route name, often a 'client:model::version' string.
+
+        Returns:
+            Route: The route, or None if custom configurations are disabled or no route has this name.
+        """
+        if self.custom and self.config:
+            return self.config_table.routes.get(name)
+        return None
+
+    def get_pool(self, name: str) -> Optional[ModelPool]:
+        """
+        Returns the model pool addressed by `name`, e.g. 'pool:fast-chat'.
+
+        Args:
+            name (str): 'pool:' followed by a pool name of the `pools` block.
+
+        Returns:
+            ModelPool: The pool, or None if `name` does not address a configured pool.
+        """
+        if self.custom and self.config and name and name.startswith(POOL_PREFIX):
+            return self.config_table.pools.get(name[len(POOL_PREFIX):])
+        return None
+
+    def _find_pool(self, client_model_version: str) -> Optional[ModelPool]:
+        """
+        Returns the pool of a `pool:<name>` identifier, or None for other identifiers.
+        """
+        if not client_model_version or not client_model_version.startswith(POOL_PREFIX):
+            return None
+        pool = self.get_pool(client_model_version)
+        if pool is None:
+            raise ValueError(f"Pool '{client_model_version[len(POOL_PREFIX):]}' not found.")
+        return pool
+
+    def _pool_target(self, client_model_version: str) -> Optional[str]:
+        """
+        Picks the target of a `pool:<name>` identifier, or returns None for other identifiers.
+
+        The pick is not recorded by the router: requests sent to it must go through `router.call`,
+        `router.acall` or `_track_pool_stream`.
+        """
+        pool = self._find_pool(client_model_version)
+        if pool is None:
+            return None
+        # Skip backends whose circuit is open, unless none is available.
+        available = [target for target in pool.targets if self.is_available(target)]
+        return self.router.choose(available or pool.targets)
+
+    def circuit_breaker(self, client_model_version: str) -> Optional[CircuitBreaker]:
+        """
+        Returns the circuit breaker guarding a target.
+
+        Breakers are configured with a `circuit_breaker` block on a client or model, and shared by
+        all models of the client (or per model with `scope: model`).
+
+        Args:
+            client_model_version (str): Format 'client:model::version', or a route name.
+
+        Returns:
+            CircuitBreaker: The breaker, or None if the target has none.
+        """
+        return self._resolve_client(client_model_version).circuit_breaker
+
+    def is_available(self, client_model_version: str) -> bool:
+        """
+        Whether a request to a target would be sent now, i.e. its circuit is not open.
+
+        Args:
+            client_model_version (str): Format 'client:model::version', or a route name.
+
+        Returns:
+            bool: False if the target's circuit breaker is open or the target cannot be resolved.
+
+        Example:
+            >>> azllm = azLLM(custom=True)
+            >>> targets = [t for t in ["openai:gpt-4o-mini::v1", "grok:grok-2::v1"] if azllm.is_available(t)]
+        """
+        try:
+            breaker = self.circuit_breaker(client_model_version)
+        except ValueError:
+            return False
+        return breaker is None or breaker.available()
+
+    def circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the state of every circuit breaker, keyed by client (or 'client:model').
+
+        Returns:
+            dict: For each breaker, its `state` ('closed', 'open' or 'half_open'), the `failures` and
+            `calls` in its window, how often it `opened`, the requests `rejected` while open and
+            the seconds until a trial request is allowed (`retry_in`).
+        """
+        return {key: breaker.snapshot() for key, breaker in circuit_breakers().items()}
+
+    def _resolve_client(self, client_model_version: str, follow_routes: bool = True) -> UNIClient:
+        """
+        Resolves a 'client:model::version' string to a pooled client instance.
+
+        Custom configurations are used when enabled, looked up in the precompiled `config_table`;
+        otherwise the client's defaults apply. The name of a route resolves to its first target,
+        and a `pool:<name>` to the target the router picks.
+
+        Args:
+            client_model_version (str): Format 'client:model::version', a route name or 'pool:<name>'.
+            follow_routes (bool): Whether route and pool names are resolved.
+
+        Returns:
+            UNIClient: Initialized client instance.
+
+        Raises:
+            ValueError: If the identifier, client or model configuration is invalid.
+        """
+        route = None
+        if follow_routes:
+            client_model_version = self._pool_target(client_model_version) or client_model_version
+            route = self.get_route(client_model_version)
+        if route is not None:
+            client_model_version = route.targets[0]
+        if self.custom and self.config:
+            client_name, model, version = self.split_client_model_version(client_model_version)
+            entry = self.config_table.lookup(client_name, model, version)
+            if client_name not in self.clients:
+                raise ValueError(f"Client {client_name} not found.")
+            try:
+                return self.pool.get_or_create(entry.pool_key, lambda: self._create_client(client_name, thaw(entry.config)))
+            except Exception as e:
+                raise ValueError(f"Invalid model configuration: {e}")
+
+        client_name, _, _ = self.split_client_model_version(client_model_version)
+        return self.get_client(client_name)
+
+    def generate_text(self, client_model_version: str, prompt: str, kwargs: dict = None, parse: bool = False,
+                      hedge: Union[bool, HedgePolicy] = None) -> str:
         """
         Generates text using a specific client and model for a given prompt.
 
+        If a route is configured under `client_model_version`, its targets are tried in order:
+        after a retryable failure or timeout of one target, the request is sent to the next one.
+        A `pool:<name>` sends the request to the pool's target with the best health score.
+
         Args:
-            client_model_version (str): Format 'client:model::version'.
+            client_model_version (str): Format 'client:model::version', a route name or 'pool:<name>'.
             prompt (str): Text prompt.
             kwargs (dict, optional): Additional generation parameters.
             parse (bool): Whether to parse the output.
+            hedge (bool or HedgePolicy, optional): Send a duplicate request when this one is slower than
+                the policy's latency quantile, and return whichever finishes first. True uses `hedge_policy`.
 
         Returns:
-            str: Generated text.
+            str: Generated text. Through a route or pool, a `RoutedText` whose `target` names the
+            target that served it.
+
+        Raises:
+            RoutingError: If every target of the route failed.
 
         Example:
             >>> azllm = azLLM()
@@ -193,15 +498,78 @@ class azLLM:
         """
         kwargs = kwargs or {} 
 
+        policy = self._hedge_policy(hedge)
+        if policy is not None:
+            delay = self._hedge_delay(policy, client_model_version)
+            return hedged_call(lambda: self.generate_text(client_model_version, prompt, kwargs, parse),
+                               lambda: self.generate_text(policy.target or client_model_version, prompt, kwargs, parse),
+                               delay, policy)
+
+        target = self._select_pool_target(client_model_version)
+        if target is not None:
+            result = self.router.call(target, lambda: self.generate_text(target, prompt, kwargs, parse))
+            return result if getattr(result, 'target', None) else annotate(result, target, [])
+
+        route = self.get_route(client_model_version)
+        if route is None:
+            return self._generate(client_model_version, prompt, kwargs, parse)
+
+        failures = []
+        kwargs = self._route_kwargs(route, kwargs)
+        for position, target in enumerate(route.targets, 1):
+            try:
+                with fail_fast(position < len(route.targets)):
+                    return annotate(self._generate(target, prompt, kwargs, parse), target, failures)
+            except Exception as e:
+                if not should_failover(e):
+                    raise
+                failures.append((target, str(e)))
+        raise RoutingError(route.name, failures)
+
+    def _hedge_policy(self, hedge: Union[bool, HedgePolicy, None]) -> Optional[HedgePolicy]:
+        if hedge is True:
+            return self.hedge_policy
+        return hedge or None
+
+    def _select_pool_target(self, client_model_version: str) -> Optional[str]:
         try:
-            if self.custom and self.config:
-                client_name, model, version = self.split_client_model_version(client_model_version)
-                model_config = self.get_model_config(client_name, model, version) 
-                client = self.get_client(client_name, model_config)
-            else:
-                client_name, _, _ = self.split_client_model_version(client_model_version)
-                client = self.get_client(client_name)
+            return self._pool_target(client_model_version)
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
 
+    def _metrics_key(self, client_model_version: str) -> str:
+        try:
+            return self._resolve_client(client_model_version).metrics_key
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
+
+    def _hedge_delay(self, policy: HedgePolicy, client_model_version: str) -> float:
+        try:
+            pool = self._find_pool(client_model_version)
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
+        # The target of a pool is picked when the request is sent, so wait for the slowest one.
+        targets = pool.targets if pool is not None else (client_model_version,)
+        return max(policy.delay(self.metrics, self._metrics_key(target)) for target in targets)
+
+    def _track_pool_stream(self, target: str, stream: Any, started_at: float) -> Any:
+        """
+        Records a stream to a pool target in the router once it ends.
+        """
+        stream.add_done_callback(lambda summary: self.router.finished(target, started_at))
+        stream.add_abort_callback(lambda error: self.router.abandoned(target) if error is None
+                                  else self.router.finished(target, started_at, error))
+        return stream
+
+    @staticmethod
+    def _route_kwargs(route: Route, kwargs: dict) -> dict:
+        if route.timeout is None:
+            return kwargs
+        return {'timeout': route.timeout, **kwargs}
+
+    def _generate(self, client_model_version: str, prompt: str, kwargs: dict, parse: bool) -> str:
+        try:
+            client = self._resolve_client(client_model_version, follow_routes=False)
             return client.generate_text(prompt, kwargs, parse)
         
         except ValueError as e:
@@ -209,7 +577,72 @@ class azLLM:
         except Exception as e:
             raise RuntimeError(f"An unexpected error occurred while generating text: {str(e)}") from e
 
-    def batch_generate(self, client_model_version: str, prompts: List[str], kwargs: List[dict] = None, parse: List[bool] = None) -> List[str]: 
+    def stream_text(self, client_model_version: str, prompt: str, kwargs: dict = None) -> TextStream:
+        """
+        Streams text from a specific client and model, yielding content deltas as they arrive.
+
+        Args:
+            client_model_version (str): Format 'client:model::version'.
+            prompt (str): Text prompt.
+            kwargs (dict, optional): Additional generation parameters.
+
+        Returns:
+            TextStream: Iterator of text deltas. After it is exhausted, `summary()` returns the
+            full text, `finish_reason` and `usage`.
+
+        Example:
+            >>> azllm = azLLM()
+            >>> stream = azllm.stream_text("openai:gpt-4o-mini::v1", "Tell me a joke.")
+            >>> for delta in stream:
+            ...     print(delta, end="")
+        """
+        kwargs = kwargs or {}
+
+        try:
+            target = self._pool_target(client_model_version)
+            client = self._resolve_client(target or client_model_version)
+            if target is None:
+                return client.stream_text(prompt, kwargs)
+            started_at = self.router.started(target)
+            try:
+                stream = client.stream_text(prompt, kwargs)
+            except Exception as e:
+                self.router.finished(target, started_at, e)
+                raise
+            return self._track_pool_stream(target, stream, started_at)
+
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
+        except Exception as e:
+            raise RuntimeError(f"An unexpected error occurred while generating text: {str(e)}") from e
+
+    def conversation(self, client_model_version: str, system_message: str = None, max_turns: int = None,
+                     max_history_tokens: int = None, token_counter: Callable[[str], int] = None,
+                     kwargs: dict = None) -> Conversation:
+        """
+        Starts a multi-turn conversation that keeps its message history.
+
+        Args:
+            client_model_version (str): Format 'client:model::version'.
+            system_message (str, optional): Overrides the model's configured system message.
+            max_turns (int, optional): Number of most recent exchanges to keep.
+            max_history_tokens (int, optional): Token budget for the history and the new prompt.
+            token_counter (Callable, optional): Returns the tokens of one message's content.
+            kwargs (dict, optional): Generation parameters applied to every request.
+
+        Returns:
+            Conversation: The conversation; see `Conversation.send`, `asend`, `stream` and `astream`.
+
+        Example:
+            >>> azllm = azLLM()
+            >>> chat = azllm.conversation("openai:gpt-4o-mini::v1", max_turns=10)
+            >>> chat.send("My name is Ada.")
+            >>> chat.send("What is my name?")
+        """
+        return Conversation(self, client_model_version, system_message, max_turns, max_history_tokens, token_counter, kwargs)
+
+    def batch_generate(self, client_model_version: str, prompts: List[str], kwargs: List[dict] = None, parse: List[bool] = None, max_concurrency: int = None,
+                       hedge: Union[bool, HedgePolicy] = None) -> List[str]: 
         """
         Generates text for multiple prompts using the specified client and model.
 
@@ -218,6 +651,9 @@ class azLLM:
             prompts (List[str]): List of prompts.
             kwargs (List[dict], optional): Parameters per prompt.
             parse (List[bool], optional): Parse flag per prompt.
+            max_concurrency (int, optional): Maximum number of prompts in flight at once.
+                Defaults to the `max_concurrency` parameter of the model (1, i.e. sequential).
+            hedge (bool or HedgePolicy, optional): Hedge slow prompts individually; see `generate_text`.
 
         Returns:
             List[str]: List of generated texts.
@@ -230,15 +666,12 @@ class azLLM:
             
         """
         try:
-            if self.custom and self.config:
-                client_name, model, version = self.split_client_model_version(client_model_version)
-                model_config = self.get_model_config(client_name, model, version) 
-                client = self.get_client(client_name, model_config)
-            else:
-                client_name, _, _ = self.split_client_model_version(client_model_version)
-                client = self.get_client(client_name)
-
-            return client.batch_generate(prompts, kwargs, parse)
+            pool = self._find_pool(client_model_version)
+            client = self._resolve_client(pool.targets[0] if pool is not None else client_model_version)
+            policy = self._hedge_policy(hedge)
+            if policy is not None or pool is not None:
+                return self._batch_each(client, client_model_version, prompts, kwargs, parse, max_concurrency, policy)
+            return client.batch_generate(prompts, kwargs, parse, max_concurrency)
         
         except ValueError as e:
             raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
@@ -246,6 +679,102 @@ class azLLM:
             raise RuntimeError(f"An unexpected error occurred while generating text: {str(e)}") from e
 
 
+    @staticmethod
+    def _batch_arguments(prompts: List[str], kwargs: List[dict], parse: List[bool]):
+        kwargs = kwargs if kwargs is not None else [{}] * len(prompts)
+        parse = parse if parse is not None else [False] * len(prompts)
+
+        if len(kwargs) != len(prompts):
+            raise ValueError("The length of kwargs dictionaries must match the number of prompts.")
+        if len(parse) != len(prompts):
+            raise ValueError("The length of parse list must match the number of prompts.")
+        return kwargs, parse
+
+    def _batch_each(self, client: UNIClient, client_model_version: str, prompts: List[str], kwargs: List[dict],
+                    parse: List[bool], max_concurrency: int, policy: Optional[HedgePolicy]) -> List[str]:
+        # Sends every prompt through `generate_text`, so each one is hedged and picks its pool target.
+        kwargs, parse = self._batch_arguments(prompts, kwargs, parse)
+        indices, positions = self._batch_requests(prompts, kwargs, parse)
+
+        def generate(idx: int):
+            try:
+                return self.generate_text(client_model_version, prompts[idx], kwargs[idx], parse[idx], hedge=policy)
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+        results = bounded_map(generate, indices, max_concurrency or client.max_concurrency)
+        return results if positions is None else [results[position] for position in positions]
+
+    def _batch_requests(self, prompts: List[str], kwargs: List[dict], parse: List[bool]):
+        if self.single_flight is None:
+            return range(len(prompts)), None
+        return unique_requests(prompts, kwargs, parse)
+
+    def submit_batch(self, client_model_version: str, prompts: List[str], kwargs: List[dict] = None,
+                     completion_window: str = '24h', metadata: Dict[str, str] = None) -> BatchJob:
+        """
+        Submits prompts as an offline job through the provider's Batch API.
+
+        Requests use the same model configuration as `batch_generate`, but are uploaded as a
+        single JSONL batch file and processed by the provider asynchronously, at batch pricing.
+
+        Args:
+            client_model_version (str): Format 'client:model::version'.
+            prompts (List[str]): List of prompts.
+            kwargs (List[dict], optional): Parameters per prompt.
+            completion_window (str): Time frame within which the provider processes the batch.
+            metadata (dict, optional): Metadata attached to the batch.
+
+        Returns:
+            BatchJob: Handle to poll the job (`wait`) and read its results in prompt order.
+
+        Raises:
+            ValueError: If the client does not support batch jobs or the configuration is invalid.
+
+        Example:
+            >>> azllm = azLLM()
+            >>> job = azllm.submit_batch("openai:gpt-4o-mini::v1", ["How are you?", "What's the weather?"])
+            >>> results = job.wait(poll_interval=60).results()
+        """
+        try:
+            client = self._resolve_client(client_model_version)
+            if not hasattr(client, 'submit_batch'):
+                raise ValueError(f"Client {type(client).__name__} does not support batch jobs.")
+            return client.submit_batch(prompts, kwargs, completion_window, metadata)
+
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
+        except Exception as e:
+            raise RuntimeError(f"An unexpected error occurred while generating text: {str(e)}") from e
+
+    def bulk_generate(self, client_model_version: str, prompts: List[str], kwargs: List[dict] = None,
+                      poll_interval: float = 30.0, timeout: float = None) -> List[str]:
+        """
+        Generates text for many prompts through the provider's Batch API and waits for the results.
+
+        Equivalent to `submit_batch(...).wait(poll_interval, timeout).results()`.
+
+        Args:
+            client_model_version (str): Format 'client:model::version'.
+            prompts (List[str]): List of prompts.
+            kwargs (List[dict], optional): Parameters per prompt.
+            poll_interval (float): Seconds between status checks.
+            timeout (float, optional): Maximum number of seconds to wait for the job.
+
+        Returns:
+            List[str]: Generated texts or error messages, in prompt order.
+
+        Raises:
+            RuntimeError: If the job fails, expires, is cancelled or does not finish within `timeout`.
+        """
+        job = self.submit_batch(client_model_version, prompts, kwargs)
+        try:
+            job.wait(poll_interval, timeout)
+            return job.results()
+        except Exception as e:
+            raise RuntimeError(f"Batch job {job.id} for '{client_model_version}' did not complete: {str(e)}") from e
+
+
     def generate_parallel(self, prompt: str, clients_models_versions: list, kwargs: List[dict] = None, parse: List[bool] = None) -> dict:
         """
         Generate text in parallel using different clients and models for the same prompt.
@@ -294,5 +823,184 @@ class azLLM:
                     results[f"{client_model_version}:{idx}"] = f"Error: {str(e)}"
         return results
 
+    async def agenerate_text(self, client_model_version: str, prompt: str, kwargs: dict = None, parse: bool = False,
+                             hedge: Union[bool, HedgePolicy] = None) -> str:
+        """
+        Asynchronously generates text using a specific client and model for a given prompt.
+
+        Uses the same configuration resolution, failover routes and pools as `generate_text`, but awaits
+        the client's `AsyncOpenAI` transport instead of blocking a thread.
+
+        Args:
+            client_model_version (str): Format 'client:model::version', a route name or 'pool:<name>'.
+            prompt (str): Text prompt.
+            kwargs (dict, optional): Additional generation parameters.
+            parse (bool): Whether to parse the output.
+            hedge (bool or HedgePolicy, optional): Send a duplicate request when this one is slow; see
+                `generate_text`. The losing request is cancelled.
+
+        Returns:
+            str: Generated text, annotated with the serving target when sent through a route or pool.
+
+        Raises:
+            RoutingError: If every target of the route failed.
+
+        Example:
+            >>> azllm = azLLM()
+            >>> result = asyncio.run(azllm.agenerate_text("openai:gpt-4o-mini::v1", "Hello, how are you?"))
+            >>> isinstance(result, str)
+            True
+        """
+        kwargs = kwargs or {}
+
+        policy = self._hedge_policy(hedge)
+        if policy is not None:
+            delay = self._hedge_delay(policy, client_model_version)
+            return await ahedged_call(lambda: self.agenerate_text(client_model_version, prompt, kwargs, parse),
+                                      lambda: self.agenerate_text(policy.target or client_model_version, prompt, kwargs, parse),
+                                      delay, policy)
+
+        target = self._select_pool_target(client_model_version)
+        if target is not None:
+            result = await self.router.acall(target, lambda: self.agenerate_text(target, prompt, kwargs, parse))
+            return result if getattr(result, 'target', None) else annotate(result, target, [])
+
+        route = self.get_route(client_model_version)
+        if route is None:
+            return await self._agenerate(client_model_version, prompt, kwargs, parse)
+
+        failures = []
+        kwargs = self._route_kwargs(route, kwargs)
+        for position, target in enumerate(route.targets, 1):
+            try:
+                with fail_fast(position < len(route.targets)):
+                    return annotate(await self._agenerate(target, prompt, kwargs, parse), target, failures)
+            except Exception as e:
+                if not should_failover(e):
+                    raise
+                failures.append((target, str(e)))
+        raise RoutingError(route.name, failures)
+
+    async def _agenerate(self, client_model_version: str, prompt: str, kwargs: dict, parse: bool) -> str:
+        try:
+            client = self._resolve_client(client_model_version, follow_routes=False)
+            return await client.agenerate_text(prompt, kwargs, parse)
+
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
+        except Exception as e:
+            raise RuntimeError(f"An unexpected error occurred while generating text: {str(e)}") from e
+
+    def astream_text(self, client_model_version: str, prompt: str, kwargs: dict = None) -> AsyncTextStream:
+        """
+        Asynchronously streams text from a specific client and model.
+
+        The request is sent when iteration starts.
+
+        Args:
+            client_model_version (str): Format 'client:model::version'.
+            prompt (str): Text prompt.
+            kwargs (dict, optional): Additional generation parameters.
+
+        Returns:
+            AsyncTextStream: Async iterator of text deltas.
+
+        Example:
+            >>> async for delta in azllm.astream_text("openai", "Tell me a joke."):
+            ...     print(delta, end="")
+        """
+        kwargs = kwargs or {}
+
+        try:
+            target = self._pool_target(client_model_version)
+            client = self._resolve_client(target or client_model_version)
+            stream = client.astream_text(prompt, kwargs)
+            if target is None:
+                return stream
+            # Counted from now: the request is sent when iteration starts.
+            return self._track_pool_stream(target, stream, self.router.started(target))
+
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
+        except Exception as e:
+            raise RuntimeError(f"An unexpected error occurred while generating text: {str(e)}") from e
+
+    async def abatch_generate(self, client_model_version: str, prompts: List[str], kwargs: List[dict] = None, parse: List[bool] = None, max_concurrency: int = None,
+                              hedge: Union[bool, HedgePolicy] = None) -> List[str]:
+        """
+        Asynchronously generates text for multiple prompts using the specified client and model.
+
+        Prompts are issued concurrently on the running event loop; results keep prompt order.
+
+        Args:
+            client_model_version (str): Format 'client:model::version'.
+            prompts (List[str]): List of prompts.
+            kwargs (List[dict], optional): Parameters per prompt.
+            parse (List[bool], optional): Parse flag per prompt.
+            max_concurrency (int, optional): Maximum number of prompts in flight at once.
+                Unbounded unless given here or set in the model configuration.
+            hedge (bool or HedgePolicy, optional): Hedge slow prompts individually; see `agenerate_text`.
+
+        Returns:
+            List[str]: List of generated texts.
+        """
+        try:
+            pool = self._find_pool(client_model_version)
+            client = self._resolve_client(pool.targets[0] if pool is not None else client_model_version)
+            policy = self._hedge_policy(hedge)
+            if policy is not None or pool is not None:
+                kwargs, parse = self._batch_arguments(prompts, kwargs, parse)
+                indices, positions = self._batch_requests(prompts, kwargs, parse)
+
+                async def agenerate(idx: int):
+                    try:
+                        return await self.agenerate_text(client_model_version, prompts[idx], kwargs[idx], parse[idx], hedge=policy)
+                    except Exception as e:
+                        return f"Error: {str(e)}"
+
+                results = await abounded_gather(agenerate, indices, max_concurrency or client.parameters.get('max_concurrency'))
+                return results if positions is None else [results[position] for position in positions]
+            return await client.abatch_generate(prompts, kwargs, parse, max_concurrency)
+
+        except ValueError as e:
+            raise ValueError(f"Error in generating text for client model version '{client_model_version}': {str(e)}") from e
+        except Exception as e:
+            raise RuntimeError(f"An unexpected error occurred while generating text: {str(e)}") from e
+
+    async def agenerate_parallel(self, prompt: str, clients_models_versions: list, kwargs: List[dict] = None, parse: List[bool] = None) -> dict:
+        """
+        Asynchronously generate text using different clients and models for the same prompt.
+
+        Args:
+            prompt (str): Input prompt.
+            clients_models_versions (List[str]): List of 'client:model::version' strings.
+            kwargs (List[dict], optional): Additional parameters per client.
+            parse (List[bool], optional): Parse flag per client.
+
+        Returns:
+            dict: Mapping of 'client:model::version:index' to generated text or error message.
+        """
+        kwargs = kwargs if kwargs is not None else [{}] * len(clients_models_versions)
+        parse = parse if parse is not None else [False] * len(clients_models_versions)
+
+        if len(kwargs) != len(clients_models_versions):
+            raise ValueError("The length of kwargs must match the length of clients_models_versions.")
+        if len(parse) != len(clients_models_versions):
+            raise ValueError("The length of parse must match the length of clients_models_versions.")
+
+        outputs = await asyncio.gather(
+            *(self.agenerate_text(client_model_version, prompt, kwargs[idx] if kwargs[idx] else {}, parse[idx])
+              for idx, client_model_version in enumerate(clients_models_versions)),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for idx, (client_model_version, output) in enumerate(zip(clients_models_versions, outputs)):
+            if isinstance(output, Exception):
+                results[f"{client_model_version}:{idx}"] = f"Error: {str(output)}"
+            else:
+                results[f"{client_model_version}:{idx}"] = output
+        return results
+
 
 __all__ = ['azLLM']
\ No newline at end of file
@@ -0,0 +1,24 @@
+import threading
+
+
+_loaded = False
+_lock = threading.Lock()
+
+
+def load_environment() -> None:
+    """
+    Loads the `.env` file into the environment once per process.
+
+    Every client module calls this on import; only the first call parses the file.
+    """
+    global _loaded
+    if _loaded:
+        return
+    with _lock:
+        if not _loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _loaded = True
+
+
+__all__ = ['load_environment']
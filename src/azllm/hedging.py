@@ -0,0 +1,190 @@
+import asyncio
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from .singleflight import aexclusive, exclusive
+
+if TYPE_CHECKING:
+    from .metrics import MetricsRegistry
+
+
+class HedgePolicy:
+    """
+    Policy for hedged requests: a duplicate request is sent when the first one is slower than usual.
+
+    The hedge is fired once a call has been running for longer than the `quantile` of the latency
+    recorded for its model, e.g. its p95. Whichever request finishes first successfully wins and the
+    other one is cancelled. To cap the extra cost, at most `max_hedge_rate` hedges are sent per
+    hedged call, counted since the policy was created. The policy also counts how often hedges were
+    sent and how often they won.
+
+    Attributes:
+        quantile (float): Latency quantile after which the hedge is sent.
+        initial_delay (float): Delay in seconds used until `min_samples` calls have been recorded.
+        min_samples (int): Number of recorded calls needed to use the latency quantile.
+        max_hedge_rate (float): Maximum ratio of hedges to hedged calls.
+        target (str, optional): 'client:model::version' receiving the hedges; the same target by default.
+
+    Example:
+        >>> policy = HedgePolicy(quantile=0.9, max_hedge_rate=0.05, target="fireworks:llama-v3p1-8b::v1")
+        >>> azllm.generate_text("openai:gpt-4o-mini::v1", "Hello!", hedge=policy)
+        >>> policy.snapshot()['hedge_rate']
+        0.04
+    """
+    def __init__(self, quantile: float = 0.95, initial_delay: float = 2.0, min_samples: int = 20,
+                 max_hedge_rate: float = 0.1, target: Optional[str] = None):
+        """
+        Initializes the hedge policy.
+
+        Args:
+            quantile (float): Latency quantile after which the hedge is sent.
+            initial_delay (float): Delay in seconds used until `min_samples` calls have been recorded.
+            min_samples (int): Number of recorded calls needed to use the latency quantile.
+            max_hedge_rate (float): Maximum ratio of hedges to hedged calls.
+            target (str, optional): 'client:model::version' receiving the hedges.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1.")
+        if initial_delay < 0:
+            raise ValueError("initial_delay must not be negative.")
+        if not 0 <= max_hedge_rate <= 1:
+            raise ValueError("max_hedge_rate must be between 0 and 1.")
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_hedge_rate = max_hedge_rate
+        self.target = target
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def delay(self, metrics: 'MetricsRegistry', key: str) -> float:
+        """
+        Returns the seconds to wait for a call to `key` before sending its hedge.
+        """
+        estimate = metrics.latency_quantile(key, self.quantile, self.min_samples)
+        return self.initial_delay if estimate is None else estimate
+
+    def start(self) -> None:
+        """
+        Counts a hedged call.
+        """
+        with self._lock:
+            self.requests += 1
+
+    def try_hedge(self) -> bool:
+        """
+        Reserves a hedge if the hedge rate allows it.
+
+        Returns:
+            bool: True if the hedge may be sent.
+        """
+        with self._lock:
+            if self.hedges >= self.max_hedge_rate * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def hedge_won(self) -> None:
+        with self._lock:
+            self.wins += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the counters `requests`, `hedges` and `wins`, the `hedge_rate` (hedges per call)
+        and the `win_rate` (share of hedges that finished first).
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'hedges': self.hedges,
+                'wins': self.wins,
+                'hedge_rate': self.hedges / self.requests if self.requests else 0.0,
+                'win_rate': self.wins / self.hedges if self.hedges else 0.0,
+            }
+
+
+def hedged_call(primary: Callable[[], Any], hedge: Callable[[], Any], delay: float, policy: HedgePolicy) -> Any:
+    """
+    Calls `primary` and, if it has not finished after `delay` seconds, also `hedge` in a worker thread.
+
+    The first successful result is returned without waiting for the other call, whose result is
+    discarded. A call that failed leaves the other one running; if both fail, the first error is raised.
+    The hedge is never merged into the identical in-flight request by single-flight deduplication.
+
+    Args:
+        primary (Callable): Zero-argument callable sending the request.
+        hedge (Callable): Zero-argument callable sending the duplicate request.
+        delay (float): Seconds to wait before sending the hedge.
+        policy (HedgePolicy): Policy limiting and counting the hedges.
+
+    Returns:
+        Any: The result of the call that finished first.
+    """
+    policy.start()
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        first = executor.submit(primary)
+        done, _ = wait([first], timeout=delay)
+        if done or not policy.try_hedge():
+            return first.result()
+
+        second = executor.submit(exclusive(hedge))
+        pending, error = {first, second}, None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is second:
+                        policy.hedge_won()
+                    return future.result()
+                error = error or future.exception()
+        raise error
+    finally:
+        # Threads cannot be interrupted: a losing request still runs to completion in the background.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def ahedged_call(primary: Callable[[], Awaitable[Any]], hedge: Callable[[], Awaitable[Any]], delay: float,
+                       policy: HedgePolicy) -> Any:
+    """
+    Asynchronous version of `hedged_call`; the losing request is cancelled.
+
+    Args:
+        primary (Callable): Zero-argument coroutine function sending the request.
+        hedge (Callable): Zero-argument coroutine function sending the duplicate request.
+        delay (float): Seconds to wait before sending the hedge.
+        policy (HedgePolicy): Policy limiting and counting the hedges.
+
+    Returns:
+        Any: The result of the call that finished first.
+    """
+    policy.start()
+    tasks = [asyncio.ensure_future(primary())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done or not policy.try_hedge():
+            return await tasks[0]
+
+        tasks.append(asyncio.ensure_future(aexclusive(hedge)()))
+        pending, error = set(tasks), None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is tasks[1]:
+                        policy.hedge_won()
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+__all__ = ['HedgePolicy', 'hedged_call', 'ahedged_call']
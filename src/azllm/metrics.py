@@ -0,0 +1,374 @@
+import bisect
+import math
+import threading
+import time
+import warnings
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class Histogram:
+    """
+    A cumulative-bucket histogram in the style of Prometheus, with quantile estimates.
+
+    Attributes:
+        bounds (tuple): Upper bounds of the buckets; an implicit `+Inf` bucket follows.
+        count (int): Number of observations.
+        sum (float): Sum of all observations.
+    """
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates the `q`-quantile by linear interpolation within the matching bucket.
+
+        Args:
+            q (float): Quantile between 0 and 1, e.g. 0.99.
+
+        Returns:
+            float: The estimate, or None without observations. Values in the `+Inf` bucket
+            are reported as the largest finite bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                if idx == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[idx - 1] if idx else 0.0
+                return lower + (self.bounds[idx] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        Returns `(upper_bound, cumulative_count)` pairs, ending with `(inf, count)`.
+        """
+        pairs, total = [], 0
+        for bound, bucket_count in zip(self.bounds + (math.inf,), self.counts):
+            total += bucket_count
+            pairs.append((bound, total))
+        return pairs
+
+
+class CallTracker:
+    """
+    Measures a single call and records it in a `MetricsRegistry` when it finishes.
+
+    Clients create one per request through `MetricsRegistry.track`. For streamed responses,
+    `response_started` marks the time to first byte and `stream_complete` finishes the call
+    once the stream is exhausted, or `stream_aborted` if it ends early; for regular responses,
+    the time to first byte is the time until the full response is received.
+    """
+    def __init__(self, registry: 'MetricsRegistry', key: str):
+        self.registry = registry
+        self.key = key
+        self.retries = 0
+        self.time_to_first_byte: Optional[float] = None
+        self.started_at = time.perf_counter()
+        # Circuit breaker permit of the call, set by the client that sends it.
+        self.permit: Any = None
+
+    def start(self) -> None:
+        """
+        Restarts the clock, for calls that are prepared before they are sent.
+        """
+        self.started_at = time.perf_counter()
+
+    def on_retry(self, attempt: int, error: BaseException) -> None:
+        """
+        Counts a retry; matches the `on_retry` hook of `RetryPolicy.call`.
+        """
+        self.retries += 1
+
+    def response_started(self) -> None:
+        if self.time_to_first_byte is None:
+            self.time_to_first_byte = time.perf_counter() - self.started_at
+
+    def success(self, response: Any = None, streamed: bool = False) -> None:
+        """
+        Records a successful call, taking token counts from `response.usage` when available.
+        """
+        self.response_started()
+        self._record(getattr(response, 'usage', None), None, streamed)
+
+    def stream_complete(self, summary: Any) -> None:
+        """
+        Records a streamed call once the stream is exhausted; matches the `on_complete` hook of `TextStream`.
+        """
+        self.response_started()
+        self._record(getattr(summary, 'usage', None), None, True)
+
+    def stream_aborted(self, error: Optional[BaseException]) -> None:
+        """
+        Records a streamed call that ended before it was exhausted; matches the `on_abort` hook of
+        `TextStream`. It counts as failed with `error`, or as successful if the caller closed it.
+        """
+        self._record(None, error, True)
+
+    def failure(self, error: BaseException) -> None:
+        """
+        Records a failed call with the class name of its error.
+        """
+        self._record(None, error, False)
+
+    def _record(self, usage: Any, error: Optional[BaseException], streamed: bool) -> None:
+        prompt_tokens = getattr(usage, 'prompt_tokens', None)
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        cached_tokens = cached_prompt_tokens(usage)
+        self.registry.record(SimpleNamespace(
+            key=self.key,
+            latency=time.perf_counter() - self.started_at,
+            time_to_first_byte=self.time_to_first_byte,
+            prompt_tokens=prompt_tokens if isinstance(prompt_tokens, int) else None,
+            completion_tokens=completion_tokens if isinstance(completion_tokens, int) else None,
+            cached_tokens=cached_tokens,
+            retries=self.retries,
+            error=type(error).__name__ if error is not None else None,
+            streamed=streamed,
+        ))
+
+
+class MetricsRegistry:
+    """
+    In-process registry of per-model request metrics.
+
+    Every call made through a client is recorded under its `client:model::version` key:
+    latency and time-to-first-byte histograms, and counters for requests, errors by class,
+    retries, prompt/completion tokens and prompt tokens served from the provider's prompt
+    cache. Callbacks registered with `add_callback` receive
+    each call record, e.g. to forward it to another monitoring system.
+
+    Example:
+        >>> from azllm.metrics import registry
+        >>> registry.snapshot()['openai:gpt-4o-mini::default']['latency_p99']
+        1.2
+        >>> print(registry.to_prometheus())
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, enabled: bool = True):
+        """
+        Args:
+            buckets (Sequence[float]): Upper bounds of the latency histogram buckets, in seconds.
+            enabled (bool): Whether calls are recorded.
+        """
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[SimpleNamespace], None]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drops all recorded metrics; callbacks are kept.
+        """
+        with self._lock:
+            self._latency: Dict[str, Histogram] = {}
+            self._ttfb: Dict[str, Histogram] = {}
+            self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+            self._errors: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def track(self, key: str) -> CallTracker:
+        """
+        Starts measuring a call for `key` ('client:model::version').
+        """
+        return CallTracker(self, key)
+
+    def add_callback(self, callback: Callable[[SimpleNamespace], None]) -> None:
+        """
+        Registers a function called with every call record.
+
+        Records have the attributes `key`, `latency`, `time_to_first_byte`, `prompt_tokens`,
+        `completion_tokens`, `cached_tokens`, `retries`, `error` (class name or None) and `streamed`.
+        Exceptions raised by callbacks are turned into warnings.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[SimpleNamespace], None]) -> None:
+        with self._lock:
+            self._callbacks.remove(callback)
+
+    def record(self, record: SimpleNamespace) -> None:
+        """
+        Adds a call record to the metrics and passes it to the callbacks.
+
+        Args:
+            record (SimpleNamespace): Call record as produced by `CallTracker`.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            key = record.key
+            if key not in self._latency:
+                self._latency[key] = Histogram(self.buckets)
+                self._ttfb[key] = Histogram(self.buckets)
+            self._latency[key].observe(record.latency)
+            if record.time_to_first_byte is not None:
+                self._ttfb[key].observe(record.time_to_first_byte)
+            counters = self._counters[key]
+            counters['requests'] += 1
+            counters['retries'] += record.retries
+            counters['prompt_tokens'] += record.prompt_tokens or 0
+            counters['completion_tokens'] += record.completion_tokens or 0
+            counters['cached_tokens'] += getattr(record, 'cached_tokens', None) or 0
+            if record.error is not None:
+                counters['errors'] += 1
+                self._errors[key][record.error] += 1
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(record)
+            except Exception as e:
+                warnings.warn(f"Metrics callback {callback!r} failed: {e}")
+
+    def latency_quantile(self, key: str, q: float, min_count: int = 1) -> Optional[float]:
+        """
+        Estimates the `q`-quantile of the latency recorded for `key`.
+
+        Args:
+            key (str): The 'client:model::version' key.
+            q (float): Quantile between 0 and 1, e.g. 0.95.
+            min_count (int): Minimum number of recorded calls for an estimate.
+
+        Returns:
+            float: The estimate in seconds, or None with fewer than `min_count` recorded calls.
+        """
+        with self._lock:
+            latency = self._latency.get(key)
+            if latency is None or latency.count < max(min_count, 1):
+                return None
+            return latency.quantile(q)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a summary per `client:model::version` key.
+
+        Returns:
+            dict: For each key, the counters `requests`, `errors`, `retries`, `prompt_tokens`,
+            `completion_tokens` and `cached_tokens`, `errors_by_class`, the mean latency, its p50/p90/p99
+            estimates and the mean time to first byte, in seconds.
+        """
+        with self._lock:
+            summary = {}
+            for key, latency in self._latency.items():
+                ttfb = self._ttfb[key]
+                summary[key] = {
+                    **self._counters[key],
+                    'errors': self._counters[key].get('errors', 0),
+                    'errors_by_class': dict(self._errors.get(key, {})),
+                    'latency_mean': latency.sum / latency.count if latency.count else None,
+                    'latency_p50': latency.quantile(0.5),
+                    'latency_p90': latency.quantile(0.9),
+                    'latency_p99': latency.quantile(0.99),
+                    'time_to_first_byte_mean': ttfb.sum / ttfb.count if ttfb.count else None,
+                }
+            return summary
+
+    def to_prometheus(self, prefix: str = 'azllm') -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Each series carries `client`, `model` and `version` labels parsed from its key.
+
+        Args:
+            prefix (str): Prefix of the metric names.
+
+        Returns:
+            str: The exposition text, ending with a newline.
+        """
+        lines: List[str] = []
+        with self._lock:
+            keys = sorted(self._latency)
+            for name, source, help_text in (
+                ('request_duration_seconds', self._latency, 'Wall-clock duration of LLM requests.'),
+                ('time_to_first_byte_seconds', self._ttfb, 'Time until the first response byte of LLM requests.'),
+            ):
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+                for key in keys:
+                    labels = _labels(key)
+                    histogram = source[key]
+                    for bound, total in histogram.cumulative():
+                        le = '+Inf' if bound == math.inf else repr(float(bound))
+                        lines.append(f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {total}')
+                    lines.append(f"{prefix}_{name}_sum{{{labels}}} {histogram.sum}")
+                    lines.append(f"{prefix}_{name}_count{{{labels}}} {histogram.count}")
+            for name, counter, help_text in (
+                ('requests_total', 'requests', 'Number of LLM requests.'),
+                ('retries_total', 'retries', 'Number of retried attempts.'),
+                ('prompt_tokens_total', 'prompt_tokens', 'Prompt tokens reported by providers.'),
+                ('completion_tokens_total', 'completion_tokens', 'Completion tokens reported by providers.'),
+                ('cached_tokens_total', 'cached_tokens', 'Prompt tokens served from provider prompt caches.'),
+            ):
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for key in keys:
+                    lines.append(f"{prefix}_{name}{{{_labels(key)}}} {self._counters[key].get(counter, 0)}")
+            lines.append(f"# HELP {prefix}_errors_total Number of failed LLM requests by error class.")
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for key in keys:
+                for error, total in sorted(self._errors.get(key, {}).items()):
+                    lines.append(f'{prefix}_errors_total{{{_labels(key)},error="{_escape(error)}"}} {total}')
+        return '\n'.join(lines) + '\n'
+
+
+def cached_prompt_tokens(usage: Any) -> Optional[int]:
+    """
+    Returns the prompt tokens a provider served from its prompt cache.
+
+    Providers report them in different fields: `prompt_tokens_details.cached_tokens` (OpenAI and
+    most compatible APIs), `prompt_cache_hit_tokens` (DeepSeek) or `cache_read_input_tokens` (Anthropic).
+
+    Args:
+        usage (Any): The `usage` of a response, or None.
+
+    Returns:
+        int or None: The cached tokens, or None if the provider did not report them.
+    """
+    if usage is None:
+        return None
+    details = getattr(usage, 'prompt_tokens_details', None)
+    for value in (getattr(details, 'cached_tokens', None),
+                  getattr(usage, 'prompt_cache_hit_tokens', None),
+                  getattr(usage, 'cache_read_input_tokens', None)):
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(key: str) -> str:
+    client, _, rest = key.partition(':')
+    model, _, version = rest.rpartition('::') if '::' in rest else (rest, '', 'default')
+    return f'client="{_escape(client)}",model="{_escape(model)}",version="{_escape(version)}"'
+
+
+def metrics_key(client_name: str, config: Optional[Dict[str, Any]], model: str) -> str:
+    """
+    Builds the `client:model::version` key a client records its metrics under.
+    """
+    return f"{client_name}:{model}::{(config or {}).get('version', 'default')}"
+
+
+registry = MetricsRegistry()
+
+
+__all__ = ['MetricsRegistry', 'CallTracker', 'Histogram', 'metrics_key', 'cached_prompt_tokens', 'registry', 'DEFAULT_LATENCY_BUCKETS']
@@ -0,0 +1,272 @@
+import json
+import random
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+def completion_body(model: str, content: str, prompt_tokens: int = 10, completion_tokens: int = 10) -> Dict[str, Any]:
+    """
+    Builds an OpenAI-compatible chat completion response body.
+    """
+    return {
+        'id': f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': model,
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': content},
+            'finish_reason': 'stop',
+        }],
+        'usage': {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def echo_content(body: Dict[str, Any]) -> str:
+    """
+    The mock server's reply to a chat request: an echo of the last user message.
+    """
+    messages = body.get('messages') or [{}]
+    return f"Echo: {messages[-1].get('content', '')}"
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class MockOpenAIServer:
+    """
+    A local stand-in for an OpenAI-compatible API, for tests and benchmarks without network access.
+
+    Supports `POST /v1/chat/completions` (replying with an echo of the last message) and the
+    batch endpoints used by `azllm.batch`: file upload and download, batch creation, retrieval
+    and cancellation. Batches complete after `batch_polls_until_complete` retrievals.
+
+    Chat completions can simulate provider behavior: a response `latency` with uniform `jitter`,
+    a fraction of 500 errors (`error_rate`) and of 429 responses with a `Retry-After` header
+    (`rate_limit_rate`). The time spent per request is recorded in `processing_times`.
+
+    Example:
+        >>> with MockOpenAIServer() as server:
+        ...     client = OpenAI(api_key="test", base_url=server.base_url)
+    """
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, batch_polls_until_complete: int = 1,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 retry_after: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free port.
+            batch_polls_until_complete (int): Number of batch retrievals before a batch reports `completed`.
+            latency (float): Seconds each chat completion takes.
+            jitter (float): Maximum deviation from `latency` in seconds, drawn uniformly.
+            error_rate (float): Fraction of chat completions answered with a 500 error.
+            rate_limit_rate (float): Fraction of chat completions answered with a 429 error.
+            retry_after (float): Value of the `Retry-After` header of 429 responses, in seconds.
+            seed (int, optional): Seed for the latency and error draws.
+        """
+        self.batch_polls_until_complete = batch_polls_until_complete
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.request_count = 0
+        self.status_counts: Dict[int, int] = {}
+        self.processing_times: List[float] = []
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._httpd = _HTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'MockOpenAIServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockOpenAIServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def chat_completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Produces the response body for a chat completion request.
+        """
+        return completion_body(body.get('model', 'mock-model'), echo_content(body))
+
+    def _store_file(self, content: bytes) -> Dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self.files[file_id] = content
+        return {'id': file_id, 'object': 'file', 'bytes': len(content), 'created_at': int(time.time()),
+                'filename': f"{file_id}.jsonl", 'purpose': 'batch', 'status': 'processed'}
+
+    def _run_batch(self, batch: Dict[str, Any]) -> None:
+        outputs, errors = [], []
+        for line in self.files[batch['input_file_id']].decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request.get('body', {})
+            if body.get('model') == 'fail':
+                errors.append({'id': f"batch_req_{uuid.uuid4().hex[:8]}", 'custom_id': request['custom_id'],
+                               'response': None, 'error': {'code': 'invalid_model', 'message': 'Model fail is not available.'}})
+                continue
+            outputs.append({'id': f"batch_req_{uuid.uuid4().hex[:8]}", 'custom_id': request['custom_id'],
+                            'response': {'status_code': 200, 'request_id': uuid.uuid4().hex, 'body': self.chat_completion(body)},
+                            'error': None})
+        # Providers return results in arbitrary order.
+        outputs.reverse()
+        if outputs:
+            batch['output_file_id'] = self._store_file('\n'.join(json.dumps(o) for o in outputs).encode('utf-8'))['id']
+        if errors:
+            batch['error_file_id'] = self._store_file('\n'.join(json.dumps(e) for e in errors).encode('utf-8'))['id']
+        batch['request_counts'] = {'total': len(outputs) + len(errors), 'completed': len(outputs), 'failed': len(errors)}
+        batch['status'] = 'completed'
+        batch['completed_at'] = int(time.time())
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _read_body(self) -> bytes:
+                length = int(self.headers.get('Content-Length') or 0)
+                return self.rfile.read(length) if length else b''
+
+            def _send_json(self, payload: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _not_found(self) -> None:
+                self._send_json({'error': {'message': f"Unknown path {self.path}", 'type': 'invalid_request_error'}}, 404)
+
+            def do_POST(self):
+                with server._lock:
+                    server.request_count += 1
+                body = self._read_body()
+                path = self.path.split('?')[0]
+                if path == '/v1/chat/completions':
+                    return server._handle_chat(self, json.loads(body or b'{}'))
+                if path == '/v1/files':
+                    message = BytesParser(policy=default_policy).parsebytes(
+                        f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode('utf-8') + body)
+                    for part in message.iter_parts():
+                        if part.get_param('name', header='content-disposition') == 'file':
+                            return self._send_json(server._store_file(part.get_payload(decode=True)))
+                    return self._send_json({'error': {'message': 'Missing file'}}, 400)
+                if path == '/v1/batches':
+                    request = json.loads(body or b'{}')
+                    if request.get('input_file_id') not in server.files:
+                        return self._send_json({'error': {'message': 'Unknown input file'}}, 400)
+                    batch = {'id': f"batch_{uuid.uuid4().hex[:12]}", 'object': 'batch', 'endpoint': request['endpoint'],
+                             'input_file_id': request['input_file_id'], 'completion_window': request['completion_window'],
+                             'status': 'validating', 'created_at': int(time.time()), 'output_file_id': None,
+                             'error_file_id': None, 'metadata': request.get('metadata'), '_polls': 0}
+                    with server._lock:
+                        server.batches[batch['id']] = batch
+                    return self._send_json({k: v for k, v in batch.items() if not k.startswith('_')})
+                if path.startswith('/v1/batches/') and path.endswith('/cancel'):
+                    batch = server.batches.get(path.split('/')[3])
+                    if batch is None:
+                        return self._not_found()
+                    batch['status'] = 'cancelled'
+                    return self._send_json({k: v for k, v in batch.items() if not k.startswith('_')})
+                return self._not_found()
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path.startswith('/v1/batches/'):
+                    with server._lock:
+                        batch = server.batches.get(path.split('/')[3])
+                        if batch is None:
+                            return self._not_found()
+                        batch['_polls'] += 1
+                        if batch['status'] not in ('completed', 'cancelled'):
+                            if batch['_polls'] >= server.batch_polls_until_complete:
+                                server._run_batch(batch)
+                            else:
+                                batch['status'] = 'in_progress'
+                    return self._send_json({k: v for k, v in batch.items() if not k.startswith('_')})
+                if path.startswith('/v1/files/') and path.endswith('/content'):
+                    content = server.files.get(path.split('/')[3])
+                    if content is None:
+                        return self._not_found()
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/octet-stream')
+                    self.send_header('Content-Length', str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                    return
+                return self._not_found()
+
+        return Handler
+
+    def reset_stats(self) -> None:
+        """
+        Clears the request counters and recorded processing times.
+        """
+        with self._lock:
+            self.request_count = 0
+            self.status_counts = {}
+            self.processing_times = []
+
+    def _handle_chat(self, handler: BaseHTTPRequestHandler, body: Dict[str, Any]) -> None:
+        started_at = time.perf_counter()
+        with self._lock:
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay)
+        if roll < self.rate_limit_rate:
+            status = 429
+            handler._send_json({'error': {'message': 'Rate limit reached.', 'type': 'requests', 'code': 'rate_limit_exceeded'}},
+                               status, {'retry-after': str(self.retry_after)})
+        elif roll < self.rate_limit_rate + self.error_rate:
+            status = 500
+            handler._send_json({'error': {'message': 'The server had an error.', 'type': 'server_error'}}, status)
+        else:
+            status = 200
+            handler._send_json(self.chat_completion(body))
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            self.processing_times.append(time.perf_counter() - started_at)
+
+
+__all__ = ['MockOpenAIServer', 'completion_body']
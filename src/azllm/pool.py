@@ -0,0 +1,118 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+DEFAULT_POOL_SIZE = 32
+
+
+class ClientPool:
+    """
+    A bounded, thread-safe LRU pool of client instances.
+
+    Clients are keyed by client name and resolved model configuration so that
+    repeated calls against the same `client:model::version` reuse one client
+    (and therefore one SDK instance with its HTTP connection pool) instead of
+    constructing a new one per request.
+
+    Attributes:
+        max_size (int): Maximum number of clients kept in the pool.
+    """
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        """
+        Initializes an empty client pool.
+
+        Args:
+            max_size (int): Maximum number of clients kept before the least recently used one is evicted.
+
+        Raises:
+            ValueError: If `max_size` is smaller than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size of the client pool must be at least 1.")
+        self.max_size = max_size
+        self._clients: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(client_name: str, model_config: Optional[Dict[str, Any]] = None) -> Tuple[str, Optional[str]]:
+        """
+        Builds a hashable pool key from a client name and its model configuration.
+
+        Args:
+            client_name (str): Name of the LLM client.
+            model_config (dict, optional): Resolved model configuration.
+
+        Returns:
+            tuple: `(client_name, canonical_config)` where the config is serialized with sorted keys.
+        """
+        if model_config is None:
+            return client_name, None
+        return client_name, json.dumps(model_config, sort_keys=True, default=str)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Returns the pooled client for `key`, creating it with `factory` on a miss.
+
+        When the pool is full, the least recently used client is evicted. Evicted clients
+        are not closed, since another thread may still be using them; their connections are
+        released once they are garbage collected.
+
+        Args:
+            key (Hashable): Pool key, usually built with `make_key`.
+            factory (Callable): Zero-argument callable creating a new client.
+
+        Returns:
+            Any: The pooled client instance.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+            client = factory()
+            self._clients[key] = client
+            if len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def close(self) -> None:
+        """
+        Closes every pooled client and empties the pool.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            close = getattr(client, 'close', None)
+            if callable(close):
+                close()
+
+    async def aclose(self) -> None:
+        """
+        Closes every pooled client, including their asynchronous SDK clients, and empties the pool.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            aclose = getattr(client, 'aclose', None)
+            if callable(aclose):
+                await aclose()
+            else:
+                close = getattr(client, 'close', None)
+                if callable(close):
+                    close()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._clients
+
+
+__all__ = ['ClientPool', 'DEFAULT_POOL_SIZE']
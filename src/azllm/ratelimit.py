@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that hands out reservations instead of blocking.
+
+    Callers reserve an amount and receive the number of seconds they must wait before
+    using it. The balance may go negative, which queues later callers behind earlier
+    ones, so waiting can happen outside the lock with either `time.sleep` or `asyncio.sleep`.
+
+    Attributes:
+        capacity (float): Maximum number of tokens the bucket can hold (the burst size).
+        refill_rate (float): Tokens added per second.
+    """
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initializes a full bucket.
+
+        Args:
+            capacity (float): Maximum number of tokens the bucket can hold.
+            refill_rate (float): Tokens added per second.
+
+        Raises:
+            ValueError: If capacity or refill rate is not positive.
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("Token bucket capacity and refill rate must be positive.")
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def reserve(self, amount: float = 1) -> float:
+        """
+        Reserves `amount` tokens and returns how long the caller must wait before using them.
+
+        Amounts larger than the capacity are clamped to the capacity so they can eventually proceed.
+
+        Args:
+            amount (float): Number of tokens to reserve.
+
+        Returns:
+            float: Seconds to wait; 0 if the tokens are available immediately.
+        """
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+
+    def refund(self, amount: float) -> None:
+        """
+        Returns unused tokens to the bucket, or charges extra tokens if `amount` is negative.
+
+        Args:
+            amount (float): Number of tokens to give back.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    """
+    Enforces requests-per-minute and tokens-per-minute budgets for one client model.
+
+    Token usage is estimated before each request from the prompt length and `max_tokens`,
+    then reconciled with the `usage` reported in the response.
+
+    Attributes:
+        requests_per_minute (int): Request budget per minute, or None for no limit.
+        tokens_per_minute (int): Token budget per minute, or None for no limit.
+    """
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        """
+        Initializes the rate limiter.
+
+        Args:
+            requests_per_minute (int, optional): Request budget per minute.
+            tokens_per_minute (int, optional): Token budget per minute.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60) if tokens_per_minute else None
+
+    @classmethod
+    def from_config(cls, limits: Optional[Dict[str, Any]]) -> Optional['RateLimiter']:
+        """
+        Creates a rate limiter from the `rate_limits` block of a model configuration.
+
+        Args:
+            limits (dict, optional): Mapping with `requests_per_minute` and/or `tokens_per_minute`.
+
+        Returns:
+            RateLimiter: The rate limiter, or None if no limits are configured.
+
+        Raises:
+            ValueError: If the block contains unknown keys.
+        """
+        if not limits:
+            return None
+        unknown = set(limits) - {'requests_per_minute', 'tokens_per_minute'}
+        if unknown:
+            raise ValueError(f"Unknown rate limit settings: {sorted(unknown)}")
+        return cls(limits.get('requests_per_minute'), limits.get('tokens_per_minute'))
+
+    def limits(self) -> Dict[str, Optional[int]]:
+        return {'requests_per_minute': self.requests_per_minute, 'tokens_per_minute': self.tokens_per_minute}
+
+    def _reserve(self, tokens: int) -> float:
+        wait = 0.0
+        if self._requests is not None:
+            wait = max(wait, self._requests.reserve(1))
+        if self._tokens is not None and tokens:
+            wait = max(wait, self._tokens.reserve(tokens))
+        return wait
+
+    def acquire(self, params: Dict[str, Any]) -> int:
+        """
+        Blocks until a request with the given parameters fits within the budgets.
+
+        Args:
+            params (dict): Keyword arguments of the chat completions request.
+
+        Returns:
+            int: The number of tokens reserved, to be passed to `reconcile`.
+        """
+        tokens = estimate_request_tokens(params)
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return tokens
+
+    async def aacquire(self, params: Dict[str, Any]) -> int:
+        """
+        Asynchronous version of `acquire` that yields to the event loop while waiting.
+
+        Args:
+            params (dict): Keyword arguments of the chat completions request.
+
+        Returns:
+            int: The number of tokens reserved, to be passed to `reconcile`.
+        """
+        tokens = estimate_request_tokens(params)
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return tokens
+
+    def reconcile(self, reserved: int, response: Any) -> None:
+        """
+        Corrects the token budget once the actual usage of a response is known.
+
+        Args:
+            reserved (int): Tokens reserved by `acquire`.
+            response (Any): SDK response; its `usage.total_tokens` is used when available.
+        """
+        if self._tokens is None:
+            return
+        total_tokens = getattr(getattr(response, 'usage', None), 'total_tokens', None)
+        if isinstance(total_tokens, int):
+            self._tokens.refund(reserved - total_tokens)
+
+
+def estimate_request_tokens(params: Dict[str, Any]) -> int:
+    """
+    Roughly estimates the tokens a chat completions request counts against a budget.
+
+    Providers count the requested `max_tokens` towards token limits, so it is added
+    to a character-based estimate of the prompt.
+
+    Args:
+        params (dict): Keyword arguments of the chat completions request.
+
+    Returns:
+        int: Estimated number of tokens.
+    """
+    characters = 0
+    for message in params.get('messages', []):
+        content = message.get('content')
+        if isinstance(content, str):
+            characters += len(content)
+        elif isinstance(content, list):
+            characters += sum(len(part.get('text', '')) for part in content if isinstance(part, dict))
+    return characters // CHARS_PER_TOKEN + 1 + int(params.get('max_tokens') or 0)
+
+
+_registry: Dict[str, RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, limits: Optional[Dict[str, Any]]) -> Optional[RateLimiter]:
+    """
+    Returns the process-wide rate limiter for `key`, creating it if needed.
+
+    Limiters are shared between all clients of the same `client:model`, so budgets hold
+    across pooled clients and `azLLM` instances. A limiter is replaced if its limits change.
+
+    Args:
+        key (str): Identifier of the budget, usually 'client:model'.
+        limits (dict, optional): The `rate_limits` block of the model configuration.
+
+    Returns:
+        RateLimiter: The shared limiter, or None if no limits are configured.
+    """
+    if not limits:
+        return None
+    with _registry_lock:
+        limiter = _registry.get(key)
+        if limiter is None or limiter.limits() != RateLimiter.from_config(limits).limits():
+            limiter = RateLimiter.from_config(limits)
+            _registry[key] = limiter
+        return limiter
+
+
+__all__ = ['TokenBucket', 'RateLimiter', 'estimate_request_tokens', 'get_rate_limiter']
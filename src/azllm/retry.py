@@ -0,0 +1,226 @@
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+RETRYABLE_ERROR_NAMES = frozenset({'APIConnectionError', 'APITimeoutError', 'RateLimitError', 'InternalServerError'})
+CONNECTION_ERROR_NAMES = frozenset({'APIConnectionError', 'APITimeoutError'})
+
+_fail_fast: ContextVar[bool] = ContextVar('azllm_retry_fail_fast', default=False)
+
+
+@contextmanager
+def fail_fast(enabled: bool = True):
+    """
+    Within the block, timeouts and connection errors are not retried.
+
+    Failover routes use it for every target but the last, so the request moves on to the next
+    target instead of waiting for an unresponsive one again.
+
+    Args:
+        enabled (bool): Whether to fail fast; False leaves the retry policies unchanged.
+    """
+    token = _fail_fast.set(enabled)
+    try:
+        yield
+    finally:
+        _fail_fast.reset(token)
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff and full jitter for transient API errors.
+
+    Connection errors, timeouts, 408/409/429 responses and 5xx responses are retried.
+    The delay before attempt `n + 1` is drawn uniformly from
+    `[0, min(max_delay, initial_delay * multiplier ** (n - 1))]`, and a `Retry-After`
+    header sent by the provider is honored as a lower bound.
+
+    Attributes:
+        max_attempts (int): Total number of attempts, including the first one.
+        initial_delay (float): Backoff ceiling in seconds after the first failure.
+        max_delay (float): Upper bound of any single delay in seconds.
+        multiplier (float): Growth factor of the backoff ceiling per attempt.
+        respect_retry_after (bool): Whether to honor `Retry-After` headers.
+    """
+    def __init__(self, max_attempts: int = 3, initial_delay: float = 0.5, max_delay: float = 30.0,
+                 multiplier: float = 2.0, respect_retry_after: bool = True):
+        """
+        Initializes the retry policy.
+
+        Args:
+            max_attempts (int): Total number of attempts, including the first one.
+            initial_delay (float): Backoff ceiling in seconds after the first failure.
+            max_delay (float): Upper bound of any single delay in seconds.
+            multiplier (float): Growth factor of the backoff ceiling per attempt.
+            respect_retry_after (bool): Whether to honor `Retry-After` headers.
+
+        Raises:
+            ValueError: If `max_attempts` is smaller than 1.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.respect_retry_after = respect_retry_after
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'RetryPolicy':
+        """
+        Creates a retry policy from the `retry` block of a model configuration.
+
+        Args:
+            config (dict, optional): Retry settings; defaults are used for missing keys.
+
+        Returns:
+            RetryPolicy: The retry policy.
+
+        Raises:
+            ValueError: If the block contains unknown keys.
+        """
+        config = config or {}
+        unknown = set(config) - {'max_attempts', 'initial_delay', 'max_delay', 'multiplier', 'respect_retry_after'}
+        if unknown:
+            raise ValueError(f"Unknown retry settings: {sorted(unknown)}")
+        return cls(**config)
+
+    @staticmethod
+    def is_retryable(error: BaseException) -> bool:
+        """
+        Classifies an exception as transient (worth retrying) or permanent.
+
+        Args:
+            error (BaseException): The exception raised by the SDK call.
+
+        Returns:
+            bool: True if the request should be retried.
+        """
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        status_code = getattr(error, 'status_code', None)
+        if isinstance(status_code, int):
+            return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+        return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """
+        Extracts the delay requested by the provider through `Retry-After` headers.
+
+        Args:
+            error (BaseException): The exception raised by the SDK call.
+
+        Returns:
+            float: Seconds to wait, or None if the provider did not specify it.
+        """
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if not headers:
+            return None
+        try:
+            retry_after_ms = headers.get('retry-after-ms')
+            if retry_after_ms is not None:
+                return float(retry_after_ms) / 1000
+            retry_after = headers.get('retry-after')
+            if retry_after is None:
+                return None
+            try:
+                return float(retry_after)
+            except ValueError:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def compute_delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Computes the delay after a failed attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, starting at 1.
+            error (BaseException, optional): The error of the failed attempt.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+        """
+        ceiling = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+        if self.respect_retry_after and error is not None:
+            requested = self.retry_after(error)
+            if requested is not None:
+                delay = max(delay, min(requested, self.max_delay))
+        return delay
+
+    @staticmethod
+    def is_connection_error(error: BaseException) -> bool:
+        """
+        Whether an exception is a timeout or connection error, as opposed to an error response.
+        """
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        return any(cls.__name__ in CONNECTION_ERROR_NAMES for cls in type(error).__mro__)
+
+    def should_retry(self, attempt: int, error: BaseException) -> bool:
+        if _fail_fast.get() and self.is_connection_error(error):
+            return False
+        return attempt < self.max_attempts and self.is_retryable(error)
+
+    def call(self, func: Callable[[], Any], on_retry: Optional[Callable[[int, BaseException], None]] = None) -> Any:
+        """
+        Calls `func`, retrying transient failures with backoff.
+
+        Args:
+            func (Callable): Zero-argument callable performing one attempt.
+            on_retry (Callable, optional): Called with the failed attempt number and error before each retry.
+
+        Returns:
+            Any: The result of the first successful attempt.
+
+        Raises:
+            Exception: The last error if it is not retryable or attempts are exhausted.
+        """
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                if not self.should_retry(attempt, e):
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt, e)
+                time.sleep(self.compute_delay(attempt, e))
+                attempt += 1
+
+    async def acall(self, func: Callable[[], Any], on_retry: Optional[Callable[[int, BaseException], None]] = None) -> Any:
+        """
+        Asynchronous version of `call`; `func` returns an awaitable and waits use `asyncio.sleep`.
+
+        Args:
+            func (Callable): Zero-argument callable returning an awaitable for one attempt.
+            on_retry (Callable, optional): Called with the failed attempt number and error before each retry.
+
+        Returns:
+            Any: The result of the first successful attempt.
+
+        Raises:
+            Exception: The last error if it is not retryable or attempts are exhausted.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                if not self.should_retry(attempt, e):
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt, e)
+                await asyncio.sleep(self.compute_delay(attempt, e))
+                attempt += 1
+
+
+__all__ = ['RetryPolicy', 'RETRYABLE_STATUS_CODES', 'fail_fast']
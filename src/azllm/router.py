@@ -0,0 +1,230 @@
+import random
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .routing import should_failover
+
+
+# Top-level key of the custom configuration holding the model pools; it is not a client.
+POOLS_KEY = 'pools'
+# Prefix of the identifiers that address a pool, e.g. 'pool:fast-chat'.
+POOL_PREFIX = 'pool:'
+
+
+class ModelPool(NamedTuple):
+    """
+    A set of interchangeable `client:model::version` targets addressed as `pool:<name>`.
+
+    Attributes:
+        name (str): Name of the pool, without the `pool:` prefix.
+        targets (tuple): The equivalent targets; route names are allowed.
+    """
+    name: str
+    targets: Tuple[str, ...]
+
+
+def parse_pools(config: Optional[Mapping[str, Any]]) -> Mapping[str, ModelPool]:
+    """
+    Compiles the `pools` block of a custom configuration.
+
+    Each pool maps a name to a list of targets, or to a mapping with `targets`:
+
+    ::
+
+        pools:
+            fast-chat:
+                - openai:gpt-4o-mini::v1
+                - fireworks:llama-v3p1-8b-instruct::v1
+                - grok:grok-2-latest::v1
+
+    Args:
+        config (Mapping, optional): The loaded custom configuration.
+
+    Returns:
+        Mapping: Read-only mapping of pool names to `ModelPool` tuples.
+
+    Raises:
+        ValueError: If the `pools` block is malformed.
+    """
+    block = (config or {}).get(POOLS_KEY) or {}
+    if not isinstance(block, Mapping):
+        raise ValueError(f"'{POOLS_KEY}' must be a mapping of pool names to targets.")
+    pools: Dict[str, ModelPool] = {}
+    for name, rule in block.items():
+        if isinstance(rule, Mapping):
+            unknown = set(rule) - {'targets'}
+            if unknown:
+                raise ValueError(f"Unknown settings of pool '{name}': {sorted(unknown)}")
+            rule = rule.get('targets')
+        if not isinstance(rule, (list, tuple)) or not rule or not all(isinstance(target, str) and target for target in rule):
+            raise ValueError(f"Pool '{name}' needs a non-empty list of 'client:model::version' targets.")
+        pools[str(name)] = ModelPool(str(name), tuple(rule))
+    return MappingProxyType(pools)
+
+
+# Latency assumed for a target whose calls have all failed, e.g. a request timeout.
+FAILURE_LATENCY = 30.0
+
+
+class TargetHealth:
+    """
+    Exponentially weighted health statistics of one target.
+
+    Attributes:
+        latency (float, optional): EWMA of the latency of successful calls in seconds; None before the first one.
+        error_rate (float): EWMA of the share of failed calls.
+        in_flight (int): Number of calls currently running.
+        calls (int): Number of finished calls.
+    """
+    def __init__(self):
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.calls = 0
+
+    def score(self) -> float:
+        """
+        Expected time to serve one more request: the latency, scaled by the calls queued
+        ahead of it and by the expected number of attempts. Targets without finished calls
+        score their calls in flight, so a burst is spread over them before the first result;
+        targets whose calls all failed are scored with `FAILURE_LATENCY`.
+        """
+        if self.calls == 0:
+            return float(self.in_flight)
+        latency = FAILURE_LATENCY if self.latency is None else self.latency
+        return latency * (self.in_flight + 1) / max(1.0 - self.error_rate, 0.05)
+
+
+class LatencyRouter:
+    """
+    Picks the healthiest target of a pool per request.
+
+    Every target keeps an exponentially weighted moving average (EWMA) of its latency and error
+    rate, and a count of calls in flight; the target with the lowest `TargetHealth.score` is
+    chosen, so load shifts to the fastest healthy backend and away from slow, failing or busy ones.
+    Targets without measurements are tried first. With probability `explore`, a random target is
+    chosen instead, so a backend that recovered is noticed.
+
+    Only errors that would fail over a route (timeouts, connection errors, rate limits and server
+    errors) count against a target; invalid requests do not.
+
+    Attributes:
+        alpha (float): Weight of the newest observation in the averages.
+        explore (float): Probability of choosing a random target.
+
+    Example:
+        >>> router = LatencyRouter(alpha=0.2)
+        >>> target = router.choose(['openai:gpt-4o-mini::v1', 'grok:grok-2-latest::v1'])
+        >>> router.call(target, lambda: send(target))
+    """
+    def __init__(self, alpha: float = 0.3, explore: float = 0.05, rng: random.Random = None):
+        """
+        Args:
+            alpha (float): Weight of the newest observation in the averages, between 0 and 1.
+            explore (float): Probability of choosing a random target, between 0 and 1.
+            rng (random.Random, optional): Random number generator used for exploration.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be between 0 and 1.")
+        if not 0 <= explore <= 1:
+            raise ValueError("explore must be between 0 and 1.")
+        self.alpha = alpha
+        self.explore = explore
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._health: Dict[str, TargetHealth] = {}
+
+    def _get(self, target: str) -> TargetHealth:
+        health = self._health.get(target)
+        if health is None:
+            health = self._health[target] = TargetHealth()
+        return health
+
+    def choose(self, targets: Sequence[str]) -> str:
+        """
+        Returns the target with the lowest score; ties keep the configured order.
+        """
+        with self._lock:
+            if len(targets) > 1 and self.explore and self._rng.random() < self.explore:
+                return self._rng.choice(targets)
+            return min(targets, key=lambda target: self._get(target).score())
+
+    def started(self, target: str) -> float:
+        """
+        Counts a call to `target` as in flight.
+
+        Returns:
+            float: Start time to pass to `finished`.
+        """
+        with self._lock:
+            self._get(target).in_flight += 1
+        return time.perf_counter()
+
+    def finished(self, target: str, started_at: float, error: Optional[BaseException] = None) -> None:
+        """
+        Records the outcome of a call started with `started`.
+        """
+        latency = time.perf_counter() - started_at
+        failed = error is not None and should_failover(error)
+        with self._lock:
+            health = self._get(target)
+            health.in_flight -= 1
+            health.calls += 1
+            health.error_rate += self.alpha * (float(failed) - health.error_rate)
+            if error is None:
+                health.latency = latency if health.latency is None else health.latency + self.alpha * (latency - health.latency)
+
+    def abandoned(self, target: str) -> None:
+        """
+        Ends a call started with `started` without recording an outcome, e.g. a cancelled call.
+        """
+        with self._lock:
+            self._get(target).in_flight -= 1
+
+    def call(self, target: str, func: Callable[[], Any]) -> Any:
+        """
+        Calls `func`, recording its latency and outcome for `target`.
+        """
+        started_at = self.started(target)
+        try:
+            result = func()
+        except Exception as e:
+            self.finished(target, started_at, e)
+            raise
+        except BaseException:
+            self.abandoned(target)
+            raise
+        self.finished(target, started_at)
+        return result
+
+    async def acall(self, target: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Asynchronous version of `call`; `func` returns an awaitable.
+        """
+        started_at = self.started(target)
+        try:
+            result = await func()
+        except Exception as e:
+            self.finished(target, started_at, e)
+            raise
+        except BaseException:
+            # Cancelled, e.g. as the losing side of a hedged request: says nothing about the target.
+            self.abandoned(target)
+            raise
+        self.finished(target, started_at)
+        return result
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns `latency`, `error_rate`, `in_flight`, `calls` and `score` per target.
+        """
+        with self._lock:
+            return {target: {**vars(health), 'score': health.score()} for target, health in self._health.items()}
+
+
+__all__ = ['LatencyRouter', 'TargetHealth', 'ModelPool', 'parse_pools', 'POOLS_KEY', 'POOL_PREFIX', 'FAILURE_LATENCY']
@@ -0,0 +1,151 @@
+import copy
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from .retry import RetryPolicy
+
+
+# Top-level key of the custom configuration holding the routing rules; it is not a client.
+ROUTES_KEY = 'routes'
+
+
+class Route(NamedTuple):
+    """
+    An ordered failover chain of `client:model::version` targets.
+
+    Attributes:
+        name (str): Identifier callers pass instead of a `client:model::version` string. It may itself
+            be a `client:model::version` string, so existing calls fail over without code changes.
+        targets (tuple): Targets tried in order.
+        timeout (float, optional): Request timeout in seconds applied to every target, so a hung
+            provider fails over instead of blocking for the SDK default.
+    """
+    name: str
+    targets: Tuple[str, ...]
+    timeout: Optional[float] = None
+
+
+def parse_routes(config: Optional[Mapping[str, Any]]) -> Mapping[str, Route]:
+    """
+    Compiles the `routes` block of a custom configuration.
+
+    Each route maps a name to a list of targets, or to a mapping with `targets` and an optional
+    `timeout`:
+
+    ::
+
+        routes:
+            openai:gpt-4o-mini::v1:
+                - openai:gpt-4o-mini::v1
+                - grok:grok-2-latest::v1
+                - gemini:gemini-2.0-flash::default
+            chat:
+                targets: [fireworks, gemini]
+                timeout: 20
+
+    Args:
+        config (Mapping, optional): The loaded custom configuration.
+
+    Returns:
+        Mapping: Read-only mapping of route names to `Route` tuples.
+
+    Raises:
+        ValueError: If the `routes` block is malformed.
+    """
+    block = (config or {}).get(ROUTES_KEY) or {}
+    if not isinstance(block, Mapping):
+        raise ValueError(f"'{ROUTES_KEY}' must be a mapping of route names to targets.")
+    routes: Dict[str, Route] = {}
+    for name, rule in block.items():
+        timeout = None
+        if isinstance(rule, Mapping):
+            unknown = set(rule) - {'targets', 'timeout'}
+            if unknown:
+                raise ValueError(f"Unknown settings of route '{name}': {sorted(unknown)}")
+            timeout = rule.get('timeout')
+            if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+                raise ValueError(f"The timeout of route '{name}' must be a positive number.")
+            rule = rule.get('targets')
+        if not isinstance(rule, (list, tuple)) or not rule or not all(isinstance(target, str) and target for target in rule):
+            raise ValueError(f"Route '{name}' needs a non-empty list of 'client:model::version' targets.")
+        routes[str(name)] = Route(str(name), tuple(rule), timeout)
+    return MappingProxyType(routes)
+
+
+def should_failover(error: BaseException) -> bool:
+    """
+    Whether a failed request should be retried on the next target of a route.
+
+    The clients wrap SDK errors, so the whole cause chain is inspected: timeouts, connection
+    errors, rate limits and server errors fail over; invalid requests and configurations do not.
+
+    Args:
+        error (BaseException): The error raised by the target.
+
+    Returns:
+        bool: True if the next target should be tried.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if RetryPolicy.is_retryable(error):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class RoutedText(str):
+    """
+    Generated text served through a route, annotated with the target that produced it.
+
+    It behaves like a plain `str`.
+
+    Attributes:
+        target (str): The `client:model::version` target that served the request.
+        failures (list): `(target, error message)` pairs of the targets that failed before it.
+    """
+    target: str
+    failures: List[Tuple[str, str]]
+
+    def __new__(cls, text: str, target: str, failures: List[Tuple[str, str]] = None):
+        routed = super().__new__(cls, text)
+        routed.target = target
+        routed.failures = list(failures or [])
+        return routed
+
+
+def annotate(result: Any, target: str, failures: List[Tuple[str, str]]) -> Any:
+    """
+    Records the serving target on a result.
+
+    Text is returned as `RoutedText`; structured results are returned as a shallow copy with
+    `target` and `failures` attributes when they accept them. The result itself is left unchanged,
+    since it may be shared through the response cache or single-flight.
+    """
+    if isinstance(result, str):
+        return RoutedText(result, target, failures)
+    try:
+        annotated = copy.copy(result)
+        annotated.target = target
+        annotated.failures = list(failures)
+    except (AttributeError, TypeError, ValueError, copy.Error):
+        return result
+    return annotated
+
+
+class RoutingError(RuntimeError):
+    """
+    Raised when every target of a route failed.
+
+    Attributes:
+        route (str): Name of the route.
+        failures (list): `(target, error message)` pairs, in the order the targets were tried.
+    """
+    def __init__(self, route: str, failures: List[Tuple[str, str]]):
+        self.route = route
+        self.failures = failures
+        details = "; ".join(f"{target}: {message}" for target, message in failures)
+        super().__init__(f"All targets of route '{route}' failed: {details}")
+
+
+__all__ = ['Route', 'RoutedText', 'RoutingError', 'parse_routes', 'should_failover', 'annotate', 'ROUTES_KEY']
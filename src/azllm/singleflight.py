@@ -0,0 +1,189 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from .cache import make_cache_key
+
+
+_exclusive: ContextVar[bool] = ContextVar('azllm_single_flight_exclusive', default=False)
+
+
+def exclusive(func: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Wraps `func` so the requests it sends are never shared with identical requests in flight.
+
+    Used for hedged requests, whose point is to send a real duplicate.
+    """
+    def run():
+        token = _exclusive.set(True)
+        try:
+            return func()
+        finally:
+            _exclusive.reset(token)
+    return run
+
+
+def aexclusive(func: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """
+    Asynchronous version of `exclusive`; `func` returns an awaitable.
+    """
+    async def run():
+        token = _exclusive.set(True)
+        try:
+            return await func()
+        finally:
+            _exclusive.reset(token)
+    return run
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent identical requests.
+
+    The first caller of a key (the leader) makes the call; callers arriving with the same key
+    while it runs wait for it and receive the same result or error. Threads and asyncio tasks,
+    on any event loop, share calls with each other. Nothing is kept once the call finished, so
+    unlike a response cache, later requests are sent again.
+
+    If an asynchronous leader is cancelled, e.g. as the losing side of a hedged request, one of
+    the waiting callers makes the call instead.
+
+    Attributes:
+        leaders (int): Number of calls made.
+        shared (int): Number of requests that received the result of another caller's call.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> flight.do(make_cache_key('openai', params), lambda: client.chat.completions.create(**params))
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                return future, False
+            future = self._calls[key] = Future()
+            self.leaders += 1
+            return future, True
+
+    def _release(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the result of `compute`, sharing the call with concurrent callers of `key`.
+
+        Args:
+            key (str): Identifier of the request, e.g. from `make_cache_key`.
+            compute (Callable): Zero-argument callable making the call.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+        if _exclusive.get():
+            return compute()
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return future.result()
+            except CancelledError:
+                if not future.cancelled():
+                    raise
+        try:
+            result = compute()
+        except BaseException as e:
+            self._release(key, future)
+            future.set_exception(e)
+            raise
+        self._release(key, future)
+        future.set_result(result)
+        return result
+
+    async def ado(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Asynchronous version of `do`; `compute` returns an awaitable.
+        """
+        if _exclusive.get():
+            return await compute()
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                # Shielded, so a cancelled waiter does not cancel the shared call.
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            self._release(key, future)
+            future.cancel()
+            raise
+        except BaseException as e:
+            self._release(key, future)
+            future.set_exception(e)
+            raise
+        self._release(key, future)
+        future.set_result(result)
+        return result
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of calls currently running.
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Returns the counters `leaders` and `shared`, and the calls `in_flight`.
+        """
+        with self._lock:
+            return {'leaders': self.leaders, 'shared': self.shared, 'in_flight': len(self._calls)}
+
+
+def unique_requests(prompts: Sequence[str], kwargs: Sequence[dict], parse: Sequence[bool]) -> Tuple[List[int], List[int]]:
+    """
+    Finds the duplicate requests of a batch.
+
+    Args:
+        prompts (Sequence[str]): Prompts of the batch.
+        kwargs (Sequence[dict]): Parameter overrides per prompt.
+        parse (Sequence[bool]): Parse flag per prompt.
+
+    Returns:
+        tuple: The index of the first occurrence of every distinct request, and for every prompt
+        the position of its request in that list.
+
+    Example:
+        >>> unique_requests(['a', 'b', 'a'], [{}, {}, {}], [False] * 3)
+        ([0, 1], [0, 1, 0])
+    """
+    unique: List[int] = []
+    positions: List[int] = []
+    seen: Dict[str, int] = {}
+    for idx, request in enumerate(zip(prompts, kwargs, parse)):
+        key = make_cache_key(*request)
+        if key not in seen:
+            seen[key] = len(unique)
+            unique.append(idx)
+        positions.append(seen[key])
+    return unique, positions
+
+
+__all__ = ['SingleFlight', 'exclusive', 'aexclusive', 'unique_requests']
@@ -0,0 +1,236 @@
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+from .metrics import cached_prompt_tokens
+
+
+class _StreamState:
+    def __init__(self):
+        self.parts: List[str] = []
+        self.finish_reason: Optional[str] = None
+        self.usage: Any = None
+        self.started_at = time.perf_counter()
+        self.time_to_first_token: Optional[float] = None
+        self.done = False
+        self.aborted = False
+        self.callbacks: List[Callable[[SimpleNamespace], None]] = []
+        self.abort_callbacks: List[Callable[[Optional[BaseException]], None]] = []
+
+    def complete(self) -> None:
+        self.done = True
+        summary = self.summary()
+        for callback in self.callbacks:
+            callback(summary)
+
+    def abort(self, error: Optional[BaseException]) -> None:
+        # Runs once, and only for streams that end before they are exhausted.
+        if self.done or self.aborted:
+            return
+        self.aborted = True
+        for callback in self.abort_callbacks:
+            callback(error)
+
+    def consume(self, chunk: Any) -> Optional[str]:
+        usage = getattr(chunk, 'usage', None)
+        if usage is not None:
+            self.usage = usage
+        choices = getattr(chunk, 'choices', None) or []
+        if not choices:
+            return None
+        choice = choices[0]
+        if getattr(choice, 'finish_reason', None):
+            self.finish_reason = choice.finish_reason
+        delta = getattr(getattr(choice, 'delta', None), 'content', None)
+        if not delta:
+            return None
+        if self.time_to_first_token is None:
+            self.time_to_first_token = time.perf_counter() - self.started_at
+        self.parts.append(delta)
+        return delta
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.parts)
+
+    def summary(self) -> SimpleNamespace:
+        return SimpleNamespace(text=self.text, finish_reason=self.finish_reason, usage=self.usage,
+                               cached_tokens=cached_prompt_tokens(self.usage),
+                               time_to_first_token=self.time_to_first_token)
+
+
+class TextStream:
+    """
+    Iterator over the content deltas of a streamed chat completion.
+
+    Iterating yields each non-empty text delta as it arrives. Once the stream is exhausted,
+    `text`, `finish_reason` and `usage` hold the complete response, and `summary()` returns
+    them together. A stream that is closed early or fails while iterating calls its abort
+    callbacks instead of its done callbacks.
+
+    Example:
+        >>> stream = client.stream_text("Tell me a joke.")
+        >>> for delta in stream:
+        ...     print(delta, end="")
+        >>> stream.summary().finish_reason
+        'stop'
+    """
+    def __init__(self, stream: Any, on_complete: Optional[Callable[[SimpleNamespace], None]] = None,
+                 started_at: Optional[float] = None, on_abort: Optional[Callable[[Optional[BaseException]], None]] = None):
+        """
+        Args:
+            stream (Any): SDK stream of chat completion chunks.
+            on_complete (Callable, optional): Called with the summary once the stream is exhausted.
+            started_at (float, optional): `time.perf_counter()` value from before the request was sent.
+            on_abort (Callable, optional): Called if the stream ends before it is exhausted: with the
+                error raised while iterating, or None if it was closed or abandoned.
+        """
+        self._stream = stream
+        self._state = _StreamState()
+        if started_at is not None:
+            self._state.started_at = started_at
+        if on_complete is not None:
+            self._state.callbacks.append(on_complete)
+        if on_abort is not None:
+            self._state.abort_callbacks.append(on_abort)
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            for chunk in self._stream:
+                delta = self._state.consume(chunk)
+                if delta:
+                    yield delta
+        except BaseException as e:
+            # GeneratorExit when the caller stops iterating, CancelledError, KeyboardInterrupt: abandoned.
+            self._state.abort(e if isinstance(e, Exception) else None)
+            raise
+        self._state.complete()
+
+    @property
+    def text(self) -> str:
+        return self._state.text
+
+    @property
+    def finish_reason(self) -> Optional[str]:
+        return self._state.finish_reason
+
+    @property
+    def usage(self) -> Any:
+        return self._state.usage
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        return self._state.time_to_first_token
+
+    def summary(self) -> SimpleNamespace:
+        """
+        Returns the accumulated `text`, `finish_reason`, `usage`, `cached_tokens` and `time_to_first_token`.
+        """
+        return self._state.summary()
+
+    def add_done_callback(self, callback: Callable[[SimpleNamespace], None]) -> None:
+        """
+        Registers a function called with the summary once the stream is exhausted.
+        """
+        self._state.callbacks.append(callback)
+
+    def add_abort_callback(self, callback: Callable[[Optional[BaseException]], None]) -> None:
+        """
+        Registers a function called if the stream ends before it is exhausted, with the error or None.
+        """
+        self._state.abort_callbacks.append(callback)
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP response before the stream is exhausted.
+        """
+        self._state.abort(None)
+        close = getattr(self._stream, 'close', None)
+        if callable(close):
+            close()
+
+
+class AsyncTextStream:
+    """
+    Asynchronous iterator over the content deltas of a streamed chat completion.
+
+    The request is sent when iteration starts, so the stream can be consumed directly:
+
+    Example:
+        >>> async for delta in client.astream_text("Tell me a joke."):
+        ...     print(delta, end="")
+    """
+    def __init__(self, open_stream: Callable[[], Awaitable[Any]], on_complete: Optional[Callable[[SimpleNamespace], None]] = None,
+                 on_abort: Optional[Callable[[Optional[BaseException]], None]] = None):
+        """
+        Args:
+            open_stream (Callable): Coroutine function sending the request and returning the SDK stream.
+            on_complete (Callable, optional): Called with the summary once the stream is exhausted.
+            on_abort (Callable, optional): Called if the stream ends before it is exhausted: with the
+                error raised while opening or iterating it, or None if it was closed or abandoned.
+        """
+        self._open_stream = open_stream
+        self._stream = None
+        self._state = _StreamState()
+        if on_complete is not None:
+            self._state.callbacks.append(on_complete)
+        if on_abort is not None:
+            self._state.abort_callbacks.append(on_abort)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        self._state.started_at = time.perf_counter()
+        try:
+            self._stream = await self._open_stream()
+            async for chunk in self._stream:
+                delta = self._state.consume(chunk)
+                if delta:
+                    yield delta
+        except BaseException as e:
+            self._state.abort(e if isinstance(e, Exception) else None)
+            raise
+        self._state.complete()
+
+    @property
+    def text(self) -> str:
+        return self._state.text
+
+    @property
+    def finish_reason(self) -> Optional[str]:
+        return self._state.finish_reason
+
+    @property
+    def usage(self) -> Any:
+        return self._state.usage
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        return self._state.time_to_first_token
+
+    def summary(self) -> SimpleNamespace:
+        """
+        Returns the accumulated `text`, `finish_reason`, `usage`, `cached_tokens` and `time_to_first_token`.
+        """
+        return self._state.summary()
+
+    def add_done_callback(self, callback: Callable[[SimpleNamespace], None]) -> None:
+        """
+        Registers a function called with the summary once the stream is exhausted.
+        """
+        self._state.callbacks.append(callback)
+
+    def add_abort_callback(self, callback: Callable[[Optional[BaseException]], None]) -> None:
+        """
+        Registers a function called if the stream ends before it is exhausted, with the error or None.
+        """
+        self._state.abort_callbacks.append(callback)
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying HTTP response before the stream is exhausted.
+        """
+        self._state.abort(None)
+        if self._stream is not None:
+            await self._stream.close()
+
+
+__all__ = ['TextStream', 'AsyncTextStream']
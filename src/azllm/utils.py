@@ -1,9 +1,69 @@
 import yaml
 import os
+import tempfile
 from pathlib import Path
 import json
-from typing import Type, Optional
-from pydantic import BaseModel
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Type, Optional
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+# Ways to constrain structured outputs: JSON mode, a forced tool call, or the schema prompt alone.
+STRUCTURED_OUTPUT_MODES = ('json', 'tools', 'prompt')
+# Times invalid structured output is sent back for repair; separate from the retries of transient errors.
+STRUCTURED_OUTPUT_REPAIRS = 2
+
+# The LibYAML-based C implementations are much faster for large configurations.
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def read_config_file(path) -> dict:
+    """
+    Parse a YAML configuration file.
+
+    Args:
+        path (str or Path): Path of the file.
+
+    Returns:
+        dict: Parsed YAML content.
+
+    Raises:
+        OSError: If the file cannot be read.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    with open(path, 'r') as file:
+        return yaml.load(file, Loader=YAML_LOADER)
+
+
+def write_config_file(path, data: dict) -> None:
+    """
+    Write a YAML configuration file atomically.
+
+    The content is written to a temporary file in the same directory, flushed to disk and
+    renamed over `path`, so readers never see a partially written file.
+
+    Args:
+        path (str or Path): Path of the file.
+        data (dict): Configuration to write.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as file:
+            yaml.dump(data, file, Dumper=YAML_DUMPER, default_flow_style=False)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file as owner-only; keep the permissions of the file being replaced.
+        os.chmod(tmp_path, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
 
 def load_custom_config(config_dir: str, config_file: str) -> dict:
@@ -29,11 +89,10 @@ def load_custom_config(config_dir: str, config_file: str) -> dict:
         if not config_path.exists():
             raise FileNotFoundError(f"The configuration file '{config_file}' was not found in the directory '{config_dir}'.")
 
-        with open(config_path, 'r') as file:
-            try:
-                return yaml.safe_load(file)
-            except yaml.YAMLError as e:
-                raise ValueError(f"Error parsing YAML file '{config_file}': {e}")
+        try:
+            return read_config_file(config_path)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML file '{config_file}': {e}")
     
     except FileNotFoundError as fnf_error:
         print(fnf_error)
@@ -45,26 +104,28 @@ def load_custom_config(config_dir: str, config_file: str) -> dict:
         print(f"An error occurred while loading the configuration: {e}")
         return None
     
-def save_custom_configs(config_file: str, custom_configs):
+def save_custom_configs(config_file: str, custom_configs, config_dir: str = 'custom_configs'):
         """
         Save a custom configuration dictionary to a YAML file.
 
+        The file is replaced atomically, so a crash mid-write never leaves a corrupted file.
+
         Args:
             config_file (str): The name of the YAML file to write to.
             custom_configs (dict): The dictionary containing updated configuration data.
+            config_dir (str): Directory of the file; relative paths are resolved against the current directory.
 
         Returns:
             None
         """
 
-        config_dir = Path('custom_configs')
+        config_dir = Path(config_dir)
         config_file = config_dir / config_file
         
         config_dir.mkdir(parents=True, exist_ok=True)
     
-        with open(config_file, 'w') as f:
-            yaml.dump(custom_configs, f)
-            print(f"Custom configurations saved to {config_file}")
+        write_config_file(config_file, custom_configs)
+        print(f"Custom configurations saved to {config_file}")
 
  
 
@@ -90,62 +151,340 @@ def create_custom_file(config_dir_name: str, config_file_name: str, template_con
     template_file = config_dir / config_file_name
 
     if not template_file.exists():
-        with open(template_file, 'w') as file:
-            yaml.dump(template_content, file, default_flow_style=False)
+        write_config_file(template_file, template_content)
 
         print(f"Template YAML file created at {template_file}. You can now customize it.")
     else:
         print(f"The template YAML file already exists at {template_file}.")
 
 
-class StructuredOutput:
-    def _build_prompt(self, schema: Type[BaseModel]) -> str:
-        return (
-            "You are an API that returns structured data.\n"
-            "Return only a valid JSON object that matches this schema:\n"
-            f"{json.dumps(schema.model_json_schema(), indent=2)}\n"
-            "Do not include any extra text. Just the JSON."
-        )
-
-    def extract_json(self, text: str) -> dict:
-        """
-        Extracts a JSON object from text by tracking opening/closing braces.
-        Avoids relying on unsupported recursive regex (?R).
-        """
-        start = text.find("{")
-        if start == -1:
-            raise ValueError("No opening brace found in response.")
-
-        open_braces = 0
-        for i in range(start, len(text)):
-            if text[i] == "{":
-                open_braces += 1
-            elif text[i] == "}":
-                open_braces -= 1
-                if open_braces == 0:
-                    json_str = text[start:i + 1]
+@lru_cache(maxsize=256)
+def schema_prompt(schema: Type['BaseModel']) -> str:
+    """
+    Render the instructions asking for JSON that matches a Pydantic model's schema.
+
+    Prompts are memoized per model class, and the schema is serialized as compact JSON to
+    save prompt tokens. Call `schema_prompt.cache_clear()` after changing a model class at runtime.
+
+    Args:
+        schema (Type[BaseModel]): The Pydantic model.
+
+    Returns:
+        str: The schema prompt.
+    """
+    return (
+        "You are an API that returns structured data.\n"
+        "Return only a valid JSON object that matches this schema:\n"
+        f"{json.dumps(schema.model_json_schema(), separators=(',', ':'))}\n"
+        "Do not include any extra text. Just the JSON."
+    )
+
+
+@lru_cache(maxsize=256)
+def schema_tool(schema: Type['BaseModel']) -> dict:
+    """
+    Describe a Pydantic model as a function tool, for providers that constrain output through tool calling.
+
+    Args:
+        schema (Type[BaseModel]): The Pydantic model.
+
+    Returns:
+        dict: The tool definition, in the chat completions `tools` format; memoized per model class.
+    """
+    function = {'name': schema.__name__, 'parameters': schema.model_json_schema()}
+    description = (schema.__doc__ or '').strip()
+    if description:
+        function['description'] = description
+    return {'type': 'function', 'function': function}
+
+
+@lru_cache(maxsize=1024)
+def structured_system_prompt(schema: Type['BaseModel'], user_system_prompt: Optional[str] = None,
+                             schema_first: bool = False) -> str:
+    """
+    Combine a user system prompt with the schema prompt of a Pydantic model; memoized.
+    """
+    structured_prompt = schema_prompt(schema)
+
+    if user_system_prompt and schema_first:
+        return f"{structured_prompt}\n\n{user_system_prompt.strip()}"
+    if user_system_prompt:
+        return f"{user_system_prompt.strip()}\n\n{structured_prompt}"
+    return structured_prompt
+
+
+_DECODER = json.JSONDecoder()
+_FENCED_BLOCK = re.compile(r"```(?:json|JSON)?[ \t]*\n?(.*?)```", re.DOTALL)
+_JSON_START = re.compile(r"[{\[]")
+
+
+def _decode_first(text: str) -> Any:
+    # Objects win over arrays: in 'According to [1], the answer is {...}' the array is a citation.
+    # Scanning resumes after a decoded array, so objects nested in it are not candidates.
+    error, array, pos = None, None, 0
+    while True:
+        match = _JSON_START.search(text, pos)
+        if match is None:
+            break
+        try:
+            value, end = _DECODER.raw_decode(text, match.start())
+        except json.JSONDecodeError as e:
+            error = error or e
+            pos = match.end()
+            continue
+        if not isinstance(value, list):
+            return value
+        if array is None:
+            array = value
+        pos = end
+    if array is not None:
+        return array
+    if error is None:
+        raise ValueError("No opening brace found in response.")
+    raise ValueError(f"Invalid JSON: {error}")
+
+
+class IncrementalJSONParser:
+    """
+    Finds the first JSON object or array in text that arrives in pieces, e.g. a streamed response.
+
+    Each `feed` only scans the new text, tracking nesting depth and string literals, so an object
+    is decoded as soon as its closing brace arrives instead of after the stream ends. A candidate
+    that turns out not to be valid JSON, e.g. '[the JSON]' in the prose before it, is skipped. Like
+    `StructuredOutput.extract_json`, objects win over arrays: a complete array, e.g. the citation in
+    'According to [1], ...', is only returned by `close` if no object follows it.
+
+    Example:
+        >>> parser = IncrementalJSONParser()
+        >>> for delta in manager.stream_text('openai', prompt):
+        ...     if parser.feed(delta) is not None:
+        ...         break
+        >>> parser.value
+        {'capital': 'Paris'}
+    """
+    _OUTSIDE_STRING = re.compile(r'["{}\[\]]')
+    _INSIDE_STRING = re.compile(r'["\\]')
+
+    def __init__(self):
+        self.buffer = ''
+        self.value: Any = None
+        self.complete = False
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._pos = 0
+        self._error: Optional[json.JSONDecodeError] = None
+        self._array: Optional[list] = None
+
+    def feed(self, text: str) -> Any:
+        """
+        Adds text and returns the decoded value once it is complete.
+
+        Args:
+            text (str): The next piece of the response.
+
+        Returns:
+            Any: The decoded object, or None until one is complete. After completion, further text
+            is ignored and the value is returned again.
+        """
+        if self.complete:
+            return self.value
+        self.buffer += text
+        buffer, pos = self.buffer, self._pos
+        while True:
+            if self._in_string:
+                match = self._INSIDE_STRING.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == '\\':
+                    if match.end() == len(buffer):
+                        # The escaped character has not arrived yet.
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+            match = self._OUTSIDE_STRING.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char, pos = match.group(), match.end()
+            if char == '"':
+                self._in_string = self._start is not None
+            elif char in '{[':
+                if self._start is None:
+                    self._start = match.start()
+                self._depth += 1
+            elif self._start is not None:
+                self._depth -= 1
+                if self._depth == 0:
                     try:
-                        return json.loads(json_str)
+                        value = _DECODER.raw_decode(buffer, self._start)[0]
                     except json.JSONDecodeError as e:
-                        raise ValueError(f"Invalid JSON: {e}")
-        raise ValueError("Could not find matching closing brace for JSON.")
+                        # Not JSON after all: look for the next candidate after its opening bracket.
+                        self._error = self._error or e
+                        pos, self._start, self._depth = self._start + 1, None, 0
+                        continue
+                    self._start = None
+                    if isinstance(value, list):
+                        # Kept as a fallback; scanning resumes after it, skipping objects nested in it.
+                        if self._array is None:
+                            self._array = value
+                        continue
+                    self.value, self.complete = value, True
+                    return self.value
+        self._pos = pos
+        return None
+
+    def close(self) -> Any:
+        """
+        Marks the end of the text and returns the decoded value.
+
+        Returns:
+            Any: The decoded object, or the first complete array if no object was found.
+
+        Raises:
+            ValueError: If the text contained no valid JSON object or array.
+        """
+        if self.complete:
+            return self.value
+        if self._array is not None:
+            self.value, self.complete = self._array, True
+            return self.value
+        if self._error is not None:
+            raise ValueError(f"Invalid JSON: {self._error}")
+        raise ValueError("No complete JSON value found in response.")
+
+    def reset(self) -> None:
+        """
+        Clears the buffer to parse another value.
+        """
+        self.__init__()
+
+
+class StructuredOutput:
+    def _build_prompt(self, schema: Type['BaseModel']) -> str:
+        return schema_prompt(schema)
+
+    def extract_json(self, text: str) -> Any:
+        """
+        Extracts the first JSON object or array from a model response.
+
+        Fenced code blocks (```json ... ```) are tried first. Otherwise each `{` or `[` is tried in
+        order with `json.JSONDecoder.raw_decode`, which parses in C and handles braces inside string
+        literals. The first object that decodes is returned; an array only if no object follows it,
+        so a citation like '[1]' in the prose does not hide the answer.
+
+        Args:
+            text (str): The model response.
+
+        Returns:
+            Any: The decoded object (dict) or array (list).
+
+        Raises:
+            ValueError: If the response contains no JSON object or array, or only invalid JSON.
+        """
+        for match in _FENCED_BLOCK.finditer(text):
+            try:
+                return _decode_first(match.group(1))
+            except ValueError:
+                pass
+        return _decode_first(text)
+
+    def tool_params(self, schema: Type['BaseModel']) -> dict:
+        """
+        Returns the `tools` and `tool_choice` parameters forcing a call of the schema's tool.
+        """
+        return {
+            'tools': [schema_tool(schema)],
+            'tool_choice': {'type': 'function', 'function': {'name': schema.__name__}},
+        }
+
+    def parse_message(self, message: Any, schema: Type['BaseModel']) -> 'BaseModel':
+        """
+        Validates a response message against a Pydantic model.
+
+        The arguments of the first tool call are used if the message has one, and the JSON in
+        its content otherwise.
+
+        Raises:
+            ValueError: If no valid JSON is found or it does not match the schema
+                (`pydantic.ValidationError` is a `ValueError`).
+        """
+        tool_calls = getattr(message, 'tool_calls', None)
+        if isinstance(tool_calls, list) and tool_calls:
+            text = tool_calls[0].function.arguments
+        else:
+            text = (getattr(message, 'content', None) or '').strip()
+        return schema.model_validate(self.extract_json(text))
+
+    def repair_messages(self, message: Any, error: Exception) -> list:
+        """
+        Builds the messages that return a validation error to the model, so it can correct its output.
+
+        Args:
+            message (Any): The response message that failed validation.
+            error (Exception): The validation error.
+
+        Returns:
+            list: The assistant's message followed by the error, as a tool result for tool calls
+            or as a user message otherwise.
+        """
+        tool_calls = getattr(message, 'tool_calls', None)
+        if isinstance(tool_calls, list) and tool_calls:
+            call = tool_calls[0]
+            return [
+                {'role': 'assistant', 'content': getattr(message, 'content', None) or '',
+                 'tool_calls': [{'id': call.id, 'type': 'function',
+                                 'function': {'name': call.function.name, 'arguments': call.function.arguments}}]},
+                {'role': 'tool', 'tool_call_id': call.id,
+                 'content': f"The arguments are invalid: {error}\nCall {call.function.name} again with corrected arguments."},
+            ]
+        return [
+            {'role': 'assistant', 'content': getattr(message, 'content', None) or ''},
+            {'role': 'user', 'content': f"The response is invalid: {error}\nReturn only the corrected JSON object."},
+        ]
 
     def format_system_message(
         self,
-        response_format: Type[BaseModel],
-        user_system_prompt: Optional[str] = None) -> dict:
+        response_format: Type['BaseModel'],
+        user_system_prompt: Optional[str] = None,
+        schema_first: bool = False) -> dict:
         """
         Formats a system message combining a user prompt and a schema prompt.
+
+        With `schema_first`, the schema prompt leads, so requests sharing a schema share a
+        byte-identical prefix even when their system prompts differ (for provider prompt caching).
+        The rendered prompt is memoized, so repeated requests with the same model class and
+        system prompt do not regenerate the schema.
         """
-        structured_prompt = self._build_prompt(response_format)
+        return {"role": "system", "content": structured_system_prompt(response_format, user_system_prompt, schema_first)}
+      
 
-        if user_system_prompt:
-            combined_prompt = f"{user_system_prompt.strip()}\n\n{structured_prompt}"
-        else:
-            combined_prompt = structured_prompt
+def with_cache_breakpoint(messages: list, index: int) -> list:
+    """
+    Marks the end of a static prompt prefix with an Anthropic `cache_control` breakpoint.
+
+    The message at `index` is copied with its text content turned into a content block carrying
+    `{"type": "ephemeral"}` cache control; the provider caches everything up to and including it.
+
+    Args:
+        messages (list): Chat messages of a request.
+        index (int): Position of the last message of the static prefix.
+
+    Returns:
+        list: A new list of messages; the input is not modified.
+    """
+    message = messages[index]
+    content = message.get('content')
+    if not isinstance(content, str):
+        return list(messages)
+    marked = {**message, 'content': [{'type': 'text', 'text': content, 'cache_control': {'type': 'ephemeral'}}]}
+    return [*messages[:index], marked, *messages[index + 1:]]
 
-        return {"role": "system", "content": combined_prompt}
-      
 
 template_content = {'openai':
                      {'models': [
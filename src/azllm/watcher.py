@@ -0,0 +1,170 @@
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .configtable import RESERVED_KEYS, ConfigTable, split_client_model_version
+from .utils import read_config_file
+
+
+DEFAULT_WATCH_INTERVAL = 2.0
+
+
+def validate_config(config: Any) -> ConfigTable:
+    """
+    Validates a parsed custom configuration and compiles its resolved-config table.
+
+    Every model entry must name its model, and its `rate_limits`, `retry` and `circuit_breaker`
+    blocks must only use known settings. Every target of the `routes` block must be a configured model, and
+    every target of the `pools` block a configured model or route.
+
+    Args:
+        config (Any): The parsed YAML content.
+
+    Returns:
+        ConfigTable: The compiled table.
+
+    Raises:
+        ValueError: If the configuration is invalid.
+    """
+    from .breaker import CircuitBreaker
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+
+    if not isinstance(config, dict) or not config:
+        raise ValueError("The configuration file must contain a mapping of clients.")
+    for client_name, client_configs in config.items():
+        if client_name in RESERVED_KEYS:
+            continue
+        if not isinstance(client_configs, dict) or not isinstance(client_configs.get('models', []), list):
+            raise ValueError(f"Client configs for '{client_name}' must be a mapping with a 'models' list.")
+        for model_config in client_configs.get('models') or []:
+            if not isinstance(model_config, dict) or 'model' not in model_config:
+                raise ValueError(f"Every model of '{client_name}' needs a 'model' name.")
+    try:
+        table = ConfigTable(config)
+    except Exception as e:
+        raise ValueError(f"Invalid configuration: {e}") from e
+    for key, entry in table.items():
+        try:
+            RateLimiter.from_config(entry.config.get('rate_limits'))
+            RetryPolicy.from_config(entry.config.get('retry'))
+            CircuitBreaker.from_config(entry.config.get('circuit_breaker'))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid configuration for '{key[0]}:{key[1]}::{key[2]}': {e}") from e
+    for route in table.routes.values():
+        for target in route.targets:
+            try:
+                table.lookup(*split_client_model_version(target))
+            except ValueError as e:
+                raise ValueError(f"Invalid target '{target}' of route '{route.name}': {e}") from e
+    for pool in table.pools.values():
+        for target in pool.targets:
+            if target in table.routes:
+                continue
+            try:
+                table.lookup(*split_client_model_version(target))
+            except ValueError as e:
+                raise ValueError(f"Invalid target '{target}' of pool '{pool.name}': {e}") from e
+    return table
+
+
+class ConfigWatcher:
+    """
+    Watches a configuration file and applies valid changes without a restart.
+
+    A background thread polls the file's modification time and size. When they change, the file
+    is re-parsed and validated on that thread, and `on_change` receives the new configuration
+    and its compiled `ConfigTable`. Invalid files are reported through `on_error` and the previous
+    configuration stays in effect.
+
+    Example:
+        >>> watcher = ConfigWatcher('custom_configs/config.yaml', lambda config, table: print(len(table)))
+        >>> watcher.start()
+        >>> watcher.stop()
+    """
+    def __init__(self, path: Union[str, Path], on_change: Callable[[Dict[str, Any], ConfigTable], None],
+                 interval: float = DEFAULT_WATCH_INTERVAL, on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Args:
+            path (str or Path): Configuration file to watch.
+            on_change (Callable): Called with the new configuration and its table after a valid change.
+            interval (float): Seconds between polls.
+            on_error (Callable, optional): Called with the error when a changed file is invalid.
+                By default the error is printed.
+        """
+        self.path = Path(path)
+        self.on_change = on_change
+        self.interval = interval
+        self.on_error = on_error
+        self.reloads = 0
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """
+        Polls the file once and applies it if it changed.
+
+        Returns:
+            bool: True if a new configuration was applied.
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            config = read_config_file(self.path)
+            table = validate_config(config)
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(e)
+            else:
+                print(f"Ignoring invalid configuration change in '{self.path}': {e}")
+            return False
+        self.on_change(config, table)
+        self.reloads += 1
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'ConfigWatcher':
+        """
+        Starts polling in a daemon thread.
+        """
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"azllm-config-watcher:{self.path.name}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops polling and waits for the thread to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'ConfigWatcher':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+__all__ = ['ConfigWatcher', 'validate_config', 'DEFAULT_WATCH_INTERVAL']
@@ -0,0 +1,87 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from azllm.base import UNIClient
+from azllm.clients import CLIENT_MODULES, get_client_class
+
+
+class EchoClient(UNIClient):
+    name = 'echo'
+    display_name = 'Echo'
+    api_key_env = 'ECHO_API_KEY'
+    default_config = {'model': 'echo-1',
+                      'system_message': 'You are an echo.',
+                      'temperature': 1,
+                      'max_tokens': 16,
+                      'max_concurrency': 2,
+                      'kwargs': {}}
+
+    def create_client(self):
+        return self.sdk
+
+    def create_async_client(self):
+        return self.async_sdk
+
+
+def completion(content):
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))], usage=None)
+
+
+@pytest.fixture
+def client():
+    client = EchoClient()
+    client.sdk = MagicMock()
+    client.sdk.chat.completions.create.side_effect = lambda **params: completion(params["messages"][-1]["content"])
+    client.async_sdk = MagicMock()
+    client.async_sdk.chat.completions.create = AsyncMock(side_effect=lambda **params: completion("async"))
+    return client
+
+
+@pytest.mark.parametrize("name", list(CLIENT_MODULES))
+def test_builtin_clients_share_the_pipeline(name):
+    client_class = get_client_class(name)
+
+    assert issubclass(client_class, UNIClient)
+    assert client_class.name == name
+    assert client_class.get_default_config() is client_class.default_config
+    assert '_build_params' not in vars(client_class)
+    assert 'generate_text' not in vars(client_class)
+
+def test_provider_capabilities():
+    params, _ = get_client_class('grok')()._build_params("Hi")
+    assert "frequency_penalty" not in params
+    params, _ = get_client_class('fireworks')()._build_params("Hi")
+    assert params["frequency_penalty"] == 0
+
+    openai_params, _ = get_client_class('openai')()._build_params("Hi", {"prompt_cache": True})
+    anthropic_params, _ = get_client_class('anthropic')()._build_params("Hi", {"prompt_cache": True})
+    assert openai_params["messages"][0] == {"role": "system", "content": "You are an advanced AI assistant."}
+    assert anthropic_params["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+def test_minimal_subclass_generates_and_batches(client):
+    assert client.generate_text("Hi") == "Hi"
+    assert client.batch_generate(["a", "b", "c"]) == ["a", "b", "c"]
+    assert asyncio.run(client.agenerate_text("Hi")) == "async"
+    assert client.metrics_key.startswith("echo:echo-1")
+
+def test_native_parse_uses_parse_endpoint(client):
+    client.sdk.beta.chat.completions.parse.return_value = completion("parsed")
+
+    message = client.generate_text("Hi", {"response_format": dict}, parse=True)
+
+    assert message.content == "parsed"
+    assert client.sdk.beta.chat.completions.parse.call_args.kwargs["response_format"] is dict
+    assert not client.sdk.chat.completions.create.called
+
+def test_native_cache_key_excludes_response_format(client):
+    params, response_format = client._build_params("Hi")
+
+    assert response_format is None
+    assert client._cache_key(params, response_format, False) == ("echo", params, False)
+
+def test_missing_api_key(monkeypatch):
+    monkeypatch.delenv("ECHO_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="A valid API Key for Echo is missing"):
+        EchoClient().get_api_key()
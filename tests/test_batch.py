@@ -0,0 +1,100 @@
+import json
+import pytest
+from openai import OpenAI
+from pydantic import BaseModel
+
+from azllm import azLLM
+from azllm.batch import BatchJob, build_batch_file, submit_batch
+from azllm.clients.openai import OpenAIClient
+from azllm.mockserver import MockOpenAIServer
+
+
+class Answer(BaseModel):
+    text: str
+
+
+@pytest.fixture
+def server():
+    with MockOpenAIServer(batch_polls_until_complete=2) as server:
+        yield server
+
+
+@pytest.fixture
+def sdk_client(server):
+    client = OpenAI(api_key="test", base_url=server.base_url, max_retries=0)
+    yield client
+    client.close()
+
+
+def test_build_batch_file_uses_prompt_index_as_custom_id():
+    content = build_batch_file([{"model": "m", "messages": []}, {"model": "m", "response_format": Answer}])
+    lines = [json.loads(line) for line in content.decode("utf-8").splitlines()]
+
+    assert [line["custom_id"] for line in lines] == ["0", "1"]
+    assert lines[0]["url"] == "/v1/chat/completions"
+    assert lines[1]["body"]["response_format"]["type"] == "json_schema"
+    assert lines[1]["body"]["response_format"]["json_schema"]["name"] == "Answer"
+
+def test_submit_batch_requires_prompts(sdk_client):
+    with pytest.raises(ValueError):
+        submit_batch(sdk_client, [])
+
+def test_batch_job_polls_and_returns_results_in_prompt_order(sdk_client):
+    requests = [{"model": "m", "messages": [{"role": "user", "content": f"prompt {i}"}]} for i in range(5)]
+    job = submit_batch(sdk_client, requests)
+
+    assert isinstance(job, BatchJob)
+    assert not job.done
+    with pytest.raises(RuntimeError):
+        job.results()
+
+    job.wait(poll_interval=0.01)
+
+    assert job.status == "completed"
+    assert job.results() == [f"Echo: prompt {i}" for i in range(5)]
+
+def test_batch_job_reports_failed_requests_in_place(sdk_client):
+    requests = [
+        {"model": "m", "messages": [{"role": "user", "content": "ok"}]},
+        {"model": "fail", "messages": [{"role": "user", "content": "bad"}]},
+        {"model": "m", "messages": [{"role": "user", "content": "fine"}]},
+    ]
+    results = submit_batch(sdk_client, requests).wait(poll_interval=0.01).results()
+
+    assert results[0] == "Echo: ok"
+    assert results[1].startswith("Error:")
+    assert results[2] == "Echo: fine"
+
+def test_batch_job_wait_times_out(server, sdk_client):
+    server.batch_polls_until_complete = 100
+    job = submit_batch(sdk_client, [{"model": "m", "messages": []}])
+
+    with pytest.raises(TimeoutError):
+        job.wait(poll_interval=0.05, timeout=0.01)
+
+    assert job.cancel() == "cancelled"
+
+def test_client_submit_batch_builds_requests_from_config(sdk_client):
+    client = OpenAIClient({"model": "gpt-4o-mini", "parameters": {"system_message": "Be brief."}})
+    client.client = sdk_client
+
+    job = client.submit_batch(["Hi", "Bye"], [{}, {"temperature": 0}])
+    assert job.wait(poll_interval=0.01).results() == ["Echo: Hi", "Echo: Bye"]
+
+    with pytest.raises(ValueError):
+        client.submit_batch(["Hi"], [{}, {}])
+
+def test_azllm_bulk_generate_against_mock_server(server, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+
+    with azLLM() as llm:
+        results = llm.bulk_generate("openai", ["one", "two", "three"], poll_interval=0.01)
+
+    assert results == ["Echo: one", "Echo: two", "Echo: three"]
+
+def test_azllm_submit_batch_rejects_unsupported_clients():
+    llm = azLLM()
+
+    with pytest.raises(ValueError, match="does not support batch jobs"):
+        llm.submit_batch("ollama", ["Hi"])
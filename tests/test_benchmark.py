@@ -0,0 +1,58 @@
+import pytest
+from openai import OpenAI, RateLimitError, InternalServerError
+
+from azllm.benchmark import format_results, measure_import_time, percentile, run_benchmark
+from azllm.mockserver import MockOpenAIServer
+
+
+def test_percentile_interpolates():
+    assert percentile([1, 2, 3, 4], 0.5) == pytest.approx(2.5)
+    assert percentile([5], 0.99) == 5
+
+def test_mock_server_injects_rate_limits_and_errors():
+    with MockOpenAIServer(rate_limit_rate=1.0, retry_after=2) as server:
+        client = OpenAI(api_key="test", base_url=server.base_url, max_retries=0)
+        with pytest.raises(RateLimitError) as excinfo:
+            client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}])
+        assert excinfo.value.response.headers["retry-after"] == "2"
+
+        server.rate_limit_rate, server.error_rate = 0.0, 1.0
+        with pytest.raises(InternalServerError):
+            client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}])
+
+        assert server.status_counts == {429: 1, 500: 1}
+        client.close()
+
+def test_mock_server_simulates_latency():
+    with MockOpenAIServer(latency=0.05, seed=1) as server:
+        client = OpenAI(api_key="test", base_url=server.base_url, max_retries=0)
+        client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}])
+        assert server.processing_times[0] >= 0.05
+        client.close()
+
+def test_run_benchmark_reports_each_method_and_level():
+    rows = run_benchmark(concurrency_levels=(1, 2), requests=4, latency=0.0, jitter=0.0)
+
+    assert [(row["method"], row["concurrency"]) for row in rows] == [
+        ("generate_text", 1), ("generate_text", 2),
+        ("batch_generate", 1), ("batch_generate", 2),
+        ("generate_parallel", 1), ("generate_parallel", 2),
+    ]
+    assert all(row["requests"] == 4 and row["errors"] == 0 for row in rows)
+    assert all(row["throughput"] > 0 for row in rows)
+
+    table = format_results(rows)
+    assert "generate_parallel" in table
+    assert "overhead ms" in table
+
+def test_run_benchmark_rejects_unknown_methods():
+    with pytest.raises(ValueError, match="Unknown benchmark method"):
+        run_benchmark(methods=["stream"], concurrency_levels=(1,), requests=1, latency=0.0, jitter=0.0)
+
+def test_measure_import_time_reports_azllm():
+    result = measure_import_time(runs=1, top=3)
+
+    assert result["total_ms"] > 0
+    assert "azllm" in result["modules"]
+    assert "openai" not in result["modules"]
+    assert len(result["slowest"]) == 3
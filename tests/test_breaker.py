@@ -0,0 +1,177 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from azllm import azLLM
+from azllm import breaker as breaker_module
+from azllm.breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from azllm.clients.openai import OpenAIClient
+from azllm.router import LatencyRouter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class BadRequest(Exception):
+    status_code = 400
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(breaker_module, "_registry", {})
+
+
+def test_opens_on_failure_rate_and_closes_after_trial():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, reset_timeout=10, clock=clock)
+    for success in (True, False, True):
+        permit = breaker.allow()
+        assert permit
+        breaker.record(permit, success)
+    assert breaker.state == "closed"
+
+    breaker.record(breaker.allow(), False)
+    assert breaker.state == "open"
+    assert breaker.allow() is None
+    assert breaker.retry_in() == 10
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    trial = breaker.allow()
+    assert trial.trial
+    assert breaker.allow() is None
+    breaker.record(trial, True)
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["calls"] == 0
+
+def test_failed_trial_reopens():
+    clock = Clock()
+    breaker = CircuitBreaker(min_calls=1, reset_timeout=5, clock=clock)
+    breaker.record(breaker.allow(), False)
+    clock.now = 5
+
+    breaker.record(breaker.allow(), False)
+    assert breaker.state == "open"
+    assert breaker.opened == 2
+
+def test_neutral_outcomes_release_trials():
+    clock = Clock()
+    breaker = CircuitBreaker(min_calls=1, reset_timeout=0, clock=clock)
+    breaker.record(breaker.allow(), False)
+
+    breaker.record(breaker.allow(), None)
+    assert breaker.state == "half_open"
+    assert breaker.available()
+
+def test_outcomes_of_earlier_states_are_ignored():
+    clock = Clock()
+    breaker = CircuitBreaker(min_calls=1, reset_timeout=5, clock=clock)
+    slow, cancelled = breaker.allow(), breaker.allow()
+    breaker.record(breaker.allow(), False)
+    clock.now = 5
+    trial = breaker.allow()
+
+    # Requests sent before the circuit opened neither release nor complete the trial.
+    breaker.record(cancelled, None)
+    breaker.record(slow, True)
+    assert breaker.state == "half_open"
+    assert not breaker.available()
+
+    breaker.record(trial, True)
+    assert breaker.state == "closed"
+    breaker.record(trial, False)
+    assert breaker.snapshot()["calls"] == 0
+
+def test_registry_scopes():
+    assert get_circuit_breaker("openai", "gpt-4o", None) is None
+    shared = get_circuit_breaker("openai", "gpt-4o", {"min_calls": 3})
+
+    assert get_circuit_breaker("openai", "gpt-4o-mini", {"min_calls": 3}) is shared
+    assert shared.key == "openai"
+    assert get_circuit_breaker("openai", "gpt-4o", {"min_calls": 3, "scope": "model"}).key == "openai:gpt-4o"
+    with pytest.raises(ValueError, match="Unknown circuit breaker settings"):
+        CircuitBreaker.from_config({"threshold": 0.5})
+
+def test_client_fails_fast_while_open():
+    config = {"retry": {"max_attempts": 1}, "circuit_breaker": {"min_calls": 2}}
+    with patch("azllm.clients.openai.OpenAI") as mock_openai:
+        create = mock_openai.return_value.chat.completions.create
+        client = OpenAIClient(config)
+        client.get_api_key = lambda: "mock-key"
+
+        create.side_effect = BadRequest("invalid")
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="invalid"):
+                client.generate_text("Hi")
+        assert client.circuit_breaker.state == "closed"
+
+        create.side_effect = TimeoutError("timed out")
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="timed out"):
+                client.generate_text("Hi")
+        assert client.circuit_breaker.state == "open"
+
+        with pytest.raises(RuntimeError, match="Circuit for 'openai' is open") as error:
+            client.generate_text("Hi")
+        assert isinstance(error.value.__cause__, CircuitOpenError)
+        assert create.call_count == 4
+
+def test_cancelled_trial_is_released():
+    clock = Clock()
+    with patch("azllm.clients.openai.AsyncOpenAI") as mock_async:
+        async def hang(**params):
+            await asyncio.sleep(5)
+
+        mock_async.return_value.chat.completions.create = hang
+        client = OpenAIClient({"circuit_breaker": {"min_calls": 1, "reset_timeout": 10}})
+        client.get_api_key = lambda: "mock-key"
+        breaker = client.circuit_breaker
+        breaker._clock = clock
+        breaker.record(breaker.allow(), False)
+        clock.now = 1000
+
+        async def main():
+            task = asyncio.ensure_future(client.agenerate_text("Hi"))
+            await asyncio.sleep(0.01)
+            assert not breaker.available()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert breaker.state == "half_open"
+        assert breaker.available()
+
+def test_azllm_exposes_states_and_pools_skip_open_circuits(tmp_path, monkeypatch):
+    config = {
+        "openai": {"retry": {"max_attempts": 1}, "circuit_breaker": {"min_calls": 1},
+                   "models": [{"model": "gpt-4o-mini", "version": "v1"}]},
+        "grok": {"models": [{"model": "grok-2", "version": "v1"}]},
+        "pools": {"chat": ["openai:gpt-4o-mini::v1", "grok:grok-2::v1"]},
+    }
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XAI_API_KEY", "mock-key")
+    (tmp_path / "custom_configs").mkdir()
+    (tmp_path / "custom_configs" / "config.yaml").write_text(yaml.safe_dump(config))
+    with patch("azllm.clients.grok.OpenAI") as grok:
+        grok.return_value.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="grok"))], usage=None)
+        llm = azLLM(custom=True)
+        llm.router = LatencyRouter(explore=0)
+
+        assert llm.is_available("openai:gpt-4o-mini::v1")
+        breaker = llm.circuit_breaker("openai:gpt-4o-mini::v1")
+        breaker.record(breaker.allow(), False)
+
+        assert not llm.is_available("openai:gpt-4o-mini::v1")
+        assert llm.is_available("grok:grok-2::v1")
+        assert llm.circuit_states()["openai"]["state"] == "open"
+        assert llm.generate_text("pool:chat", "Hi").target == "grok:grok-2::v1"
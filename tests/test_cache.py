@@ -0,0 +1,139 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from openai.types.chat import ParsedChatCompletionMessage
+from pydantic import BaseModel
+
+from azllm import azLLM
+from azllm.cache import MemoryCache, SQLiteCache, make_cache_key, cached_call, acached_call
+from azllm.clients.openai import OpenAIClient
+
+
+class Capital(BaseModel):
+    capital: str
+
+
+def test_make_cache_key_is_canonical():
+    params_1 = {'model': 'gpt-4o-mini', 'temperature': 0, 'messages': [{'role': 'user', 'content': 'Hi'}]}
+    params_2 = {'messages': [{'content': 'Hi', 'role': 'user'}], 'temperature': 0, 'model': 'gpt-4o-mini'}
+
+    assert make_cache_key('openai', params_1, False) == make_cache_key('openai', params_2, False)
+    assert make_cache_key('openai', params_1, False) != make_cache_key('ollama', params_1, False)
+    assert make_cache_key('openai', {**params_1, 'response_format': Capital}, True) == \
+        make_cache_key('openai', {**params_2, 'response_format': Capital}, True)
+
+def test_make_cache_key_memoizes_model_schemas():
+    class Invoice(BaseModel):
+        total: float
+
+    params = {'model': 'gpt-4o-mini', 'response_format': Invoice}
+    with patch.object(Invoice, "model_json_schema", wraps=Invoice.model_json_schema) as schema:
+        keys = {make_cache_key('openai', params, True) for _ in range(3)}
+
+    assert len(keys) == 1
+    assert schema.call_count == 1
+
+def test_memory_cache_lru_and_stats():
+    cache = MemoryCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'size': 2}
+
+def test_memory_cache_ttl(monkeypatch):
+    cache = MemoryCache(ttl=10)
+    cache.set('a', 1)
+    now = time.time()
+    monkeypatch.setattr("azllm.cache.time.time", lambda: now + 11)
+    assert cache.get('a') is None
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = SQLiteCache(path, max_entries=2)
+    cache.set('a', SimpleNamespace(raw='raw', parsed=Capital(capital='Paris')))
+    cache.set('b', 'B')
+    cache.set('c', 'C')
+    cache.close()
+
+    reopened = SQLiteCache(path, max_entries=2)
+    assert len(reopened) == 2
+    assert reopened.get('a') is None
+    assert reopened.get('c') == 'C'
+    reopened.clear()
+    assert len(reopened) == 0
+    reopened.close()
+
+def test_sqlite_cache_stores_parsed_outputs(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    cache.set('a', SimpleNamespace(raw='raw', parsed=Capital(capital='Paris')))
+    assert cache.get('a').parsed.capital == 'Paris'
+    cache.close()
+
+def test_sqlite_cache_stores_parse_endpoint_results(tmp_path):
+    message = ParsedChatCompletionMessage[Capital](role='assistant', content='{"capital": "Paris"}',
+                                                   parsed=Capital(capital='Paris'))
+    with patch("azllm.clients.openai.OpenAI") as mock_openai:
+        parse = mock_openai.return_value.beta.chat.completions.parse
+        parse.return_value = SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+        llm = azLLM(cache=SQLiteCache(tmp_path / "cache.sqlite"))
+        llm.get_client("openai").get_api_key = MagicMock(return_value="mock-key")
+
+        first = llm.generate_text("openai", "Capital of France?", {'response_format': Capital}, parse=True)
+        second = llm.generate_text("openai", "Capital of France?", {'response_format': Capital}, parse=True)
+
+    assert first.parsed == second.parsed == Capital(capital='Paris')
+    assert type(second) is type(message)
+    assert parse.call_count == 1
+
+def test_unpicklable_results_are_returned_uncached(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    value = lambda: None
+
+    assert cached_call(cache, lambda: value, 'key') is value
+    assert len(cache) == 0
+    cache.close()
+
+def test_cached_call_skips_failed_parses():
+    cache = MemoryCache()
+    compute = MagicMock(return_value=SimpleNamespace(raw=None, parsed=None, error='invalid'))
+
+    cached_call(cache, compute, 'key')
+    cached_call(cache, compute, 'key')
+
+    assert compute.call_count == 2
+    assert len(cache) == 0
+
+def test_acached_call():
+    cache = MemoryCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return 'value'
+
+    assert asyncio.run(acached_call(cache, compute, 'key')) == 'value'
+    assert asyncio.run(acached_call(cache, compute, 'key')) == 'value'
+    assert len(calls) == 1
+
+@patch("azllm.clients.openai.OpenAI")
+def test_azllm_generate_text_hits_cache(mock_openai):
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Paris"))]
+    mock_openai.return_value.chat.completions.create.return_value = mock_response
+
+    llm = azLLM(cache=True)
+    llm.get_client("openai").get_api_key = MagicMock(return_value="mock-key")
+
+    assert llm.generate_text("openai", "Capital of France?", {'temperature': 0}) == "Paris"
+    assert llm.generate_text("openai", "Capital of France?", {'temperature': 0}) == "Paris"
+    assert llm.generate_text("openai", "Capital of Italy?", {'temperature': 0}) == "Paris"
+
+    assert mock_openai.return_value.chat.completions.create.call_count == 2
+    assert llm.cache.stats()['hits'] == 1
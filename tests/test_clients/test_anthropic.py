@@ -72,7 +72,7 @@ def test_generate_text_mocked(mock_openai):
 
     result = client.generate_text("Hello, AI!")
     assert result == "Mock response"
-    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.anthropic.com/v1/")
+    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.anthropic.com/v1/", max_retries=0)
     mock_client.chat.completions.create.assert_called_once()
 
 
@@ -115,4 +115,59 @@ def test_batch_generate_with_errors():
         "Error: Something went wrong",
         "Response to: Another one"
     ]
-    assert client.generate_text.call_count == 3
\ No newline at end of file
+    assert client.generate_text.call_count == 3
+
+def test_prompt_cache_marks_static_prefix():
+    from pydantic import BaseModel
+
+    class Answer(BaseModel):
+        capital: str
+
+    client = AnthropicClient({'parameters': {'prompt_cache': True, 'structured_output': 'prompt'}})
+    history = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]
+
+    params, _ = client._build_params("Capital of France?", {'history': history, 'response_format': Answer}, parse=True)
+    other, _ = client._build_params("Capital of Spain?", {'history': history, 'response_format': Answer,
+                                                          'system_message': 'Be terse.'}, parse=True)
+
+    messages = params['messages']
+    assert messages[0]['content'].startswith("You are an API that returns structured data.")
+    assert messages[2]['content'] == [{'type': 'text', 'text': 'Hello', 'cache_control': {'type': 'ephemeral'}}]
+    assert messages[3] == {"role": "user", "content": "Capital of France?"}
+    assert history[1]['content'] == "Hello"
+    schema_prompt = messages[0]['content'].split('\n\n')[0]
+    assert other['messages'][0]['content'].startswith(schema_prompt + '\n\nBe terse.')
+
+    plain, _ = client._build_params("Hello", {'prompt_cache': False})
+    assert plain['messages'][0]['content'] == DEFAULT_CONFIG['system_message']
+    assert 'prompt_cache' not in plain
+
+
+@patch("azllm.clients.anthropic.OpenAI")
+def test_parse_forces_tool_call_and_returns_errors_as_tool_results(mock_openai):
+    from types import SimpleNamespace
+    from pydantic import BaseModel
+
+    class Capital(BaseModel):
+        """The capital of a country."""
+        city: str
+
+    def tool_completion(arguments):
+        call = SimpleNamespace(id="call_1", function=SimpleNamespace(name="Capital", arguments=arguments))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=None, tool_calls=[call]))], usage=None)
+
+    create = mock_openai.return_value.chat.completions.create
+    create.side_effect = [tool_completion('{"town": "Paris"}'), tool_completion('{"city": "Paris"}')]
+    client = AnthropicClient()
+    client.get_api_key = MagicMock(return_value="mock-key")
+
+    result = client.generate_text("Capital of France?", {'response_format': Capital}, parse=True)
+
+    assert result.parsed.city == "Paris"
+    first, second = (call.kwargs for call in create.call_args_list)
+    assert first['tool_choice'] == {'type': 'function', 'function': {'name': 'Capital'}}
+    assert first['tools'][0]['function']['description'] == "The capital of a country."
+    assert first['messages'][0]['content'] == DEFAULT_CONFIG['system_message']
+    assistant, tool_result = second['messages'][-2:]
+    assert assistant['tool_calls'][0]['function']['arguments'] == '{"town": "Paris"}'
+    assert tool_result['role'] == 'tool' and tool_result['tool_call_id'] == "call_1"
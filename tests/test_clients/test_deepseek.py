@@ -1,6 +1,8 @@
 import os
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from pydantic import BaseModel
 from azllm.clients.deepseek import DeepSeekClient, DEFAULT_CONFIG 
 
 # ------------------------
@@ -72,7 +74,7 @@ def test_generate_text_mocked(mock_openai):
 
     result = client.generate_text("Hello, AI!")
     assert result == "Mock response"
-    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.deepseek.com/v1")
+    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.deepseek.com/v1", max_retries=0)
     mock_client.chat.completions.create.assert_called_once()
 
 
@@ -115,4 +117,51 @@ def test_batch_generate_with_errors():
         "Error: Something went wrong",
         "Response to: Another one"
     ]
-    assert client.generate_text.call_count == 3
\ No newline at end of file
+    assert client.generate_text.call_count == 3
+
+class Capital(BaseModel):
+    city: str
+
+
+def make_completion(content):
+    message = SimpleNamespace(content=content, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+@patch("azllm.clients.deepseek.OpenAI")
+def test_parse_uses_json_mode_and_repairs_invalid_output(mock_openai):
+    create = mock_openai.return_value.chat.completions.create
+    create.side_effect = [make_completion('{"capital": "Paris"}'), make_completion('{"city": "Paris"}')]
+    client = DeepSeekClient()
+    client.get_api_key = MagicMock(return_value="mock-key")
+
+    result = client.generate_text("Capital of France?", {'response_format': Capital}, parse=True)
+
+    assert result.parsed == Capital(city="Paris")
+    first, second = (call.kwargs for call in create.call_args_list)
+    assert first['response_format'] == {"type": "json_object"}
+    assert "JSON object that matches this schema" in first['messages'][0]['content']
+    repair = second['messages'][len(first['messages']):]
+    assert repair[0] == {'role': 'assistant', 'content': '{"capital": "Paris"}'}
+    assert repair[1]['role'] == 'user' and 'city' in repair[1]['content']
+
+@patch("azllm.clients.deepseek.OpenAI")
+def test_repairs_have_their_own_budget(mock_openai):
+    create = mock_openai.return_value.chat.completions.create
+    create.return_value = make_completion('{"capital": "Paris"}')
+    client = DeepSeekClient({'parameters': {'structured_output_repairs': 1}, 'retry': {'max_attempts': 5}})
+    client.get_api_key = MagicMock(return_value="mock-key")
+
+    result = client.generate_text("Capital of France?", {'response_format': Capital}, parse=True)
+
+    assert result.parsed is None and 'city' in result.error
+    assert create.call_count == 2
+
+def test_parse_prompt_mode_and_invalid_mode():
+    client = DeepSeekClient({'parameters': {'structured_output': 'prompt'}})
+
+    params, _ = client._build_params("Hi", {'response_format': Capital}, parse=True)
+    assert 'response_format' not in params
+
+    with pytest.raises(ValueError, match="structured_output must be one of"):
+        client._build_params("Hi", {'response_format': Capital, 'structured_output': 'xml'}, parse=True)
@@ -72,7 +72,7 @@ def test_generate_text_mocked(mock_openai):
 
     result = client.generate_text("Hello, AI!")
     assert result == "Mock response"
-    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.x.ai/v1")
+    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.x.ai/v1", max_retries=0)
     mock_client.chat.completions.create.assert_called_once()
 
 
@@ -93,7 +93,7 @@ def test_generate_text_with_parse(mock_openai):
     result = client.generate_text("Parse this", parse=True)
 
     assert result == "Parsed message"
-    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.x.ai/v1")
+    mock_openai.assert_called_once_with(api_key="mock-key", base_url="https://api.x.ai/v1", max_retries=0)
     mock_client.beta.chat.completions.parse.assert_called_once()
 
 
@@ -62,7 +62,7 @@ def test_generate_text_mocked(mock_openai):
 
     result = client.generate_text("Hello, AI!")
     assert result == "Mock response"
-    mock_openai.assert_called_once_with(api_key="ollama", base_url="http://localhost:11434/v1")
+    mock_openai.assert_called_once_with(api_key="ollama", base_url="http://localhost:11434/v1", max_retries=0)
     mock_client.chat.completions.create.assert_called_once()
 
 
@@ -1,6 +1,7 @@
+import asyncio
 import os
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from azllm.clients.openai import OpenAIClient, DEFAULT_CONFIG 
 
 # ------------------------
@@ -73,7 +74,7 @@ def test_generate_text_mocked(mock_openai):
 
     result = client.generate_text("Hello, AI!")
     assert result == "Mock response"
-    mock_openai.assert_called_once_with(api_key="mock-key")
+    mock_openai.assert_called_once_with(api_key="mock-key", max_retries=0)
     mock_client.chat.completions.create.assert_called_once()
 
 
@@ -117,3 +118,60 @@ def test_batch_generate_with_errors():
         "Response to: Another one"
     ]
     assert client.generate_text.call_count == 3
+
+
+@patch("azllm.clients.openai.AsyncOpenAI")
+def test_agenerate_text_mocked(mock_async_openai):
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Mock response"))]
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+    mock_async_openai.return_value = mock_client
+
+    client = OpenAIClient()
+    client.get_api_key = MagicMock(return_value="mock-key")
+
+    result = asyncio.run(client.agenerate_text("Hello, AI!"))
+    assert result == "Mock response"
+    mock_async_openai.assert_called_once_with(api_key="mock-key", max_retries=0)
+    mock_client.chat.completions.create.assert_awaited_once()
+
+
+def test_abatch_generate_with_errors():
+    prompts = ["Hello", "Bad prompt", "Another one"]
+
+    async def side_effect(prompt, kwargs, parse):
+        if prompt == "Bad prompt":
+            raise RuntimeError("Something went wrong")
+        return f"Response to: {prompt}"
+
+    client = OpenAIClient()
+    client.agenerate_text = AsyncMock(side_effect=side_effect)
+
+    responses = asyncio.run(client.abatch_generate(prompts))
+
+    assert responses == [
+        "Response to: Hello",
+        "Error: Something went wrong",
+        "Response to: Another one"
+    ]
+
+
+def test_batch_generate_concurrent_preserves_order():
+    prompts = [f"prompt-{idx}" for idx in range(8)]
+
+    def side_effect(prompt, kwargs, parse):
+        if prompt == "prompt-3":
+            raise RuntimeError("Something went wrong")
+        return f"Response to: {prompt}"
+
+    client = OpenAIClient({'parameters': {'max_concurrency': 4}})
+    client.generate_text = MagicMock(side_effect=side_effect)
+
+    responses = client.batch_generate(prompts)
+
+    assert client.max_concurrency == 4
+    assert responses[3] == "Error: Something went wrong"
+    assert responses[:3] == [f"Response to: prompt-{idx}" for idx in range(3)]
+    assert responses[4:] == [f"Response to: prompt-{idx}" for idx in range(4, 8)]
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import pytest
+
+from azllm.clients import ClientRegistry, CLIENT_MODULES, get_client_class
+from azllm.clients.ollama import OllamaClient
+
+
+def test_registry_lists_clients_without_importing():
+    registry = ClientRegistry({'ollama': ('azllm.clients.ollama', 'OllamaClient'), 'fake': ('azllm.clients.missing', 'Fake')})
+
+    assert 'fake' in registry
+    assert list(registry) == ['ollama', 'fake']
+    assert not registry.is_loaded('ollama')
+
+    assert registry['ollama'] is OllamaClient
+    assert registry.is_loaded('ollama')
+
+    with pytest.raises(ModuleNotFoundError):
+        registry['fake']
+
+def test_registry_accepts_custom_clients():
+    registry = ClientRegistry()
+    custom = type('CustomClient', (), {})
+    registry['custom'] = custom
+
+    assert registry['custom'] is custom
+    assert len(registry) == len(CLIENT_MODULES) + 1
+    del registry['custom']
+    assert 'custom' not in registry
+
+def test_get_client_class_rejects_unknown_clients():
+    assert get_client_class('ollama') is OllamaClient
+    with pytest.raises(ValueError, match="Client unknown not found"):
+        get_client_class('unknown')
+
+def test_import_azllm_does_not_import_provider_sdks():
+    code = (
+        "import sys, azllm\n"
+        "llm = azllm.azLLM()\n"
+        "assert 'openai' not in sys.modules, 'openai imported'\n"
+        "assert 'dotenv' not in sys.modules, 'dotenv imported'\n"
+        "assert 'pydantic' not in sys.modules, 'pydantic imported'\n"
+        "llm.get_client('ollama')\n"
+        "assert 'azllm.clients.ollama' in sys.modules\n"
+        "assert 'azllm.clients.openai' not in sys.modules\n"
+    )
+    completed = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
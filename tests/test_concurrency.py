@@ -0,0 +1,44 @@
+import asyncio
+import threading
+import time
+
+from azllm.concurrency import bounded_map, abounded_gather
+
+
+def test_bounded_map_preserves_order_and_limit():
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def work(item):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.01 * (5 - item))
+        with lock:
+            active["now"] -= 1
+        return item * 2
+
+    results = bounded_map(work, range(5), max_concurrency=2)
+
+    assert results == [0, 2, 4, 6, 8]
+    assert active["peak"] <= 2
+
+def test_bounded_map_sequential_runs_in_calling_thread():
+    caller = threading.get_ident()
+    results = bounded_map(lambda item: threading.get_ident(), range(3), max_concurrency=1)
+    assert results == [caller] * 3
+
+def test_abounded_gather_preserves_order_and_limit():
+    active = {"now": 0, "peak": 0}
+
+    async def work(item):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01 * (5 - item))
+        active["now"] -= 1
+        return item * 2
+
+    results = asyncio.run(abounded_gather(work, range(5), max_concurrency=3))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert active["peak"] <= 3
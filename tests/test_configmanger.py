@@ -114,4 +114,53 @@ def test_update_invalid_client(monkeypatch):
             "model-x": {
                 "parameters": {"temperature": 1.0}
             }
-        })
\ No newline at end of file
+        })
+
+def test_update_skips_save_when_unchanged(temp_custom_dir, mock_load_custom_config):
+    cfg = configmanager.azLLMConfigs(config_file="custom.yaml", custom=True)
+
+    assert cfg.update_custom_configs("openai", {"gpt-4o-mini": {"version": "v1", "parameters": {"temperature": 0.7}}}) is False
+    configmanager.save_custom_configs.assert_not_called()
+
+    assert cfg.update_custom_configs("openai", {"gpt-4o-mini": {"version": "v1", "parameters": {"temperature": 0.1}}}, save=False) is True
+    configmanager.save_custom_configs.assert_not_called()
+
+
+def test_bulk_update_writes_once(temp_custom_dir, mock_load_custom_config):
+    cfg = configmanager.azLLMConfigs(config_file="custom.yaml", custom=True, config_dir=temp_custom_dir)
+
+    changed = cfg.bulk_update_custom_configs({
+        "openai": {
+            "gpt-4o-mini": {"version": "v1", "parameters": {"temperature": 0.2}},
+            "gpt-4o": {"version": "v1", "parameters": {"temperature": 0.3}},
+        },
+        "grok": {"grok-3": {"version": "v1", "parameters": {"max_tokens": 512}}},
+    })
+
+    assert changed is True
+    configmanager.save_custom_configs.assert_called_once_with("custom.yaml", cfg.custom_configs, os.path.realpath(temp_custom_dir))
+    assert [m["model"] for m in cfg.custom_configs["openai"]["models"]] == ["gpt-4o-mini", "gpt-4o"]
+    assert cfg.custom_configs["grok"]["models"][0]["parameters"] == {"max_tokens": 512}
+
+
+def test_bulk_update_validates_all_clients_first(temp_custom_dir, mock_load_custom_config):
+    cfg = configmanager.azLLMConfigs(config_file="custom.yaml", custom=True)
+
+    with pytest.raises(ValueError, match="Client type fakeclient is not working"):
+        cfg.bulk_update_custom_configs({
+            "openai": {"gpt-4o": {"version": "v1", "parameters": {}}},
+            "fakeclient": {"model-x": {"parameters": {}}},
+        })
+
+    assert len(cfg.custom_configs["openai"]["models"]) == 1
+    configmanager.save_custom_configs.assert_not_called()
+
+
+def test_config_dir_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg = configmanager.azLLMConfigs(config_file="custom.yaml", custom=True, config_dir="settings")
+    cfg.update_custom_configs("grok", {"grok-3": {"version": "v1", "parameters": {"temperature": 0.4}}})
+
+    monkeypatch.chdir(tempfile.gettempdir())
+    reloaded = configmanager.azLLMConfigs(config_file="custom.yaml", custom=True, config_dir=str(tmp_path / "settings"))
+    assert reloaded.custom_configs["grok"]["models"][0]["parameters"]["temperature"] == 0.4
@@ -0,0 +1,100 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from azllm import azLLM
+from azllm.configtable import ConfigTable, freeze, thaw
+
+
+CONFIG = {
+    "openai": {
+        "parameters": {"temperature": 0.1, "max_concurrency": 4},
+        "models": [
+            {"model": "gpt-4o", "version": "v1", "parameters": {"temperature": 0.7, "kwargs": {"stop": ["\n"]}}},
+            {"model": "gpt-4o-mini", "version": "default", "parameters": {}},
+            {"model": "gpt-4o", "version": "v1", "parameters": {"temperature": 0.9}},
+        ],
+    },
+    "grok": {"models": [{"model": "grok-3", "version": "v2"}]},
+}
+
+
+def test_lookup_merges_client_defaults():
+    table = ConfigTable(CONFIG)
+
+    entry = table.lookup("openai", "gpt-4o", "v1")
+
+    assert entry.config["parameters"]["temperature"] == 0.7
+    assert entry.config["parameters"]["max_concurrency"] == 4
+    assert entry.model_config["parameters"] == {"temperature": 0.7, "kwargs": {"stop": ("\n",)}}
+    assert len(table) == 3
+
+def test_first_entry_wins_and_default_resolves_to_first_default_version():
+    table = ConfigTable(CONFIG)
+
+    assert table.lookup("openai", "gpt-4o", "v1").config["parameters"]["temperature"] == 0.7
+    assert table.lookup("openai", "default", "default").config["model"] == "gpt-4o-mini"
+
+def test_lookup_errors_match_get_model_config():
+    table = ConfigTable(CONFIG)
+
+    with pytest.raises(ValueError, match="Client configs for 'gemini' not found"):
+        table.lookup("gemini", "gemini-pro", "v1")
+    with pytest.raises(ValueError, match="Model configuration for 'grok', 'grok-3', 'v1' not found"):
+        table.lookup("grok", "grok-3", "v1")
+    with pytest.raises(ValueError, match="Model configuration for 'grok', 'default', 'default' not found"):
+        table.lookup("grok", "default", "default")
+
+def test_resolved_configs_are_read_only():
+    entry = ConfigTable(CONFIG).lookup("openai", "gpt-4o", "v1")
+
+    with pytest.raises(TypeError):
+        entry.config["model"] = "other"
+    with pytest.raises(TypeError):
+        entry.config["parameters"]["temperature"] = 2
+    assert freeze([{"a": 1}])[0]["a"] == 1
+    assert thaw(freeze({"a": [{"b": 1}]})) == {"a": [{"b": 1}]}
+
+def test_clients_receive_plain_nested_kwargs(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    llm = azLLM()
+    llm.custom = True
+    llm.config = {"openai": {"models": [{"model": "gpt-4o", "version": "v1", "parameters": {
+        "kwargs": {"logit_bias": {"50256": -100}, "stop": ["\n"]}}}]}}
+
+    with patch("azllm.clients.openai.OpenAI") as mock_openai:
+        create = mock_openai.return_value.chat.completions.create
+        create.return_value = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Hi"))], usage=None)
+
+        assert llm.generate_text("openai:gpt-4o::v1", "Hello") == "Hi"
+        sent = create.call_args.kwargs
+        assert type(sent["logit_bias"]) is dict and type(sent["stop"]) is list
+        json.dumps(sent["logit_bias"])
+
+    model_config = llm.get_model_config("openai", "gpt-4o", "v1")
+    model_config["version"] = "v2"
+    assert llm.get_model_config("openai", "gpt-4o", "v1")["version"] == "v1"
+
+def test_azllm_reuses_table_until_config_changes():
+    llm = azLLM()
+    llm.custom = True
+    llm.config = CONFIG
+
+    table = llm.config_table
+    client = llm._resolve_client("openai:gpt-4o::v1")
+
+    assert llm.config_table is table
+    assert llm._resolve_client("openai:gpt-4o::v1") is client
+    assert client.temperature == 0.7
+    assert client.max_concurrency == 4
+    assert llm.get_model_config("grok", "grok-3", "v2")["model"] == "grok-3"
+
+    llm.config = {"openai": {"models": [{"model": "gpt-4o", "version": "v1", "parameters": {"temperature": 0.3}}]}}
+    assert llm.config_table is not table
+    assert llm._resolve_client("openai:gpt-4o::v1").temperature == 0.3
+
+    llm.config["openai"]["models"][0]["parameters"]["temperature"] = 0.5
+    llm.invalidate_config()
+    assert llm._resolve_client("openai:gpt-4o::v1").temperature == 0.5
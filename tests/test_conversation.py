@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from azllm import azLLM, Conversation
+from azllm.conversation import estimate_message_tokens
+from azllm.streaming import TextStream
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+@pytest.fixture
+def llm():
+    with patch("azllm.clients.openai.OpenAI") as mock_openai, patch("azllm.clients.openai.AsyncOpenAI") as mock_async:
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = lambda **params: completion(f"reply {len(params['messages'])}")
+        mock_async.return_value.chat.completions.create = AsyncMock(side_effect=lambda **params: completion("async reply"))
+        llm = azLLM()
+        llm._resolve_client("openai").get_api_key = MagicMock(return_value="mock-key")
+        llm.create = create
+        yield llm
+
+
+def sent_messages(llm):
+    return llm.create.call_args.kwargs["messages"]
+
+
+def test_send_includes_history_between_system_and_prompt(llm):
+    chat = llm.conversation("openai", system_message="Be brief.")
+
+    assert chat.send("Hi") == "reply 2"
+    assert chat.send("And now?") == "reply 4"
+
+    assert sent_messages(llm) == [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": "reply 2"},
+        {"role": "user", "content": "And now?"},
+    ]
+    assert len(chat) == 2
+
+def test_max_turns_keeps_sliding_window(llm):
+    chat = llm.conversation("openai", max_turns=2)
+    for prompt in ["one", "two", "three"]:
+        chat.send(prompt)
+
+    assert [turn.user for turn in chat.turns] == ["two", "three"]
+    chat.send("four")
+    assert [m["content"] for m in sent_messages(llm) if m["role"] == "user"] == ["two", "three", "four"]
+
+def test_token_budget_sends_most_recent_turns_that_fit():
+    chat = Conversation(MagicMock(), "openai", max_history_tokens=25, token_counter=len)
+    chat.add_turn("a" * 10, "b" * 10)
+    chat.add_turn("c" * 5, "d" * 5)
+    chat.add_turn("e" * 5, "f" * 5)
+
+    assert [m["content"] for m in chat.history("x" * 5)] == ["c" * 5, "d" * 5, "e" * 5, "f" * 5]
+    assert chat.history("x" * 20) == []
+    assert len(chat) == 3
+    assert estimate_message_tokens("abcdefgh") == 6
+
+def test_failed_requests_are_not_recorded(llm):
+    chat = llm.conversation("openai")
+    llm.create.side_effect = Exception("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        chat.send("Hi")
+    assert len(chat) == 0
+
+def test_stream_records_turn_when_exhausted():
+    llm = MagicMock()
+    llm.stream_text.return_value = TextStream(iter([
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hello"), finish_reason="stop")], usage=None),
+    ]))
+    chat = Conversation(llm, "openai")
+
+    stream = chat.stream("Hi", {"temperature": 0})
+    assert len(chat) == 0
+    assert "".join(stream) == "Hello"
+    assert chat.turns[0][:2] == ("Hi", "Hello")
+    assert llm.stream_text.call_args.args[2] == {"temperature": 0, "history": []}
+
+def test_asend_records_turn(llm):
+    chat = llm.conversation("openai")
+
+    assert asyncio.run(chat.asend("Hi")) == "async reply"
+    assert chat.turns[0][:2] == ("Hi", "async reply")
+
+def test_invalid_limits():
+    with pytest.raises(ValueError, match="max_turns"):
+        Conversation(MagicMock(), "openai", max_turns=0)
@@ -1,5 +1,6 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from azllm import azLLM  
 
 def test_generate_parallel_success():
@@ -46,3 +47,77 @@ def test_generate_parallel_invalid_parse_length():
     llm = azLLM()
     with pytest.raises(ValueError, match="length of parse"):
         llm.generate_parallel("prompt", ["openai:gpt-4::v1"], parse=[True, False])
+
+def test_get_client_is_pooled():
+    llm = azLLM()
+    config = {"model": "gpt-4o-mini", "version": "v1", "parameters": {"temperature": 0.2}}
+
+    assert llm.get_client("openai") is llm.get_client("openai")
+    assert llm.get_client("openai", config) is llm.get_client("openai", dict(config))
+    assert llm.get_client("openai", config) is not llm.get_client("openai")
+
+def test_context_manager_closes_pool():
+    with azLLM() as llm:
+        client = llm.get_client("openai")
+        client.close = MagicMock()
+    client.close.assert_called_once()
+    assert len(llm.pool) == 0
+
+def test_agenerate_parallel_with_errors():
+    llm = azLLM()
+    client_models = ["openai:gpt-4::v1", "grok:model-z::v1"]
+
+    async def side_effect(client_model_version, prompt, kwargs, parse):
+        if "grok" in client_model_version:
+            raise RuntimeError("API timeout")
+        return "Paris"
+
+    llm.agenerate_text = AsyncMock(side_effect=side_effect)
+
+    results = asyncio.run(llm.agenerate_parallel("Capital of France?", client_models))
+
+    assert results["openai:gpt-4::v1:0"] == "Paris"
+    assert results["grok:model-z::v1:1"].startswith("Error: API timeout")
+
+def test_agenerate_text_uses_pooled_client():
+    llm = azLLM()
+    client = llm.get_client("openai")
+    client.agenerate_text = AsyncMock(return_value="Hi!")
+
+    result = asyncio.run(llm.agenerate_text("openai", "Hello"))
+
+    assert result == "Hi!"
+    client.agenerate_text.assert_awaited_once_with("Hello", {}, False)
+
+def test_client_level_parameters_are_model_defaults():
+    llm = azLLM()
+    llm.custom = True
+    llm.config = {
+        "openai": {
+            "parameters": {"max_concurrency": 8, "temperature": 0.1},
+            "models": [
+                {"model": "gpt-4o-mini", "version": "v1", "parameters": {"temperature": 0.7}}
+            ],
+        }
+    }
+
+    client = llm._resolve_client("openai:gpt-4o-mini::v1")
+
+    assert client.max_concurrency == 8
+    assert client.temperature == 0.7
+
+def test_client_level_rate_limits_are_model_defaults():
+    llm = azLLM()
+    llm.custom = True
+    llm.config = {
+        "openai": {
+            "rate_limits": {"requests_per_minute": 100, "tokens_per_minute": 5000},
+            "models": [
+                {"model": "gpt-4o-mini", "version": "v1", "rate_limits": {"tokens_per_minute": 9000}}
+            ],
+        }
+    }
+
+    client = llm._resolve_client("openai:gpt-4o-mini::v1")
+
+    assert client.rate_limiter.limits() == {"requests_per_minute": 100, "tokens_per_minute": 9000}
@@ -0,0 +1,109 @@
+import asyncio
+import itertools
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from azllm import azLLM
+from azllm.hedging import HedgePolicy, ahedged_call, hedged_call
+from azllm.metrics import MetricsRegistry
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+@pytest.fixture
+def llm():
+    calls = itertools.count()
+
+    def create(**params):
+        # The first request stalls; any later one answers immediately.
+        if next(calls) == 0:
+            time.sleep(0.5)
+            return completion("slow")
+        return completion("fast")
+
+    with patch("azllm.clients.openai.OpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create.side_effect = create
+        llm = azLLM(metrics=MetricsRegistry())
+        llm._resolve_client("openai").get_api_key = MagicMock(return_value="mock-key")
+        yield llm
+
+
+def test_hedge_wins_when_first_request_stalls(llm):
+    policy = HedgePolicy(initial_delay=0.05, max_hedge_rate=1)
+
+    assert llm.generate_text("openai", "Hi", hedge=policy) == "fast"
+    assert policy.snapshot() == {'requests': 1, 'hedges': 1, 'wins': 1, 'hedge_rate': 1.0, 'win_rate': 1.0}
+
+def test_fast_request_is_not_hedged():
+    policy = HedgePolicy(initial_delay=1)
+
+    assert hedged_call(lambda: "first", lambda: "hedge", policy.delay(MetricsRegistry(), "k"), policy) == "first"
+    assert policy.hedges == 0
+
+def test_hedge_rate_is_capped():
+    policy = HedgePolicy(max_hedge_rate=0.5)
+    for _ in range(4):
+        policy.start()
+        policy.try_hedge()
+
+    assert policy.hedges == 2
+    assert not policy.try_hedge()
+
+def test_delay_uses_recorded_latency_quantile():
+    metrics = MetricsRegistry(buckets=(1.0, 2.0))
+    policy = HedgePolicy(quantile=0.5, initial_delay=7, min_samples=2)
+    metrics.record(SimpleNamespace(key="k", latency=1.5, time_to_first_byte=None, prompt_tokens=None,
+                                   completion_tokens=None, retries=0, error=None, streamed=False))
+    assert policy.delay(metrics, "k") == 7
+
+    metrics.record(SimpleNamespace(key="k", latency=1.5, time_to_first_byte=None, prompt_tokens=None,
+                                   completion_tokens=None, retries=0, error=None, streamed=False))
+    assert policy.delay(metrics, "k") == 1.5
+
+def test_hedged_call_waits_for_the_other_call_after_a_failure():
+    def fail():
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    def slow():
+        time.sleep(0.1)
+        return "hedge"
+
+    policy = HedgePolicy(max_hedge_rate=1)
+    assert hedged_call(fail, slow, 0.01, policy) == "hedge"
+    with pytest.raises(RuntimeError, match="boom"):
+        hedged_call(fail, fail, 0.01, policy)
+
+def test_async_hedge_cancels_the_loser():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def fast():
+        return "hedge"
+
+    policy = HedgePolicy(max_hedge_rate=1)
+    assert asyncio.run(ahedged_call(slow, fast, 0.01, policy)) == "hedge"
+    assert cancelled == [True]
+    assert policy.wins == 1
+
+def test_batch_generate_hedges_each_prompt(llm):
+    policy = HedgePolicy(initial_delay=0.05, max_hedge_rate=1)
+
+    assert llm.batch_generate("openai", ["a", "b"], hedge=policy) == ["fast", "fast"]
+    assert policy.requests == 2
+    assert policy.hedges == 1
+
+def test_invalid_policy():
+    with pytest.raises(ValueError, match="quantile"):
+        HedgePolicy(quantile=1.5)
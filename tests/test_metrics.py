@@ -0,0 +1,175 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from azllm import azLLM
+from azllm.breaker import CircuitBreaker
+from azllm.clients.openai import OpenAIClient
+from azllm.metrics import Histogram, MetricsRegistry, cached_prompt_tokens, metrics_key
+
+
+def make_response(content="Hi", prompt_tokens=12, completion_tokens=3):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                              total_tokens=prompt_tokens + completion_tokens),
+    )
+
+def make_record(key="openai:gpt-4o-mini::default", latency=0.2, error=None, retries=0):
+    return SimpleNamespace(key=key, latency=latency, time_to_first_byte=latency, prompt_tokens=10,
+                           completion_tokens=5, retries=retries, error=error, streamed=False)
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram((1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(6.5)
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(1.0) == pytest.approx(4.0)
+    assert histogram.cumulative()[-1][1] == 4
+    assert Histogram().quantile(0.5) is None
+
+def test_metrics_key_includes_version():
+    assert metrics_key("openai", {"version": "v1"}, "gpt-4o") == "openai:gpt-4o::v1"
+    assert metrics_key("openai", None, "gpt-4o") == "openai:gpt-4o::default"
+
+def test_registry_snapshot_aggregates_per_key():
+    registry = MetricsRegistry()
+    registry.record(make_record(latency=0.2))
+    registry.record(make_record(latency=0.4, error="RateLimitError", retries=2))
+    registry.record(make_record(key="grok:grok-3::v2"))
+
+    snapshot = registry.snapshot()
+    stats = snapshot["openai:gpt-4o-mini::default"]
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+    assert stats["errors_by_class"] == {"RateLimitError": 1}
+    assert stats["retries"] == 2
+    assert stats["prompt_tokens"] == 20
+    assert stats["completion_tokens"] == 10
+    assert stats["latency_mean"] == pytest.approx(0.3)
+    assert snapshot["grok:grok-3::v2"]["errors"] == 0
+
+def test_registry_exports_prometheus_text():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.record(make_record(latency=0.5, error="APITimeoutError"))
+
+    text = registry.to_prometheus()
+
+    labels = 'client="openai",model="gpt-4o-mini",version="default"'
+    assert "# TYPE azllm_request_duration_seconds histogram" in text
+    assert f'azllm_request_duration_seconds_bucket{{{labels},le="0.1"}} 0' in text
+    assert f'azllm_request_duration_seconds_bucket{{{labels},le="1.0"}} 1' in text
+    assert f'azllm_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"azllm_requests_total{{{labels}}} 1" in text
+    assert f"azllm_prompt_tokens_total{{{labels}}} 10" in text
+    assert f'azllm_errors_total{{{labels},error="APITimeoutError"}} 1' in text
+    assert text.endswith("\n")
+
+def test_registry_callbacks_receive_records_and_failures_warn():
+    registry = MetricsRegistry()
+    received = []
+    registry.add_callback(received.append)
+    registry.add_callback(MagicMock(side_effect=RuntimeError("boom")))
+
+    with pytest.warns(UserWarning, match="boom"):
+        registry.record(make_record())
+
+    assert received[0].key == "openai:gpt-4o-mini::default"
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    registry.record(make_record())
+    assert registry.snapshot() == {}
+
+@patch("azllm.clients.openai.OpenAI")
+def test_client_records_latency_tokens_and_errors(mock_openai):
+    mock_openai.return_value.chat.completions.create.side_effect = [make_response(), ValueError("bad request")]
+    client = OpenAIClient({"model": "gpt-4o", "version": "v1", "retry": {"max_attempts": 1}})
+    client.api_key = "test"
+    client.metrics = MetricsRegistry()
+
+    assert client.generate_text("Hello") == "Hi"
+    with pytest.raises(RuntimeError):
+        client.generate_text("Hello again")
+
+    stats = client.metrics.snapshot()["openai:gpt-4o::v1"]
+    assert stats["requests"] == 2
+    assert stats["prompt_tokens"] == 12
+    assert stats["completion_tokens"] == 3
+    assert stats["errors_by_class"] == {"ValueError": 1}
+    assert stats["latency_mean"] is not None
+
+@patch("azllm.clients.openai.OpenAI")
+def test_client_records_streams_when_exhausted(mock_openai):
+    chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hi"), finish_reason="stop")], usage=None),
+        SimpleNamespace(choices=[], usage=SimpleNamespace(prompt_tokens=4, completion_tokens=1, total_tokens=5)),
+    ]
+    mock_openai.return_value.chat.completions.create.return_value = iter(chunks)
+    client = OpenAIClient()
+    client.api_key = "test"
+    client.metrics = MetricsRegistry()
+
+    stream = client.stream_text("Hello")
+    assert client.metrics.snapshot() == {}
+
+    assert list(stream) == ["Hi"]
+    stats = client.metrics.snapshot()[client.metrics_key]
+    assert stats["requests"] == 1
+    assert stats["completion_tokens"] == 1
+    assert stats["time_to_first_byte_mean"] is not None
+
+@patch("azllm.clients.openai.OpenAI")
+def test_client_records_streams_that_end_early(mock_openai):
+    def failing():
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hi"), finish_reason=None)], usage=None)
+        raise ConnectionError("reset")
+
+    client = OpenAIClient()
+    client.api_key = "test"
+    client.metrics = MetricsRegistry()
+    client.circuit_breaker = CircuitBreaker(min_calls=1)
+    create = mock_openai.return_value.chat.completions.create
+
+    create.return_value = failing()
+    stream = client.stream_text("Hello")
+    assert client.circuit_breaker.snapshot()["calls"] == 0
+    with pytest.raises(ConnectionError):
+        list(stream)
+    assert client.metrics.snapshot()[client.metrics_key]["errors_by_class"] == {"ConnectionError": 1}
+    assert client.circuit_breaker.state == "open"
+
+    client.circuit_breaker = CircuitBreaker(min_calls=1)
+    create.return_value = failing()
+    stream = client.stream_text("Hello")
+    assert next(iter(stream)) == "Hi"
+    stream.close()
+    stats = client.metrics.snapshot()[client.metrics_key]
+    assert stats["requests"] == 2 and stats["errors"] == 1
+    assert client.circuit_breaker.snapshot()["calls"] == 0
+
+def test_azllm_passes_its_registry_to_clients():
+    registry = MetricsRegistry()
+    llm = azLLM(metrics=registry)
+
+    assert llm.get_client("openai").metrics is registry
+
+
+def test_cached_prompt_tokens_across_providers():
+    assert cached_prompt_tokens(None) is None
+    assert cached_prompt_tokens(SimpleNamespace(prompt_tokens_details=SimpleNamespace(cached_tokens=1024))) == 1024
+    assert cached_prompt_tokens(SimpleNamespace(prompt_cache_hit_tokens=64)) == 64
+    assert cached_prompt_tokens(SimpleNamespace(cache_read_input_tokens=2048)) == 2048
+    assert cached_prompt_tokens(SimpleNamespace(prompt_tokens=5)) is None
+
+    registry = MetricsRegistry()
+    tracker = registry.track("openai:gpt-4o::v1")
+    usage = SimpleNamespace(prompt_tokens=2000, completion_tokens=5, prompt_tokens_details=SimpleNamespace(cached_tokens=1536))
+    tracker.success(SimpleNamespace(usage=usage))
+
+    assert registry.snapshot()["openai:gpt-4o::v1"]["cached_tokens"] == 1536
+    assert 'azllm_cached_tokens_total{client="openai",model="gpt-4o",version="v1"} 1536' in registry.to_prometheus()
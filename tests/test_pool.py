@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import MagicMock
+from azllm.pool import ClientPool
+
+
+def test_get_or_create_reuses_instance():
+    pool = ClientPool(max_size=2)
+    factory = MagicMock(side_effect=lambda: object())
+
+    first = pool.get_or_create("a", factory)
+    second = pool.get_or_create("a", factory)
+
+    assert first is second
+    assert factory.call_count == 1
+
+def test_lru_eviction():
+    pool = ClientPool(max_size=2)
+    pool.get_or_create("a", object)
+    pool.get_or_create("b", object)
+    pool.get_or_create("a", object)  # 'a' becomes most recently used
+    pool.get_or_create("c", object)
+
+    assert "a" in pool
+    assert "b" not in pool
+    assert "c" in pool
+    assert len(pool) == 2
+
+def test_make_key_is_order_insensitive():
+    key_1 = ClientPool.make_key("openai", {"model": "gpt-4o-mini", "version": "v1"})
+    key_2 = ClientPool.make_key("openai", {"version": "v1", "model": "gpt-4o-mini"})
+    assert key_1 == key_2
+    assert ClientPool.make_key("openai") == ("openai", None)
+
+def test_close_closes_all_clients():
+    pool = ClientPool()
+    clients = [MagicMock(), MagicMock()]
+    pool.get_or_create("a", lambda: clients[0])
+    pool.get_or_create("b", lambda: clients[1])
+
+    pool.close()
+
+    assert len(pool) == 0
+    for client in clients:
+        client.close.assert_called_once()
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError, match="at least 1"):
+        ClientPool(max_size=0)
@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from azllm import ratelimit
+from azllm.ratelimit import TokenBucket, RateLimiter, estimate_request_tokens, get_rate_limiter
+from azllm.clients.openai import OpenAIClient
+
+
+def test_token_bucket_reservations_queue_up():
+    bucket = TokenBucket(capacity=2, refill_rate=10)
+
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve(1) == pytest.approx(0.2, abs=0.01)
+
+def test_token_bucket_clamps_large_amounts():
+    bucket = TokenBucket(capacity=5, refill_rate=5)
+    assert bucket.reserve(100) == 0
+
+def test_token_bucket_refund():
+    bucket = TokenBucket(capacity=10, refill_rate=1)
+    bucket.reserve(10)
+    bucket.refund(5)
+    assert bucket.reserve(5) == 0
+
+def test_from_config():
+    assert RateLimiter.from_config(None) is None
+    limiter = RateLimiter.from_config({'requests_per_minute': 60, 'tokens_per_minute': 1000})
+    assert limiter.limits() == {'requests_per_minute': 60, 'tokens_per_minute': 1000}
+    with pytest.raises(ValueError, match="Unknown rate limit settings"):
+        RateLimiter.from_config({'rpm': 60})
+
+def test_estimate_request_tokens():
+    params = {'messages': [{'role': 'user', 'content': 'a' * 40}], 'max_tokens': 100}
+    assert estimate_request_tokens(params) == 111
+
+def test_acquire_waits_when_budget_is_spent(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(ratelimit.time, "sleep", sleeps.append)
+    limiter = RateLimiter(requests_per_minute=1)
+
+    limiter.acquire({'messages': []})
+    limiter.acquire({'messages': []})
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(60, abs=0.1)
+
+def test_aacquire_and_reconcile():
+    limiter = RateLimiter(tokens_per_minute=1000)
+    params = {'messages': [], 'max_tokens': 900}
+
+    reserved = asyncio.run(limiter.aacquire(params))
+    limiter.reconcile(reserved, SimpleNamespace(usage=SimpleNamespace(total_tokens=10)))
+
+    # The unused 891 tokens were refunded, so another large request fits immediately.
+    assert limiter._reserve(900) == 0
+
+def test_registry_shares_limiters():
+    limits = {'requests_per_minute': 100}
+    first = get_rate_limiter("openai:test-shared", limits)
+    assert get_rate_limiter("openai:test-shared", dict(limits)) is first
+    assert get_rate_limiter("openai:test-shared", {'requests_per_minute': 50}) is not first
+    assert get_rate_limiter("openai:test-shared", None) is None
+
+def test_client_requests_go_through_limiter():
+    client = OpenAIClient({'model': 'gpt-test-limited', 'rate_limits': {'requests_per_minute': 100}})
+    client.rate_limiter = MagicMock()
+    client.rate_limiter.acquire.return_value = 42
+    create = MagicMock(return_value="response")
+
+    assert client._request(create, {'model': 'gpt-test-limited'}) == "response"
+    client.rate_limiter.acquire.assert_called_once_with({'model': 'gpt-test-limited'})
+    client.rate_limiter.reconcile.assert_called_once_with(42, "response")
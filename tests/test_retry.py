@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from azllm import retry
+from azllm.retry import RetryPolicy
+from azllm.clients.openai import OpenAIClient
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+class APIConnectionError(Exception):
+    pass
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_is_retryable():
+    assert RetryPolicy.is_retryable(FakeStatusError(429))
+    assert RetryPolicy.is_retryable(FakeStatusError(503))
+    assert RetryPolicy.is_retryable(APIConnectionError("reset"))
+    assert RetryPolicy.is_retryable(TimeoutError())
+    assert not RetryPolicy.is_retryable(FakeStatusError(400))
+    assert not RetryPolicy.is_retryable(ValueError("bad input"))
+
+def test_retry_after_headers():
+    assert RetryPolicy.retry_after(FakeStatusError(429, {'retry-after': '3'})) == 3
+    assert RetryPolicy.retry_after(FakeStatusError(429, {'retry-after-ms': '250'})) == 0.25
+    assert RetryPolicy.retry_after(FakeStatusError(429)) is None
+
+def test_compute_delay_uses_full_jitter_and_retry_after():
+    policy = RetryPolicy(initial_delay=1, max_delay=4, multiplier=2)
+    for attempt in range(1, 6):
+        assert 0 <= policy.compute_delay(attempt) <= min(4, 2 ** (attempt - 1))
+    assert policy.compute_delay(1, FakeStatusError(429, {'retry-after': '3'})) >= 3
+    assert policy.compute_delay(1, FakeStatusError(429, {'retry-after': '60'})) == 4
+
+def test_call_retries_transient_errors(no_sleep):
+    func = MagicMock(side_effect=[FakeStatusError(503), FakeStatusError(429), "ok"])
+    on_retry = MagicMock()
+
+    assert RetryPolicy(max_attempts=3).call(func, on_retry=on_retry) == "ok"
+    assert func.call_count == 3
+    assert on_retry.call_count == 2
+    assert len(no_sleep) == 2
+
+def test_call_gives_up_after_max_attempts(no_sleep):
+    func = MagicMock(side_effect=FakeStatusError(500))
+    with pytest.raises(FakeStatusError):
+        RetryPolicy(max_attempts=2).call(func)
+    assert func.call_count == 2
+
+def test_call_does_not_retry_permanent_errors(no_sleep):
+    func = MagicMock(side_effect=FakeStatusError(401))
+    with pytest.raises(FakeStatusError):
+        RetryPolicy(max_attempts=5).call(func)
+    assert func.call_count == 1
+    assert no_sleep == []
+
+def test_fail_fast_skips_retries_of_connection_errors():
+    policy = RetryPolicy(max_attempts=3)
+    with retry.fail_fast():
+        assert not policy.should_retry(1, TimeoutError("timed out"))
+        assert not policy.should_retry(1, APIConnectionError())
+        assert policy.should_retry(1, FakeStatusError(503))
+    assert policy.should_retry(1, TimeoutError("timed out"))
+
+def test_acall_retries(monkeypatch):
+    async def fake_sleep(delay):
+        pass
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    outcomes = [APIConnectionError("reset"), "ok"]
+
+    async def func():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert asyncio.run(RetryPolicy().acall(func)) == "ok"
+
+def test_from_config():
+    policy = RetryPolicy.from_config({'max_attempts': 5, 'max_delay': 10})
+    assert policy.max_attempts == 5
+    assert policy.max_delay == 10
+    assert RetryPolicy.from_config(None).max_attempts == 3
+    with pytest.raises(ValueError, match="Unknown retry settings"):
+        RetryPolicy.from_config({'attempts': 5})
+
+def test_client_request_retries(no_sleep):
+    client = OpenAIClient({'retry': {'max_attempts': 2}})
+    create = MagicMock(side_effect=[FakeStatusError(502), "response"])
+
+    assert client._request(create, {'model': 'gpt-4o-mini'}) == "response"
+    assert create.call_count == 2
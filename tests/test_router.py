@@ -0,0 +1,154 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import yaml
+
+from azllm import azLLM
+from azllm.router import LatencyRouter, parse_pools
+from azllm.watcher import validate_config
+
+
+CONFIG = {
+    "openai": {"retry": {"max_attempts": 1}, "models": [{"model": "gpt-4o-mini", "version": "v1"}]},
+    "grok": {"retry": {"max_attempts": 1}, "models": [{"model": "grok-2", "version": "v1"}]},
+    "pools": {"fast-chat": ["openai:gpt-4o-mini::v1", "grok:grok-2::v1"]},
+}
+
+
+CHUNKS = [
+    SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text), finish_reason=None)], usage=None)
+    for text in ("Hel", "lo")
+]
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+@pytest.fixture
+def llm(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    monkeypatch.setenv("XAI_API_KEY", "mock-key")
+    (tmp_path / "custom_configs").mkdir()
+    (tmp_path / "custom_configs" / "config.yaml").write_text(yaml.safe_dump(CONFIG))
+
+    def slow(**params):
+        time.sleep(0.05)
+        return completion("openai")
+
+    with patch("azllm.clients.openai.OpenAI") as openai, patch("azllm.clients.grok.OpenAI") as grok, \
+         patch("azllm.clients.grok.AsyncOpenAI") as agrok:
+        openai.return_value.chat.completions.create.side_effect = slow
+        grok.return_value.chat.completions.create.return_value = completion("grok")
+        agrok.return_value.chat.completions.create = AsyncMock(return_value=completion("async grok"))
+        llm = azLLM(custom=True)
+        llm.router = LatencyRouter(explore=0)
+        yield llm
+
+
+def test_pool_shifts_load_to_the_fastest_backend(llm):
+    served = [llm.generate_text("pool:fast-chat", "Hi").target for _ in range(4)]
+
+    # Unmeasured targets are tried first, then the faster one keeps winning.
+    assert served == ["openai:gpt-4o-mini::v1", "grok:grok-2::v1", "grok:grok-2::v1", "grok:grok-2::v1"]
+    health = llm.router.snapshot()
+    assert health["openai:gpt-4o-mini::v1"]["latency"] > health["grok:grok-2::v1"]["latency"]
+    assert health["grok:grok-2::v1"]["in_flight"] == 0
+
+def test_async_pool_and_unknown_pool(llm):
+    llm.router.finished("openai:gpt-4o-mini::v1", llm.router.started("openai:gpt-4o-mini::v1") - 1)
+
+    assert asyncio.run(llm.agenerate_text("pool:fast-chat", "Hi")) == "async grok"
+    with pytest.raises(ValueError, match="Pool 'missing' not found"):
+        llm.generate_text("pool:missing", "Hi")
+
+def test_burst_before_the_first_result_is_spread_over_cold_targets():
+    router = LatencyRouter(explore=0)
+    picks = []
+    for _ in range(9):
+        picks.append(router.choose(["a", "b", "c"]))
+        router.started(picks[-1])
+
+    assert sorted(picks) == ["a"] * 3 + ["b"] * 3 + ["c"] * 3
+    assert router.snapshot()["a"]["score"] == 3.0
+
+def test_pool_batches_and_streams_are_tracked(llm):
+    assert llm.batch_generate("pool:fast-chat", ["Hi", "Hello"], max_concurrency=2) == ["openai", "grok"]
+    health = llm.router.snapshot()
+    assert [health[t]["calls"] for t in health] == [1, 1]
+
+    grok = llm._resolve_client("grok:grok-2::v1")
+    grok.get_client().chat.completions.create.return_value = iter(CHUNKS)
+    assert list(llm.stream_text("pool:fast-chat", "Hi")) == ["Hel", "lo"]
+    grok.get_client().chat.completions.create.return_value = iter(CHUNKS)
+    llm.stream_text("pool:fast-chat", "Hi").close()
+    assert llm.router.snapshot()["grok:grok-2::v1"]["calls"] == 2
+    assert llm.router.snapshot()["grok:grok-2::v1"]["in_flight"] == 0
+
+    grok.get_async_client().chat.completions.create.side_effect = TimeoutError("timed out")
+
+    async def consume():
+        return [delta async for delta in llm.astream_text("pool:fast-chat", "Hi")]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(consume())
+    assert llm.router.snapshot()["grok:grok-2::v1"]["error_rate"] > 0
+    assert llm.router.snapshot()["grok:grok-2::v1"]["in_flight"] == 0
+
+def test_errors_and_in_flight_calls_lower_the_score():
+    router = LatencyRouter(alpha=0.5, explore=0)
+    for target in ("a", "b"):
+        router.finished(target, router.started(target))
+    router._health["a"].latency, router._health["b"].latency = 1.0, 1.5
+
+    assert router.choose(["a", "b"]) == "a"
+    router.started("a")
+    assert router.choose(["a", "b"]) == "b"
+
+    router.finished("a", time.perf_counter(), TimeoutError("timed out"))
+    assert router.snapshot()["a"]["error_rate"] == 0.5
+    router.finished("b", time.perf_counter(), ValueError("invalid request"))
+    assert router.snapshot()["b"]["error_rate"] == 0.0
+
+def test_target_that_only_fails_is_avoided():
+    router = LatencyRouter(explore=0)
+    router.finished("good", router.started("good") - 1)
+    for _ in range(10):
+        router.finished("dead", router.started("dead"), TimeoutError("timed out"))
+
+    assert router.snapshot()["dead"]["latency"] is None
+    assert [router.choose(["dead", "good"]) for _ in range(3)] == ["good"] * 3
+    assert router.choose(["dead", "new"]) == "new"
+
+def test_cancelled_call_releases_its_slot():
+    router = LatencyRouter(explore=0)
+
+    async def main():
+        task = asyncio.ensure_future(router.acall("a", lambda: asyncio.sleep(5)))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert router.snapshot()["a"] == {"latency": None, "error_rate": 0.0, "in_flight": 0, "calls": 0, "score": 0.0}
+
+def test_exploration_picks_random_targets():
+    router = LatencyRouter(explore=1)
+    router._rng.seed(0)
+
+    assert {router.choose(["a", "b"]) for _ in range(20)} == {"a", "b"}
+
+def test_invalid_pools():
+    with pytest.raises(ValueError, match="non-empty list"):
+        parse_pools({"pools": {"fast-chat": "openai"}})
+    with pytest.raises(ValueError, match="Invalid target 'grok:missing::v1' of pool 'fast-chat'"):
+        validate_config({**CONFIG, "pools": {"fast-chat": ["grok:missing::v1"]}})
+    with pytest.raises(ValueError, match="alpha"):
+        LatencyRouter(alpha=0)
+
+    assert set(validate_config(CONFIG).pools) == {"fast-chat"}
@@ -0,0 +1,134 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import yaml
+
+from azllm import azLLM
+from azllm.routing import RoutedText, RoutingError, annotate, parse_routes, should_failover
+from azllm.watcher import validate_config
+
+
+CONFIG = {
+    "openai": {"retry": {"max_attempts": 1}, "models": [{"model": "gpt-4o-mini", "version": "v1"}]},
+    "grok": {"retry": {"max_attempts": 1}, "models": [{"model": "grok-2", "version": "v1"}]},
+    "routes": {
+        "openai:gpt-4o-mini::v1": ["openai:gpt-4o-mini::v1", "grok:grok-2::v1"],
+        "chat": {"targets": ["grok:grok-2::v1"], "timeout": 5},
+    },
+}
+
+
+class BadRequest(Exception):
+    status_code = 400
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+@pytest.fixture
+def llm(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    monkeypatch.setenv("XAI_API_KEY", "mock-key")
+    (tmp_path / "custom_configs").mkdir()
+    (tmp_path / "custom_configs" / "config.yaml").write_text(yaml.safe_dump(CONFIG))
+    with patch("azllm.clients.openai.OpenAI") as openai, patch("azllm.clients.grok.OpenAI") as grok, \
+         patch("azllm.clients.openai.AsyncOpenAI") as aopenai, patch("azllm.clients.grok.AsyncOpenAI") as agrok:
+        llm = azLLM(custom=True)
+        llm.openai = openai.return_value.chat.completions.create
+        llm.grok = grok.return_value.chat.completions.create
+        llm.grok.return_value = completion("from grok")
+        aopenai.return_value.chat.completions.create = AsyncMock(side_effect=TimeoutError("timed out"))
+        agrok.return_value.chat.completions.create = AsyncMock(return_value=completion("async grok"))
+        yield llm
+
+
+def test_primary_serves_when_healthy(llm):
+    llm.openai.return_value = completion("from openai")
+
+    result = llm.generate_text("openai:gpt-4o-mini::v1", "Hi")
+
+    assert result == "from openai"
+    assert isinstance(result, RoutedText)
+    assert result.target == "openai:gpt-4o-mini::v1"
+    assert result.failures == []
+    assert not llm.grok.called
+
+def test_retryable_failure_fails_over(llm):
+    llm.openai.side_effect = TimeoutError("timed out")
+
+    result = llm.generate_text("openai:gpt-4o-mini::v1", "Hi")
+
+    assert result == "from grok"
+    assert result.target == "grok:grok-2::v1"
+    assert result.failures[0][0] == "openai:gpt-4o-mini::v1"
+    assert "timed out" in result.failures[0][1]
+
+def test_permanent_failure_does_not_fail_over(llm):
+    llm.openai.side_effect = BadRequest("invalid request")
+
+    with pytest.raises(RuntimeError, match="invalid request"):
+        llm.generate_text("openai:gpt-4o-mini::v1", "Hi")
+    assert not llm.grok.called
+
+def test_all_targets_failing_raises_routing_error(llm):
+    llm.openai.side_effect = TimeoutError("timed out")
+    llm.grok.side_effect = ConnectionError("refused")
+
+    with pytest.raises(RoutingError) as error:
+        llm.generate_text("openai:gpt-4o-mini::v1", "Hi")
+    assert [target for target, _ in error.value.failures] == ["openai:gpt-4o-mini::v1", "grok:grok-2::v1"]
+
+def test_timeouts_fail_over_without_retrying_the_same_target(llm):
+    retry = {"initial_delay": 0}  # the default of three attempts
+    llm.config = {**CONFIG, "openai": {**CONFIG["openai"], "retry": retry}, "grok": {**CONFIG["grok"], "retry": retry}}
+    llm.openai.side_effect = TimeoutError("timed out")
+    llm.grok.side_effect = [TimeoutError("timed out"), completion("from grok")]
+
+    assert llm.generate_text("openai:gpt-4o-mini::v1", "Hi").target == "grok:grok-2::v1"
+    # The last target has no fallback, so it keeps its retries.
+    assert (llm.openai.call_count, llm.grok.call_count) == (1, 2)
+
+def test_route_alias_and_timeout(llm):
+    assert llm.generate_text("chat", "Hi").target == "grok:grok-2::v1"
+    assert llm.grok.call_args.kwargs["timeout"] == 5
+    assert llm._resolve_client("chat").model == "grok-2"
+
+def test_async_failover(llm):
+    result = asyncio.run(llm.agenerate_text("openai:gpt-4o-mini::v1", "Hi"))
+
+    assert result == "async grok"
+    assert result.target == "grok:grok-2::v1"
+
+def test_should_failover_follows_the_cause_chain():
+    try:
+        try:
+            raise TimeoutError("timed out")
+        except TimeoutError as e:
+            raise RuntimeError("Error generating text: timed out") from e
+    except RuntimeError as e:
+        assert should_failover(e)
+    assert not should_failover(RuntimeError(BadRequest("invalid")))
+
+def test_annotate_leaves_shared_results_unchanged():
+    shared = SimpleNamespace(parsed="Paris")
+
+    first = annotate(shared, "grok:grok-2::v1", [("openai:gpt-4o-mini::v1", "timed out")])
+    second = annotate(shared, "openai:gpt-4o-mini::v1", [])
+
+    assert not hasattr(shared, "target")
+    assert (first.target, first.failures) == ("grok:grok-2::v1", [("openai:gpt-4o-mini::v1", "timed out")])
+    assert (second.target, second.failures, second.parsed) == ("openai:gpt-4o-mini::v1", [], "Paris")
+
+def test_invalid_routes():
+    with pytest.raises(ValueError, match="non-empty list"):
+        parse_routes({"routes": {"chat": []}})
+    with pytest.raises(ValueError, match="Unknown settings"):
+        parse_routes({"routes": {"chat": {"targets": ["openai"], "retries": 2}}})
+    with pytest.raises(ValueError, match="Invalid target 'grok:missing::v1'"):
+        validate_config({**CONFIG, "routes": {"chat": ["grok:missing::v1"]}})
+
+    assert set(validate_config(CONFIG).routes) == {"openai:gpt-4o-mini::v1", "chat"}
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from azllm import azLLM
+from azllm.clients.openai import OpenAIClient
+from azllm.hedging import HedgePolicy
+from azllm.metrics import MetricsRegistry
+from azllm.singleflight import SingleFlight, unique_requests
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return "result"
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do("k", compute))) for _ in range(4)]
+    results = []
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    assert flight.snapshot() == {'leaders': 1, 'shared': 3, 'in_flight': 0}
+
+def test_errors_are_shared_and_not_kept():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.05)
+        raise TimeoutError("timed out")
+
+    errors = []
+
+    def follow():
+        started.wait()
+        try:
+            flight.do("k", lambda: "not called")
+        except TimeoutError as e:
+            errors.append(e)
+
+    follower = threading.Thread(target=follow)
+    follower.start()
+    with pytest.raises(TimeoutError):
+        flight.do("k", fail)
+    follower.join()
+
+    assert len(errors) == 1
+    assert flight.do("k", lambda: "again") == "again"
+
+def test_async_callers_share_one_call():
+    flight = SingleFlight()
+    compute = AsyncMock(return_value="result")
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return await compute()
+
+    async def main():
+        return await asyncio.gather(*(flight.ado("k", slow) for _ in range(3)))
+
+    assert asyncio.run(main()) == ["result"] * 3
+    assert compute.await_count == 1
+
+def test_cancelled_async_leader_hands_over_to_a_follower():
+    flight = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.ado("k", compute))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(flight.ado("k", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(main()) == "result"
+    assert len(calls) == 2
+    assert flight.in_flight == 0
+
+def test_unique_requests():
+    assert unique_requests(["a", "b", "a", "a"], [{}, {}, {}, {"temperature": 0}], [False] * 4) == ([0, 1, 3], [0, 1, 0, 2])
+
+def test_client_batch_sends_duplicate_prompts_once():
+    with patch("azllm.clients.openai.OpenAI") as mock_openai:
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = lambda **params: completion(params["messages"][-1]["content"].upper())
+        client = OpenAIClient()
+        client.get_api_key = MagicMock(return_value="mock-key")
+        client.single_flight = SingleFlight()
+
+        assert client.batch_generate(["a", "b", "a"], max_concurrency=3) == ["A", "B", "A"]
+        assert create.call_count == 2
+
+def test_azllm_shares_concurrent_identical_requests():
+    def create(**params):
+        time.sleep(0.1)
+        return completion("shared")
+
+    with patch("azllm.clients.openai.OpenAI") as mock_openai, patch("azllm.clients.openai.AsyncOpenAI") as mock_async:
+        create_mock = mock_openai.return_value.chat.completions.create
+        create_mock.side_effect = create
+        mock_async.return_value.chat.completions.create = AsyncMock(return_value=completion("async"))
+        llm = azLLM(single_flight=True)
+        llm._resolve_client("openai").get_api_key = MagicMock(return_value="mock-key")
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(llm.generate_text("openai", "Hi"))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["shared"] * 3
+        assert create_mock.call_count == 1
+        assert asyncio.run(llm.abatch_generate("openai", ["Hi", "Hi"])) == ["async", "async"]
+        assert mock_async.return_value.chat.completions.create.await_count == 1
+        assert llm.single_flight.in_flight == 0
+
+def test_hedge_is_not_merged_into_the_primary_request():
+    calls = []
+
+    def create(**params):
+        calls.append(1)
+        time.sleep(0.3 if len(calls) == 1 else 0)
+        return completion("slow" if len(calls) == 1 else "fast")
+
+    with patch("azllm.clients.openai.OpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create.side_effect = create
+        llm = azLLM(metrics=MetricsRegistry(), single_flight=True)
+        llm._resolve_client("openai").get_api_key = MagicMock(return_value="mock-key")
+
+        assert llm.generate_text("openai", "Hi", hedge=HedgePolicy(initial_delay=0.05, max_hedge_rate=1)) == "fast"
+        assert len(calls) == 2
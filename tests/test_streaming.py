@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from azllm import azLLM
+from azllm.streaming import TextStream, AsyncTextStream
+from azllm.clients.openai import OpenAIClient
+
+
+def make_chunk(content=None, finish_reason=None, usage=None):
+    choices = [] if content is None and finish_reason is None else [
+        SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+    ]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+CHUNKS = [
+    make_chunk("Hel"),
+    make_chunk("lo"),
+    make_chunk("", finish_reason="stop"),
+    make_chunk(usage=SimpleNamespace(prompt_tokens=5, completion_tokens=2, total_tokens=7)),
+]
+
+
+def test_text_stream_yields_deltas_and_summary():
+    on_complete = MagicMock()
+    stream = TextStream(iter(CHUNKS), on_complete=on_complete)
+
+    assert list(stream) == ["Hel", "lo"]
+
+    summary = stream.summary()
+    assert summary.text == "Hello"
+    assert summary.finish_reason == "stop"
+    assert summary.usage.total_tokens == 7
+    assert summary.time_to_first_token is not None
+    on_complete.assert_called_once()
+
+def test_async_text_stream_opens_lazily():
+    opened = []
+
+    async def chunks():
+        for chunk in CHUNKS:
+            yield chunk
+
+    async def open_stream():
+        opened.append(True)
+        return chunks()
+
+    async def consume():
+        stream = AsyncTextStream(open_stream)
+        assert opened == []
+        deltas = [delta async for delta in stream]
+        return deltas, stream
+
+    deltas, stream = asyncio.run(consume())
+    assert deltas == ["Hel", "lo"]
+    assert stream.finish_reason == "stop"
+    assert stream.usage.completion_tokens == 2
+
+@patch("azllm.clients.openai.OpenAI")
+def test_client_stream_text_requests_stream(mock_openai):
+    mock_openai.return_value.chat.completions.create.return_value = iter(CHUNKS)
+    client = OpenAIClient()
+    client.get_api_key = MagicMock(return_value="mock-key")
+
+    stream = client.stream_text("Hello", {'system_message': 'Be brief.'})
+
+    assert stream.text == ""
+    assert "".join(stream) == "Hello"
+    params = mock_openai.return_value.chat.completions.create.call_args.kwargs
+    assert params['stream'] is True
+    assert params['stream_options'] == {"include_usage": True}
+    assert params['messages'][0] == {"role": "system", "content": "Be brief."}
+
+def test_azllm_stream_text_uses_pooled_client():
+    llm = azLLM()
+    client = llm.get_client("openai")
+    client.stream_text = MagicMock(return_value=TextStream(iter(CHUNKS)))
+
+    assert list(llm.stream_text("openai", "Hello")) == ["Hel", "lo"]
+    client.stream_text.assert_called_once_with("Hello", {})
@@ -125,3 +125,132 @@ def test_load_invalid_yaml(temp_dir, capsys):
         assert "Error parsing YAML file" in captured.out or "An error occurred" in captured.out
     finally:
         os.chdir(original_cwd)
+
+
+def test_write_config_file_replaces_atomically(temp_dir):
+    path = Path(temp_dir) / "config.yaml"
+    path.write_text("old: true\n")
+    os.chmod(path, 0o640)
+
+    utils.write_config_file(path, {"openai": {"models": []}})
+
+    assert yaml.safe_load(path.read_text()) == {"openai": {"models": []}}
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert os.listdir(temp_dir) == ["config.yaml"]
+
+
+def test_write_config_file_keeps_original_on_failure(temp_dir, monkeypatch):
+    path = Path(temp_dir) / "config.yaml"
+    path.write_text("old: true\n")
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(utils.os, "replace", fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        utils.write_config_file(path, {"new": True})
+    assert path.read_text() == "old: true\n"
+    assert os.listdir(temp_dir) == ["config.yaml"]
+
+
+def test_yaml_uses_libyaml_when_available():
+    if hasattr(yaml, "CSafeLoader"):
+        assert utils.YAML_LOADER is yaml.CSafeLoader
+        assert utils.YAML_DUMPER is yaml.CSafeDumper
+    else:
+        assert utils.YAML_LOADER is yaml.SafeLoader
+        assert utils.YAML_DUMPER is yaml.SafeDumper
+
+
+def test_schema_prompts_are_memoized_and_compact():
+    from unittest.mock import patch
+    from pydantic import BaseModel
+
+    class Invoice(BaseModel):
+        number: str
+        total: float
+
+    structured = utils.StructuredOutput()
+    with patch.object(Invoice, "model_json_schema", wraps=Invoice.model_json_schema) as schema:
+        first = structured.format_system_message(Invoice, "Extract invoices.")
+        second = structured.format_system_message(Invoice, "Extract invoices.")
+        other = structured.format_system_message(Invoice, "Be precise.", schema_first=True)
+
+    assert schema.call_count == 1
+    assert first == second and first is not second
+    assert '{"properties":{"number"' in first["content"]
+    assert first["content"].startswith("Extract invoices.\n\n")
+    assert other["content"].endswith("\n\nBe precise.")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('Sure! {"a": 1}', {"a": 1}),
+    ('```json\n{"a": "}{", "b": [1, 2]}\n```', {"a": "}{", "b": [1, 2]}),
+    ('[note] {"a": "\\"}"} trailing }', {"a": '"}'}),
+    ('[{"a": 1}, {"a": 2}]', [{"a": 1}, {"a": 2}]),
+    ('According to [1], the answer is {"capital": "Paris"}', {"capital": "Paris"}),
+    ('See [1] and [2].', [1]),
+])
+def test_extract_json(text, expected):
+    assert utils.StructuredOutput().extract_json(text) == expected
+
+
+def test_extract_json_errors():
+    structured = utils.StructuredOutput()
+    with pytest.raises(ValueError, match="No opening brace"):
+        structured.extract_json("no json here")
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        structured.extract_json('{"a": ')
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 100])
+def test_incremental_parser_completes_at_closing_bracket(chunk_size):
+    text = 'Result:\n```json\n{"name": "a \\"quoted\\" }", "items": [1, {"x": "]"}]}\n``` extra'
+    end = text.index('}\n```') + 1
+    parser = utils.IncrementalJSONParser()
+
+    fed = 0
+    for i in range(0, len(text), chunk_size):
+        fed = i + chunk_size
+        if parser.feed(text[i:i + chunk_size]) is not None:
+            break
+
+    assert parser.complete
+    assert parser.value == {"name": 'a "quoted" }', "items": [1, {"x": "]"}]}
+    assert end <= fed < end + chunk_size
+    assert parser.feed("more") == parser.value
+
+
+def test_incremental_parser_rejects_invalid_json():
+    parser = utils.IncrementalJSONParser()
+    assert parser.feed('{"a": 1,') is None
+    assert parser.feed('}') is None
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        parser.close()
+    parser.reset()
+    assert parser.feed('[1, 2]') is None
+    assert parser.close() == [1, 2]
+    parser.reset()
+    with pytest.raises(ValueError, match="No complete JSON value"):
+        parser.close()
+
+
+def test_incremental_parser_prefers_objects_like_extract_json():
+    text = 'According to [1], the answer is {"capital": "Paris"}'
+    parser = utils.IncrementalJSONParser()
+    values = [parser.feed(char) for char in text]
+
+    assert values[-1] == {"capital": "Paris"} == utils.StructuredOutput().extract_json(text)
+    assert not any(values[:-1])
+
+    parser.reset()
+    parser.feed('[{"a": 1}, {"a": 2}] done')
+    assert parser.close() == [{"a": 1}, {"a": 2}]
+
+
+def test_incremental_parser_skips_brackets_in_prose():
+    parser = utils.IncrementalJSONParser()
+    for delta in ('Here is [the JSON]: ', '{"a":', ' 1}'):
+        value = parser.feed(delta)
+
+    assert value == {"a": 1}
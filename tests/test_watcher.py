@@ -0,0 +1,84 @@
+import os
+import time
+import pytest
+import yaml
+
+from azllm import azLLM
+from azllm.watcher import ConfigWatcher, validate_config
+
+
+def write_config(path, temperature, mtime_offset=0):
+    config = {"openai": {"models": [{"model": "gpt-4o", "version": "v1", "parameters": {"temperature": temperature}}]}}
+    path.write_text(yaml.safe_dump(config))
+    # Filesystems with coarse timestamps may not change mtime between quick writes.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "custom_configs").mkdir()
+    write_config(tmp_path / "custom_configs" / "config.yaml", 0.2)
+    return tmp_path / "custom_configs"
+
+
+def test_validate_config_rejects_invalid_files():
+    with pytest.raises(ValueError, match="mapping of clients"):
+        validate_config(None)
+    with pytest.raises(ValueError, match="needs a 'model' name"):
+        validate_config({"openai": {"models": [{"version": "v1"}]}})
+    with pytest.raises(ValueError, match="Unknown retry settings"):
+        validate_config({"openai": {"models": [{"model": "gpt-4o", "retry": {"attempts": 3}}]}})
+
+    assert len(validate_config({"openai": {"models": [{"model": "gpt-4o", "version": "v1"}]}})) == 1
+
+def test_watcher_check_applies_changes_once(config_dir):
+    path = config_dir / "config.yaml"
+    changes = []
+    watcher = ConfigWatcher(path, lambda config, table: changes.append(table))
+
+    assert watcher.check() is False
+
+    write_config(path, 0.9, mtime_offset=1)
+    assert watcher.check() is True
+    assert watcher.check() is False
+    assert changes[0].lookup("openai", "gpt-4o", "v1").config["parameters"]["temperature"] == 0.9
+
+def test_watcher_keeps_previous_config_on_invalid_change(config_dir):
+    path = config_dir / "config.yaml"
+    changes, errors = [], []
+    watcher = ConfigWatcher(path, lambda config, table: changes.append(config), on_error=errors.append)
+
+    path.write_text("openai: [unclosed")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 2_000_000_000))
+
+    assert watcher.check() is False
+    assert changes == []
+    assert len(errors) == 1
+
+def test_azllm_watch_config_swaps_config_in_background(config_dir):
+    llm = azLLM(custom=True)
+    old_client = llm._resolve_client("openai:gpt-4o::v1")
+    assert old_client.temperature == 0.2
+
+    watcher = llm.watch_config(interval=0.01)
+    assert watcher.running
+    assert llm.watch_config() is watcher
+
+    write_config(config_dir / "config.yaml", 0.5, mtime_offset=1)
+    deadline = time.monotonic() + 5
+    while watcher.reloads == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    new_client = llm._resolve_client("openai:gpt-4o::v1")
+    assert new_client.temperature == 0.5
+    assert old_client.temperature == 0.2
+
+    llm.close()
+    assert llm.watcher is None
+    assert not watcher.running
+
+def test_watch_config_requires_custom_mode():
+    with pytest.raises(ValueError, match="requires custom=True"):
+        azLLM().watch_config()